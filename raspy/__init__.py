@@ -19,9 +19,11 @@ __all__ = (
     "bitset",
     "board_revision",
     "disposable",
+    "event_dispatcher",
     "exec_utils",
     "illegal_argument_exception",
     "invalid_operation_exception",
+    "listener_registry",
     "not_implemented_exception",
     "object_disposed_exception",
     "size",
@@ -2,8 +2,8 @@
 
 
 from threading import Timer
-from pyee import EventEmitter
 from raspy import string_utils
+from raspy.listener_registry import ListenerRegistry
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.components.component import Component
 from raspy.components.buttons import button_state
@@ -31,7 +31,7 @@ class Button(Component):
         super(Component, self).__init__()
         self.__holdTimer = None
         self.__baseState = button_state.RELEASED
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
 
     @property
     def is_pressed(self):
@@ -76,7 +76,7 @@ class BuzzerComponent(Buzzer):
         else:
             rng = 600000.0 / freq
             self.__pwmPin.pwm_range = rng
-            self.__pwmPin.pwm = freq / 2.0
+            self.__pwmPin.pwm = rng / 2.0
             self.__isBuzzing = True
 
     def stop(self):
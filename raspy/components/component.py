@@ -12,7 +12,7 @@ class Component(Disposable):
 
         :param dict props: A list of properties.
         """
-        super(Disposable, self).__init__()
+        Disposable.__init__(self)
         self.__componentName = ""
         self.__tag = None
         self.__props = props
@@ -93,7 +93,7 @@ class Component(Disposable):
 
     def dispose(self):
         """Dispose managed resources."""
-        if Disposable.is_disposed.fget():
+        if self.is_disposed:
             return
 
         self.__props = None
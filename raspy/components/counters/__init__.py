@@ -0,0 +1,8 @@
+"""This package contains components that count and time input pulses."""
+
+
+__all__ = (
+    "frequency_counter",
+    "frequency_counter_component",
+    "frequency_measurement_event"
+)
@@ -0,0 +1,154 @@
+"""This module contains the FrequencyCounter interface/base type."""
+
+
+from raspy import event_dispatcher
+from raspy.argument_null_exception import ArgumentNullException
+from raspy.listener_registry import ListenerRegistry
+from raspy.object_disposed_exception import ObjectDisposedException
+from raspy.components.component import Component
+
+
+EVENT_MEASUREMENT_UPDATED = "frequencyMeasurementUpdated"
+"""The name of the measurement updated event."""
+
+
+class FrequencyCounter(Component):
+    """A frequency and pulse width counter abstraction component interface."""
+
+    def __init__(self, pin):
+        """Initialize a new instance of FrequencyCounter.
+
+        :param raspy.io.gpio.Gpio pin: The input pin the signal is on.
+        :raises: ArgumentNullException if 'pin' param is None.
+        """
+        Component.__init__(self)
+        if pin is None:
+            raise ArgumentNullException("'pin' param cannot be None.")
+
+        self.__emitter = ListenerRegistry()
+        self.__pin = pin
+        self.__pin.provision()
+
+    def dispose(self):
+        """Release managed resources used by this component."""
+        if self.is_disposed:
+            return
+
+        if self.__pin is not None:
+            self.__pin.dispose()
+            self.__pin = None
+
+        self.__emitter.remove_all_listeners()
+        self.__emitter = None
+        Component.dispose(self)
+
+    def on(self, evt, callback):
+        """Register an event with a callback to handle it.
+
+        :param str evt: The name of the event to register a handler for.
+        :param function callback: The callback to execute when the event
+        fires.
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance is disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("FrequencyCounter")
+
+        self.__emitter.on(evt, callback)
+
+    def emit(self, evt, args):
+        """Emit the specified event to all registered listeners.
+
+        :param str evt: The name of the event to emit.
+        :param object args: The arguments to pass to the event handlers
+        (listeners).
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance is disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("FrequencyCounter")
+
+        self.__emitter.emit(evt, args)
+
+    def remove_all_listeners(self):
+        """Remove all registered event listeners."""
+        if self.is_disposed:
+            return
+
+        if self.__emitter is not None:
+            self.__emitter.remove_all_listeners()
+
+    def on_measurement_updated(self, measure_evt):
+        """Fire the measurement updated event.
+
+        :param FrequencyMeasurementEvent measure_evt: The measurement event
+        object (raspy.components.counters.frequency_measurement_event).
+        :raises: ObjectDisposedException if this instance has been disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("FrequencyCounter")
+
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_MEASUREMENT_UPDATED, measure_evt)
+
+    @property
+    def pin(self):
+        """Get the input pin the signal is on.
+
+        :returns: The input pin.
+        :rtype: raspy.io.gpio.Gpio
+        """
+        return self.__pin
+
+    @property
+    def frequency(self):
+        """Get the mean frequency of the signal.
+
+        :returns: The frequency in hertz.
+        :rtype: float
+        """
+        return 0.0
+
+    @property
+    def period_ns(self):
+        """Get the mean period of the signal.
+
+        :returns: The period in nanoseconds.
+        :rtype: float
+        """
+        return 0.0
+
+    @property
+    def duty_cycle(self):
+        """Get the mean duty cycle of the signal.
+
+        :returns: The fraction of the period the signal is high.
+        :rtype: float
+        """
+        return 0.0
+
+    @property
+    def high_ns(self):
+        """Get the mean high pulse width.
+
+        :returns: The width in nanoseconds.
+        :rtype: float
+        """
+        return 0.0
+
+    @property
+    def low_ns(self):
+        """Get the mean low pulse width.
+
+        :returns: The width in nanoseconds.
+        :rtype: float
+        """
+        return 0.0
+
+    def start(self):
+        """Start measuring."""
+        pass
+
+    def stop(self):
+        """Stop measuring."""
+        pass
@@ -0,0 +1,382 @@
+"""This module contains the FrequencyCounterComponent type."""
+
+
+import collections
+import threading
+from raspy.illegal_argument_exception import IllegalArgumentException
+from raspy.invalid_operation_exception import InvalidOperationException
+from raspy.object_disposed_exception import ObjectDisposedException
+from raspy.components.counters import frequency_counter
+from raspy.components.counters.frequency_measurement_event import FrequencyMeasurementEvent
+from raspy.io import pin_edge
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.pi_system import core_utils
+
+
+DEFAULT_WINDOW = 64
+"""The default number of periods the rolling figures cover."""
+
+DEFAULT_UPDATE_INTERVAL = 100
+"""The default time between updates in milliseconds."""
+
+DEFAULT_TIMEOUT = 1000
+"""The default time without edges after which the signal counts as stopped,
+in milliseconds."""
+
+
+class _RollingWindow(object):
+    """The most recent values of a measurement with their running sum."""
+
+    def __init__(self, size):
+        """ctor.
+
+        :param int size: The number of values kept.
+        """
+        self.__size = size
+        self.__values = collections.deque()
+        self.__sum = 0
+
+    def add(self, value):
+        """Add a value, dropping the oldest if full."""
+        self.__values.append(value)
+        self.__sum += value
+        if len(self.__values) > self.__size:
+            self.__sum -= self.__values.popleft()
+
+    def clear(self):
+        """Drop all values."""
+        self.__values.clear()
+        self.__sum = 0
+
+    def __len__(self):
+        """Get the number of values kept."""
+        return len(self.__values)
+
+    @property
+    def mean(self):
+        """Get the mean of the values, or 0.0 if there are none."""
+        if len(self.__values) == 0:
+            return 0.0
+
+        return float(self.__sum) / len(self.__values)
+
+    @property
+    def minimum(self):
+        """Get the smallest value, or 0 if there are none."""
+        if len(self.__values) == 0:
+            return 0
+
+        return min(self.__values)
+
+    @property
+    def maximum(self):
+        """Get the largest value, or 0 if there are none."""
+        if len(self.__values) == 0:
+            return 0
+
+        return max(self.__values)
+
+
+class FrequencyCounterComponent(frequency_counter.FrequencyCounter):
+    """A component that measures the frequency and pulse widths of a signal.
+
+    The figures are computed from the timestamps of the transitions the pin
+    records into its edge capture buffer (raspy.io.edge_capture), so no
+    edge is missed between updates as long as the buffer does not overrun.
+    Pins that support interrupts (such as GpioStandard and GpioCharDev) are
+    switched to interrupt mode while measuring, so every edge is observed
+    without polling. Other pins must be read by the application for their
+    transitions to be seen.
+    """
+
+    def __init__(self, pin, window=DEFAULT_WINDOW,
+                 update_interval=DEFAULT_UPDATE_INTERVAL,
+                 timeout=DEFAULT_TIMEOUT):
+        """Initialize a new instance of FrequencyCounterComponent.
+
+        :param raspy.io.gpio.Gpio pin: The input pin the signal is on.
+        :param int window: The number of periods the rolling figures cover.
+        :param int update_interval: The time between updates in
+        milliseconds.
+        :param int timeout: The time without edges after which the signal
+        counts as stopped (and the figures drop to zero), in milliseconds.
+        :raises: raspy.argument_null_exception.ArgumentNullException if pin
+        is None.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        window is less than 1.
+        """
+        frequency_counter.FrequencyCounter.__init__(self, pin)
+        if window is None or window < 1:
+            raise IllegalArgumentException("'window' must be at least 1.")
+
+        self.__lock = threading.Lock()
+        self.__periods = _RollingWindow(window)
+        self.__highs = _RollingWindow(window)
+        self.__lows = _RollingWindow(window)
+        self.__updateInterval = update_interval / 1000.0
+        self.__timeoutNs = timeout * 1000000
+        self.__lastRise = None
+        self.__lastFall = None
+        self.__lastEdge = None
+        self.__edgeCount = 0
+        self.__lost = 0
+        self.__capture = None
+        self.__ownsCapture = False
+        self.__usesInterrupts = False
+        self.__thread = None
+        self.__stopEvent = threading.Event()
+        self.__stopEvent.set()
+
+    @property
+    def is_running(self):
+        """Get whether or not the counter is measuring.
+
+        :returns: True if measuring; Otherwise, False.
+        :rtype: bool
+        """
+        return not self.__stopEvent.is_set()
+
+    @property
+    def frequency(self):
+        """Get the mean frequency of the signal.
+
+        :returns: The frequency in hertz, or 0.0 if no full period has been
+        seen within the timeout.
+        :rtype: float
+        """
+        period = self.period_ns
+        if period <= 0:
+            return 0.0
+
+        return 1000000000.0 / period
+
+    @property
+    def period_ns(self):
+        """Get the mean period of the signal.
+
+        :returns: The period in nanoseconds.
+        :rtype: float
+        """
+        with self.__lock:
+            return self.__periods.mean
+
+    @property
+    def min_period_ns(self):
+        """Get the shortest period in the window.
+
+        :returns: The period in nanoseconds.
+        :rtype: int
+        """
+        with self.__lock:
+            return self.__periods.minimum
+
+    @property
+    def max_period_ns(self):
+        """Get the longest period in the window.
+
+        :returns: The period in nanoseconds.
+        :rtype: int
+        """
+        with self.__lock:
+            return self.__periods.maximum
+
+    @property
+    def duty_cycle(self):
+        """Get the mean duty cycle of the signal.
+
+        :returns: The fraction of the period the signal is high.
+        :rtype: float
+        """
+        with self.__lock:
+            period = self.__highs.mean + self.__lows.mean
+            if self.__highs.mean <= 0 or self.__lows.mean <= 0:
+                return 0.0
+
+            return self.__highs.mean / period
+
+    @property
+    def high_ns(self):
+        """Get the mean high pulse width.
+
+        :returns: The width in nanoseconds.
+        :rtype: float
+        """
+        with self.__lock:
+            return self.__highs.mean
+
+    @property
+    def low_ns(self):
+        """Get the mean low pulse width.
+
+        :returns: The width in nanoseconds.
+        :rtype: float
+        """
+        with self.__lock:
+            return self.__lows.mean
+
+    @property
+    def edge_count(self):
+        """Get the number of edges processed since the counter started.
+
+        :returns: The edge count.
+        :rtype: int
+        """
+        return self.__edgeCount
+
+    @property
+    def lost_edges(self):
+        """Get the number of edges lost to capture buffer overruns.
+
+        :returns: The lost edge count.
+        :rtype: int
+        """
+        return self.__lost
+
+    def __reset_edges(self):
+        """Forget the previous edges so no period spans a gap."""
+        self.__lastRise = None
+        self.__lastFall = None
+
+    def __process(self, timestamp, level):
+        """Add an edge to the rolling figures.
+
+        :param int timestamp: When the edge occurred in nanoseconds.
+        :param int level: The level after the edge.
+        """
+        rise = self.__lastRise
+        fall = self.__lastFall
+        if level == pin_state.HIGH:
+            if rise is not None:
+                self.__periods.add(timestamp - rise)
+
+            # A pulse width only counts if the opposite edge was seen.
+            if fall is not None and (rise is None or fall > rise):
+                self.__lows.add(timestamp - fall)
+
+            self.__lastRise = timestamp
+        else:
+            if rise is not None and (fall is None or rise > fall):
+                self.__highs.add(timestamp - rise)
+
+            self.__lastFall = timestamp
+
+        self.__lastEdge = timestamp
+        self.__edgeCount += 1
+
+    def update(self):
+        """Process the edges captured since the last update.
+
+        This is called periodically while the counter is running, and can
+        be called directly to refresh the figures at once.
+
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("FrequencyCounterComponent")
+
+        capture = self.__capture
+        if capture is None:
+            return
+
+        view = capture.consume()
+        with self.__lock:
+            if view.lost > 0:
+                self.__lost += view.lost
+                self.__reset_edges()
+
+            for timestamp, level in view:
+                self.__process(timestamp, level)
+
+            idle = self.__lastEdge is None
+            if not idle:
+                idle = (core_utils.monotonic_ns() - self.__lastEdge >
+                        self.__timeoutNs)
+
+            if idle:
+                self.__periods.clear()
+                self.__highs.clear()
+                self.__lows.clear()
+                self.__reset_edges()
+
+            samples = len(self.__periods)
+
+        if len(view) > 0 and samples > 0:
+            evt = FrequencyMeasurementEvent(self.frequency, self.period_ns,
+                                            self.duty_cycle, self.high_ns,
+                                            self.low_ns, samples)
+            self.on_measurement_updated(evt)
+
+    def __run(self):
+        """Update the figures until stopped."""
+        while not self.__stopEvent.wait(self.__updateInterval):
+            self.update()
+
+    def start(self):
+        """Start measuring.
+
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.invalid_operation_exception.InvalidOperationException
+        if the pin is not configured as an input.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("FrequencyCounterComponent")
+
+        if self.pin.mode != pin_mode.IN:
+            msg = "The specified pin is not configured as an input pin, which "
+            msg += "is required to measure a signal."
+            raise InvalidOperationException(msg)
+
+        if self.is_running:
+            return
+
+        self.__capture = self.pin.capture
+        self.__ownsCapture = self.__capture is None
+        if self.__ownsCapture:
+            self.__capture = self.pin.enable_capture()
+
+        self.__capture.consume()
+        self.__usesInterrupts = False
+        if hasattr(self.pin, "enable_interrupts"):
+            if not self.pin.interrupts_enabled:
+                self.pin.enable_interrupts(pin_edge.BOTH)
+                self.__usesInterrupts = True
+
+        self.__stopEvent.clear()
+        self.__thread = threading.Thread(target=self.__run)
+        self.__thread.name = "FrequencyCounterUpdateThread"
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        """Stop measuring.
+
+        The figures keep their last values.
+        """
+        if not self.is_running:
+            return
+
+        self.__stopEvent.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+        if self.__usesInterrupts:
+            self.pin.disable_interrupts()
+            self.__usesInterrupts = False
+
+        if self.__ownsCapture:
+            self.pin.disable_capture()
+            self.__ownsCapture = False
+
+        self.__capture = None
+
+    def dispose(self):
+        """Release managed resources used by this component."""
+        if self.is_disposed:
+            return
+
+        self.stop()
+        frequency_counter.FrequencyCounter.dispose(self)
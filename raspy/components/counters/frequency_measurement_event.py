@@ -0,0 +1,78 @@
+"""This module contains the FrequencyMeasurementEvent type."""
+
+
+class FrequencyMeasurementEvent(object):
+    """The event that fires when a frequency counter updates its figures."""
+
+    def __init__(self, frequency, period_ns, duty_cycle, high_ns, low_ns,
+                 samples):
+        """Initialize a new instance of FrequencyMeasurementEvent.
+
+        :param float frequency: The mean frequency in hertz.
+        :param float period_ns: The mean period in nanoseconds.
+        :param float duty_cycle: The mean fraction of the period the input
+        was high (0.0 to 1.0).
+        :param float high_ns: The mean high pulse width in nanoseconds.
+        :param float low_ns: The mean low pulse width in nanoseconds.
+        :param int samples: The number of periods the figures cover.
+        """
+        self.__frequency = frequency
+        self.__periodNs = period_ns
+        self.__dutyCycle = duty_cycle
+        self.__highNs = high_ns
+        self.__lowNs = low_ns
+        self.__samples = samples
+
+    @property
+    def frequency(self):
+        """Get the mean frequency.
+
+        :returns: The frequency in hertz.
+        :rtype: float
+        """
+        return self.__frequency
+
+    @property
+    def period_ns(self):
+        """Get the mean period.
+
+        :returns: The period in nanoseconds.
+        :rtype: float
+        """
+        return self.__periodNs
+
+    @property
+    def duty_cycle(self):
+        """Get the mean duty cycle.
+
+        :returns: The fraction of the period the input was high.
+        :rtype: float
+        """
+        return self.__dutyCycle
+
+    @property
+    def high_ns(self):
+        """Get the mean high pulse width.
+
+        :returns: The width in nanoseconds.
+        :rtype: float
+        """
+        return self.__highNs
+
+    @property
+    def low_ns(self):
+        """Get the mean low pulse width.
+
+        :returns: The width in nanoseconds.
+        :rtype: float
+        """
+        return self.__lowNs
+
+    @property
+    def samples(self):
+        """Get the number of periods the figures cover.
+
+        :returns: The sample count.
+        :rtype: int
+        """
+        return self.__samples
@@ -0,0 +1,9 @@
+"""This package contains components for working with rotary encoders."""
+
+
+__all__ = (
+    "encoder_direction",
+    "encoder_position_change_event",
+    "rotary_encoder",
+    "rotary_encoder_component"
+)
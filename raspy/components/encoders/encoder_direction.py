@@ -0,0 +1,11 @@
+"""The rotary encoder directions."""
+
+
+NONE = 0
+"""The encoder is not turning."""
+
+CLOCKWISE = 1
+"""The encoder is turning clockwise (A leads B)."""
+
+COUNTERCLOCKWISE = -1
+"""The encoder is turning counterclockwise (B leads A)."""
@@ -0,0 +1,48 @@
+"""This module contains the EncoderPositionChangeEvent type."""
+
+
+from raspy.components.encoders import encoder_direction
+
+
+class EncoderPositionChangeEvent(object):
+    """The event that gets raised when an encoder position changes."""
+
+    def __init__(self, old_position, new_position, direction):
+        """Initialize a new instance of EncoderPositionChangeEvent.
+
+        :param int old_position: The position before the change.
+        :param int new_position: The position after the change.
+        :param int direction: The direction of the last movement.
+        """
+        self.__oldPosition = old_position
+        self.__newPosition = new_position
+        self.__direction = direction
+        if self.__direction is None:
+            self.__direction = encoder_direction.NONE
+
+    @property
+    def old_position(self):
+        """Get the position before the change.
+
+        :returns: The previous position in counts.
+        :rtype: int
+        """
+        return self.__oldPosition
+
+    @property
+    def new_position(self):
+        """Get the position after the change.
+
+        :returns: The current position in counts.
+        :rtype: int
+        """
+        return self.__newPosition
+
+    @property
+    def direction(self):
+        """Get the direction of the last movement.
+
+        :returns: The direction (an encoder_direction value).
+        :rtype: int
+        """
+        return self.__direction
@@ -0,0 +1,159 @@
+"""This module contains the RotaryEncoder interface/base type."""
+
+
+from raspy import event_dispatcher
+from raspy.argument_null_exception import ArgumentNullException
+from raspy.listener_registry import ListenerRegistry
+from raspy.object_disposed_exception import ObjectDisposedException
+from raspy.components.component import Component
+from raspy.components.encoders import encoder_direction
+
+
+EVENT_POSITION_CHANGED = "encoderPositionChanged"
+"""The name of the position changed event."""
+
+
+class RotaryEncoder(Component):
+    """A quadrature rotary encoder abstraction component interface."""
+
+    def __init__(self, pin_a, pin_b):
+        """Initialize a new instance of RotaryEncoder.
+
+        :param raspy.io.gpio.Gpio pin_a: The input pin of channel A.
+        :param raspy.io.gpio.Gpio pin_b: The input pin of channel B.
+        :raises: ArgumentNullException if either pin is None.
+        """
+        Component.__init__(self)
+        if pin_a is None or pin_b is None:
+            raise ArgumentNullException("Encoder pins cannot be None.")
+
+        self.__emitter = ListenerRegistry()
+        self.__pinA = pin_a
+        self.__pinB = pin_b
+        self.__pinA.provision()
+        self.__pinB.provision()
+
+    def dispose(self):
+        """Release managed resources used by this component."""
+        if self.is_disposed:
+            return
+
+        for pin in (self.__pinA, self.__pinB):
+            if pin is not None:
+                pin.dispose()
+
+        self.__pinA = None
+        self.__pinB = None
+        self.__emitter.remove_all_listeners()
+        self.__emitter = None
+        Component.dispose(self)
+
+    def on(self, evt, callback):
+        """Register an event with a callback to handle it.
+
+        :param str evt: The name of the event to register a handler for.
+        :param function callback: The callback to execute when the event
+        fires.
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance is disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("RotaryEncoder")
+
+        self.__emitter.on(evt, callback)
+
+    def emit(self, evt, args):
+        """Emit the specified event to all registered listeners.
+
+        :param str evt: The name of the event to emit.
+        :param object args: The arguments to pass to the event handlers
+        (listeners).
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance is disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("RotaryEncoder")
+
+        self.__emitter.emit(evt, args)
+
+    def remove_all_listeners(self):
+        """Remove all registered event listeners."""
+        if self.is_disposed:
+            return
+
+        if self.__emitter is not None:
+            self.__emitter.remove_all_listeners()
+
+    def on_position_change(self, change_evt):
+        """Fire the position changed event.
+
+        :param EncoderPositionChangeEvent change_evt: The position change
+        event object (raspy.components.encoders.encoder_position_change_event).
+        :raises: ObjectDisposedException if this instance has been disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("RotaryEncoder")
+
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_POSITION_CHANGED, change_evt)
+
+    @property
+    def pin_a(self):
+        """Get the input pin of channel A.
+
+        :returns: The channel A pin.
+        :rtype: raspy.io.gpio.Gpio
+        """
+        return self.__pinA
+
+    @property
+    def pin_b(self):
+        """Get the input pin of channel B.
+
+        :returns: The channel B pin.
+        :rtype: raspy.io.gpio.Gpio
+        """
+        return self.__pinB
+
+    @property
+    def position(self):
+        """Get the position.
+
+        :returns: The position in quadrature counts.
+        :rtype: int
+        """
+        return 0
+
+    @property
+    def direction(self):
+        """Get the direction of the last movement.
+
+        :returns: The direction (an encoder_direction value).
+        :rtype: int
+        """
+        return encoder_direction.NONE
+
+    @property
+    def velocity(self):
+        """Get the speed of rotation.
+
+        :returns: The velocity in counts per second, negative when turning
+        counterclockwise.
+        :rtype: float
+        """
+        return 0.0
+
+    def reset(self, position=0):
+        """Set the position.
+
+        :param int position: The new position in counts.
+        """
+        pass
+
+    def start(self):
+        """Start tracking the encoder."""
+        pass
+
+    def stop(self):
+        """Stop tracking the encoder."""
+        pass
@@ -0,0 +1,358 @@
+"""This module contains the RotaryEncoderComponent type."""
+
+
+import collections
+import threading
+from raspy.invalid_operation_exception import InvalidOperationException
+from raspy.object_disposed_exception import ObjectDisposedException
+from raspy.components.encoders import encoder_direction
+from raspy.components.encoders import rotary_encoder
+from raspy.components.encoders.encoder_position_change_event import EncoderPositionChangeEvent
+from raspy.io import pin_edge
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.pi_system import core_utils
+
+
+INVALID = None
+"""Marks a transition where both channels changed at once."""
+
+TRANSITIONS = (
+    0, -1, 1, INVALID,
+    1, 0, INVALID, -1,
+    -1, INVALID, 0, 1,
+    INVALID, 1, -1, 0
+)
+"""The position change for each (old AB << 2 | new AB) transition.
+
+Clockwise rotation (A leads B) runs through AB = 00, 10, 11, 01.
+"""
+
+DEFAULT_COUNTS_PER_DETENT = 4
+"""The quadrature counts between detents of a typical encoder."""
+
+DEFAULT_UPDATE_INTERVAL = 10
+"""The default time between updates in milliseconds."""
+
+DEFAULT_VELOCITY_WINDOW = 100
+"""The default time the velocity is averaged over in milliseconds."""
+
+
+class RotaryEncoderComponent(rotary_encoder.RotaryEncoder):
+    """A component that decodes a quadrature rotary encoder.
+
+    The A and B transitions are taken from the edge capture buffers of the
+    two pins (raspy.io.edge_capture) and decoded in timestamp order, so
+    bursts of thousands of transitions per second are not lost between
+    updates. Pins that support interrupts are switched to interrupt mode
+    while tracking; other pins must be read by the application for their
+    transitions to be seen.
+    """
+
+    def __init__(self, pin_a, pin_b,
+                 counts_per_detent=DEFAULT_COUNTS_PER_DETENT,
+                 update_interval=DEFAULT_UPDATE_INTERVAL,
+                 velocity_window=DEFAULT_VELOCITY_WINDOW):
+        """Initialize a new instance of RotaryEncoderComponent.
+
+        :param raspy.io.gpio.Gpio pin_a: The input pin of channel A.
+        :param raspy.io.gpio.Gpio pin_b: The input pin of channel B.
+        :param int counts_per_detent: The quadrature counts per detent.
+        :param int update_interval: The time between updates in
+        milliseconds.
+        :param int velocity_window: The time the velocity is averaged over in
+        milliseconds.
+        :raises: raspy.argument_null_exception.ArgumentNullException if
+        either pin is None.
+        """
+        rotary_encoder.RotaryEncoder.__init__(self, pin_a, pin_b)
+        if counts_per_detent is None or counts_per_detent < 1:
+            counts_per_detent = DEFAULT_COUNTS_PER_DETENT
+
+        self.__countsPerDetent = counts_per_detent
+        self.__updateInterval = update_interval / 1000.0
+        self.__velocityWindow = velocity_window * 1000000
+        self.__lock = threading.Lock()
+        self.__state = 0
+        self.__position = 0
+        self.__direction = encoder_direction.NONE
+        self.__invalid = 0
+        self.__lost = 0
+        self.__history = collections.deque()
+        self.__captures = None
+        self.__ownsCaptures = None
+        self.__interruptPins = []
+        self.__thread = None
+        self.__stopEvent = threading.Event()
+        self.__stopEvent.set()
+
+    @property
+    def is_running(self):
+        """Get whether or not the encoder is being tracked.
+
+        :returns: True if tracking; Otherwise, False.
+        :rtype: bool
+        """
+        return not self.__stopEvent.is_set()
+
+    @property
+    def position(self):
+        """Get the position.
+
+        :returns: The position in quadrature counts.
+        :rtype: int
+        """
+        return self.__position
+
+    @property
+    def detents(self):
+        """Get the position in detents.
+
+        :returns: The number of whole detents from zero.
+        :rtype: int
+        """
+        position = self.__position
+        if position < 0:
+            return -(-position // self.__countsPerDetent)
+
+        return position // self.__countsPerDetent
+
+    @property
+    def direction(self):
+        """Get the direction of the last movement.
+
+        :returns: The direction (an encoder_direction value).
+        :rtype: int
+        """
+        return self.__direction
+
+    @property
+    def velocity(self):
+        """Get the speed of rotation over the velocity window.
+
+        :returns: The velocity in counts per second, negative when turning
+        counterclockwise.
+        :rtype: float
+        """
+        with self.__lock:
+            self.__trim_history(core_utils.monotonic_ns())
+            if len(self.__history) == 0:
+                return 0.0
+
+            # Don't let a single fresh step read as a huge speed.
+            first_time, first_pos = self.__history[0]
+            now = core_utils.monotonic_ns()
+            elapsed = max(now - first_time, self.__velocityWindow // 2)
+            delta = self.__position - first_pos
+            return delta * 1000000000.0 / elapsed
+
+    @property
+    def invalid_transitions(self):
+        """Get the number of transitions that could not be decoded.
+
+        These are AB states where both channels changed at once, and edges
+        to the level a channel already had. Both mean edges were missed;
+        neither changes the position.
+
+        :returns: The invalid transition count.
+        :rtype: int
+        """
+        return self.__invalid
+
+    @property
+    def lost_edges(self):
+        """Get the number of edges lost to capture buffer overruns.
+
+        :returns: The lost edge count.
+        :rtype: int
+        """
+        return self.__lost
+
+    def __trim_history(self, now):
+        """Drop position samples older than the velocity window.
+
+        :param int now: The current time in nanoseconds.
+        """
+        horizon = now - self.__velocityWindow
+        while len(self.__history) > 0 and self.__history[0][0] < horizon:
+            self.__history.popleft()
+
+    def reset(self, position=0):
+        """Set the position.
+
+        :param int position: The new position in counts.
+        """
+        with self.__lock:
+            self.__position = position
+            self.__history.clear()
+
+    def decode(self, state):
+        """Apply a new AB state to the position.
+
+        :param int state: The channel levels, A in bit 1 and B in bit 0.
+        :returns: The position change (-1, 0 or 1), or INVALID if both
+        channels changed, in which case the position is left unchanged.
+        :rtype: int
+        """
+        state &= 0x03
+        delta = TRANSITIONS[(self.__state << 2) | state]
+        self.__state = state
+        if delta is INVALID:
+            self.__invalid += 1
+        elif delta != 0:
+            self.__position += delta
+            if delta > 0:
+                self.__direction = encoder_direction.CLOCKWISE
+            else:
+                self.__direction = encoder_direction.COUNTERCLOCKWISE
+
+        return delta
+
+    def __decode_edge(self, channel, level):
+        """Apply an edge on one channel to the position.
+
+        :param int channel: 0 for channel A, 1 for channel B.
+        :param int level: The level of the channel after the edge.
+        """
+        bit = 0x01 if channel else 0x02
+        state = self.__state & ~bit
+        if level == pin_state.HIGH:
+            state |= bit
+
+        if state == self.__state:
+            # An edge to the level the channel already had means the
+            # opposite edge in between was missed.
+            self.__invalid += 1
+            return
+
+        self.decode(state)
+
+    def update(self):
+        """Decode the transitions captured since the last update.
+
+        This is called periodically while the encoder is tracked, and can
+        be called directly to bring the position up to date at once.
+
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("RotaryEncoderComponent")
+
+        captures = self.__captures
+        if captures is None:
+            return
+
+        edges = []
+        for channel, capture in enumerate(captures):
+            view = capture.consume()
+            self.__lost += view.lost
+            for timestamp, level in view:
+                edges.append((timestamp, channel, level))
+
+        if len(edges) == 0:
+            return
+
+        edges.sort()
+        with self.__lock:
+            old_position = self.__position
+            for _timestamp, channel, level in edges:
+                self.__decode_edge(channel, level)
+
+            new_position = self.__position
+            if new_position != old_position:
+                now = core_utils.monotonic_ns()
+                self.__trim_history(now)
+                if len(self.__history) == 0:
+                    self.__history.append((edges[0][0], old_position))
+
+                self.__history.append((now, new_position))
+
+        if new_position != old_position:
+            evt = EncoderPositionChangeEvent(old_position, new_position,
+                                             self.__direction)
+            self.on_position_change(evt)
+
+    def __run(self):
+        """Decode transitions until stopped."""
+        while not self.__stopEvent.wait(self.__updateInterval):
+            self.update()
+
+    def start(self):
+        """Start tracking the encoder.
+
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.invalid_operation_exception.InvalidOperationException
+        if either pin is not configured as an input.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("RotaryEncoderComponent")
+
+        pins = (self.pin_a, self.pin_b)
+        for pin in pins:
+            if pin.mode != pin_mode.IN:
+                msg = "The specified pins are not configured as input pins, "
+                msg += "which is required to read the encoder."
+                raise InvalidOperationException(msg)
+
+        if self.is_running:
+            return
+
+        self.__state = 0
+        if self.pin_a.read() == pin_state.HIGH:
+            self.__state |= 0x02
+
+        if self.pin_b.read() == pin_state.HIGH:
+            self.__state |= 0x01
+
+        self.__ownsCaptures = [pin.capture is None for pin in pins]
+        self.__captures = [pin.capture or pin.enable_capture()
+                           for pin in pins]
+        for capture in self.__captures:
+            capture.consume()
+
+        self.__interruptPins = []
+        for pin in pins:
+            if hasattr(pin, "enable_interrupts"):
+                if not pin.interrupts_enabled:
+                    pin.enable_interrupts(pin_edge.BOTH)
+                    self.__interruptPins.append(pin)
+
+        self.__stopEvent.clear()
+        self.__thread = threading.Thread(target=self.__run)
+        self.__thread.name = "RotaryEncoderUpdateThread"
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        """Stop tracking the encoder.
+
+        The position is kept.
+        """
+        if not self.is_running:
+            return
+
+        self.__stopEvent.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+        for pin in self.__interruptPins:
+            pin.disable_interrupts()
+
+        self.__interruptPins = []
+        for owns, pin in zip(self.__ownsCaptures, (self.pin_a, self.pin_b)):
+            if owns:
+                pin.disable_capture()
+
+        self.__captures = None
+        self.__ownsCaptures = None
+
+    def dispose(self):
+        """Release managed resources used by this component."""
+        if self.is_disposed:
+            return
+
+        self.stop()
+        rotary_encoder.RotaryEncoder.dispose(self)
@@ -1,7 +1,7 @@
 """This module contains the DimmableLight base type."""
 
 
-import threading
+from raspy import event_dispatcher
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.components.lights import light
 
@@ -22,11 +22,8 @@ class DimmableLight(light.Light):
         if self.is_disposed:
             raise ObjectDisposedException("DimmableLight")
 
-        _t = threading.Thread(target=self.emit,
-                              name="levelChangeThread",
-                              args=(light.EVENT_LEVEL_CHANGED, lce))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit,
+                                  light.EVENT_LEVEL_CHANGED, lce)
 
     @property
     def level(self):
@@ -1,8 +1,8 @@
 """This module contains the base type for lights."""
 
 
-import threading
-from pyee import EventEmitter
+from raspy import event_dispatcher
+from raspy.listener_registry import ListenerRegistry
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.components.component import Component
 
@@ -20,7 +20,7 @@ class Light(Component):
     def __init__(self):
         """Initialize a new instance of Light."""
         Component.__init__(self)
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
 
     def on(self, evt, callback):
         """Register an event with a callback to handle it.
@@ -101,11 +101,7 @@ class Light(Component):
         if self.is_disposed:
             raise ObjectDisposedException("Light")
 
-        _t = threading.Thread(target=self.emit,
-                              name="stateChange",
-                              args=(EVENT_STATE_CHANGED, evt))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit, EVENT_STATE_CHANGED, evt)
 
     def dispose(self):
         """Dispose managed resources."""
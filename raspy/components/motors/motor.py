@@ -2,7 +2,8 @@
 
 
 import threading
-from pyee import EventEmitter
+from raspy import event_dispatcher
+from raspy.listener_registry import ListenerRegistry
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.components.component import Component
 from raspy.components.motors import motor_state
@@ -28,7 +29,7 @@ class Motor(Component):
     def __init__(self):
         """Initialize a new instance of Motor."""
         Component.__init__(self)
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
         self.__state = motor_state.STOP
 
     def dispose(self):
@@ -99,11 +100,7 @@ class Motor(Component):
         if self.is_disposed:
             raise ObjectDisposedException("Motor")
 
-        _t = threading.Thread(target=self._fire_events,
-                              name="motorStateChange",
-                              args=[change_evt])
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self._fire_events, change_evt)
 
     @property
     def state(self):
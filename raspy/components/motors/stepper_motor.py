@@ -1,7 +1,7 @@
 """This module contains the StepperMotor type."""
 
 
-import threading
+from raspy import event_dispatcher
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.components.motors import motor_state
 from raspy.components.motors.motor import Motor
@@ -48,11 +48,8 @@ class StepperMotor(Motor):
         if self.is_disposed:
             raise ObjectDisposedException("StepperMotor")
 
-        _t = threading.Thread(target=self.emit,
-                              name="stepperMotorRotation",
-                              args=(EVENT_ROTATION_STARTED, rotate_evt))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_ROTATION_STARTED, rotate_evt)
 
     def on_rotation_stopped(self):
         """Fire the rotation stopped event.
@@ -63,11 +60,8 @@ class StepperMotor(Motor):
         if self.is_disposed:
             raise ObjectDisposedException("StepperMotor")
 
-        _t = threading.Thread(target=self.emit,
-                              name="stepperMotorStop",
-                              args=(EVENT_ROTATION_STOPPED, None))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_ROTATION_STOPPED, None)
 
     @property
     def steps_per_revolution(self):
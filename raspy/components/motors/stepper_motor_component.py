@@ -8,7 +8,7 @@ from raspy.components.motors import motor_state
 from raspy.components.motors.motor_rotate_event import MotorRotateEvent
 from raspy.components.motors.motor_state_change_event import MotorStateChangeEvent
 from raspy.components.motors.stepper_motor import StepperMotor
-from raspy.io import pin_state
+from raspy.io.gpio_bank import GpioBank
 from raspy.pi_system import core_utils
 
 
@@ -30,13 +30,14 @@ class StepperMotorComponent(StepperMotor):
             raise ArgumentNullException(msg)
 
         self.__sequenceIndex = 0
+        self.__nextStepNs = None
         self.__controlThread = None
         self.__stopEvent = threading.Event()
         self.__lock = threading.Lock()
         self.__stopEvent.set()
         self.__pins = pins
-        for _p in self.__pins:
-            _p.provision()
+        self.__bank = GpioBank(self.__pins)
+        self.__bank.provision()
 
     def _kill_control_thread(self):
         """Stop the continuous movement thread."""
@@ -63,18 +64,21 @@ class StepperMotorComponent(StepperMotor):
         elif self.__sequenceIndex < 0:
             self.__sequenceIndex = len(seq) - 1
 
-        # Start cycling through GPIO pins to move the motor forward or reverse.
-        for i in range(0, len(self.__pins) - 1):
-            nib = pow(2, i)
-            if (seq[self.__sequenceIndex] & int(nib)) > 0:
-                self.__pins[i].write(pin_state.HIGH)
-            else:
-                self.__pins[i].write(pin_state.LOW)
+        # Drive all coils for this step of the sequence at once.
+        self.__bank.write(int(seq[self.__sequenceIndex]))
 
-        millis = self.step_interval_millis
-        nanos = self.step_interval_nanos
-        micros = (millis + (nanos * 1000000)) * 1000
-        core_utils.sleep_microseconds(micros)
+        # Schedule steps against deadlines so the interval doesn't drift.
+        # After an idle period the schedule restarts from now.
+        interval = self.step_interval_millis * 1000000
+        interval += self.step_interval_nanos
+        now = core_utils.monotonic_ns()
+        deadline = self.__nextStepNs
+        if deadline is None or now - deadline > interval:
+            deadline = now
+
+        deadline += interval
+        self.__nextStepNs = deadline
+        core_utils.sleep_until_ns(deadline)
 
     def _async_exec_movement(self):
         """Helper method for executing or ending movement."""
@@ -83,15 +87,13 @@ class StepperMotorComponent(StepperMotor):
             self._do_step(self.state == motor_state.FORWARD)
 
         # Turn all GPIO pins off.
-        for _p in self.__pins:
-            _p.write(pin_state.LOW)
+        self.__bank.write(0)
 
     def _execute_movement(self):
         """Asynchronously executes or ends movement based on motor state."""
         with self.__lock:
             if self.state == motor_state.STOP:
-                for _p in self.__pins:
-                    _p.write(pin_state.LOW)
+                self.__bank.write(0)
                 return
 
         self.__stopEvent.clear()
@@ -129,8 +131,7 @@ class StepperMotorComponent(StepperMotor):
 
     def stop(self):
         """Stop the motor's movement."""
-        for _p in self.__pins:
-            _p.write(pin_state.LOW)
+        self.__bank.write(0)
         StepperMotor.stop(self)
 
     def step(self, steps):
@@ -176,9 +177,12 @@ class StepperMotorComponent(StepperMotor):
         if self.__lock.locked():
             self.__lock.release()
         self.__lock = None
+        if self.__bank is not None:
+            self.__bank.write(0)
+            self.__bank.dispose()
+            self.__bank = None
         if self.__pins is not None and len(self.__pins) > 0:
             for _p in self.__pins:
-                _p.write(pin_state.LOW)
                 _p.dispose()
         self.__pins = None
         StepperMotor.dispose(self)
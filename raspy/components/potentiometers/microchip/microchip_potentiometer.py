@@ -1,10 +1,10 @@
 """This module contains the MicrochipPotentiometer base type."""
 
 
-from pyee import EventEmitter
 from raspy.argument_null_exception import ArgumentNullException
 from raspy.illegal_argument_exception import IllegalArgumentException
 from raspy.invalid_operation_exception import InvalidOperationException
+from raspy.listener_registry import ListenerRegistry
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.components.potentiometers.potentiometer import Potentiometer
 from raspy.components.potentiometers.microchip import device_control_channel
@@ -78,7 +78,7 @@ class MicrochipPotentiometer(Potentiometer):
             msg = "Specified channel not supported by device."
             raise IllegalArgumentException(msg)
 
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
         self.__channel = channel
         self.__currentValue = 0
         self.__nonVolMode = non_vol_mode
@@ -1,8 +1,8 @@
 """This module contains the PowerInterface type."""
 
 
-import threading
-from pyee import EventEmitter
+from raspy import event_dispatcher
+from raspy.listener_registry import ListenerRegistry
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.components.component import Component
 from raspy.components.power import power_state
@@ -18,7 +18,7 @@ class PowerInterface(Component):
     def __init__(self):
         """Initialize a new instance of PowerInterface."""
         Component.__init__(self)
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
         self.__state = power_state.OFF
 
     def dispose(self):
@@ -75,11 +75,8 @@ class PowerInterface(Component):
         if self.is_disposed:
             raise ObjectDisposedException("PowerInterface")
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_STATE_CHANGED,
-                              args=(EVENT_STATE_CHANGED, event_info))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_STATE_CHANGED, event_info)
 
     @property
     def state(self):
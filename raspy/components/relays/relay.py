@@ -1,9 +1,9 @@
 """This module contains the Relay base type."""
 
 
-import threading
-from pyee import EventEmitter
+from raspy import event_dispatcher
 from raspy.argument_null_exception import ArgumentNullException
+from raspy.listener_registry import ListenerRegistry
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.components.component import Component
 from raspy.components.relays import relay_state
@@ -43,7 +43,7 @@ class Relay(Component):
         if pin is None:
             raise ArgumentNullException("'pin' param cannot be None.")
 
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
         self.__state = relay_state.OPEN
         self.__pin = pin
         self.__pin.provision()
@@ -108,11 +108,8 @@ class Relay(Component):
         if self.is_disposed:
             raise ObjectDisposedException("Relay")
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_STATE_CHANGED,
-                              args=(EVENT_STATE_CHANGED, change_evt))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_STATE_CHANGED, change_evt)
 
     def on_pulse_start(self):
         """Fire the pulse start event.
@@ -122,11 +119,7 @@ class Relay(Component):
         if self.is_disposed:
             raise ObjectDisposedException("Relay")
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_PULSE_START,
-                              args=[EVENT_PULSE_START])
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit, EVENT_PULSE_START)
 
     def on_pulse_stop(self):
         """Fire the pulse stop event.
@@ -136,11 +129,7 @@ class Relay(Component):
         if self.is_disposed:
             raise ObjectDisposedException("Relay")
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_PULSE_STOP,
-                              args=[EVENT_PULSE_STOP])
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit, EVENT_PULSE_STOP)
 
     @property
     def state(self):
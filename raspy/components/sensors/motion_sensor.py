@@ -1,10 +1,10 @@
 """This module contains the MotionSensor type."""
 
 
-import threading
 from datetime import datetime
-from pyee import EventEmitter
+from raspy import event_dispatcher
 from raspy.argument_null_exception import ArgumentNullException
+from raspy.listener_registry import ListenerRegistry
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.components.component import Component
 
@@ -26,7 +26,7 @@ class MotionSensor(Component):
         if pin is None:
             raise ArgumentNullException("'pin' param cannot be None.")
 
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
         self.__lastMotion = None
         self.__lastInactive = None
         self.__pin = pin
@@ -98,11 +98,8 @@ class MotionSensor(Component):
         else:
             self.__lastInactive = datetime.now()
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_MOTION_STATE_CHANGED,
-                              args=(EVENT_MOTION_STATE_CHANGED, motion_evt))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_MOTION_STATE_CHANGED, motion_evt)
 
     @property
     def last_motion_timestamp(self):
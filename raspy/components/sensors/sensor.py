@@ -1,9 +1,9 @@
 """This module contains the Sensor interface/base type."""
 
 
-import threading
-from pyee import EventEmitter
+from raspy import event_dispatcher
 from raspy.argument_null_exception import ArgumentNullException
+from raspy.listener_registry import ListenerRegistry
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.components.component import Component
 from raspy.components.sensors import sensor_state
@@ -26,7 +26,7 @@ class Sensor(Component):
         if pin is None:
             raise ArgumentNullException("'pin' param cannot be None.")
 
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
         self.__state = sensor_state.OPEN
         self.__pin = pin
         self.__pin.provision()
@@ -91,11 +91,8 @@ class Sensor(Component):
         if self.is_disposed:
             raise ObjectDisposedException("Sensor")
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_STATE_CHANGED,
-                              args=(EVENT_STATE_CHANGED, change_evt))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_STATE_CHANGED, change_evt)
 
     @property
     def state(self):
@@ -1,8 +1,8 @@
 """This module contains the Switch type."""
 
 
-import threading
-from pyee import EventEmitter
+from raspy import event_dispatcher
+from raspy.listener_registry import ListenerRegistry
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.components.component import Component
 from raspy.components.switches import switch_state
@@ -18,7 +18,7 @@ class Switch(Component):
     def __init__(self):
         """Initialize a new instance of Switch."""
         Component.__init__(self)
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
         self.__state = switch_state.OFF
 
     def dispose(self):
@@ -77,11 +77,7 @@ class Switch(Component):
         if self.is_disposed:
             raise ObjectDisposedException("Switch")
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_STATE_CHANGED,
-                              args=(EVENT_STATE_CHANGED, evt))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit, EVENT_STATE_CHANGED, evt)
 
     @property
     def state(self):
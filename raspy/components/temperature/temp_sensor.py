@@ -1,9 +1,9 @@
 """This module contains the TempSensor type."""
 
 
-import threading
-from pyee import EventEmitter
+from raspy import event_dispatcher
 from raspy.argument_null_exception import ArgumentNullException
+from raspy.listener_registry import ListenerRegistry
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.components.component import Component
 from raspy.components.temperature import temp_scale
@@ -36,7 +36,7 @@ class TemperatureSensor(Component):
         if reset is None:
             raise ArgumentNullException("'reset' cannot be None.")
 
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
         self.__rawTemp = 0.0
         self.__scale = temp_scale.CELCIUS
         self.__tempSensor = DS1620(clock, data, reset)
@@ -133,11 +133,8 @@ class TemperatureSensor(Component):
         if self.is_disposed:
             raise ObjectDisposedException("TempSensor")
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_TEMPERATURE_CHANGED,
-                              args=(EVENT_TEMPERATURE_CHANGED, change_evt))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_TEMPERATURE_CHANGED, change_evt)
 
     def get_temperature(self, scale):
         """Get the temperature value.
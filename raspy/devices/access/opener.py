@@ -1,8 +1,8 @@
 """This module contains the Opener type."""
 
 
-import threading
-from pyee import EventEmitter
+from raspy import event_dispatcher
+from raspy.listener_registry import ListenerRegistry
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.devices.device import Device
 from raspy.devices.access import opener_state
@@ -21,7 +21,7 @@ class Opener(Device):
     def __init__(self):
         """Initialize a new instance of Opener."""
         Device.__init__(self)
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
         self.__state = opener_state.CLOSED
 
     def on(self, evt, callback):
@@ -68,11 +68,8 @@ class Opener(Device):
         if self.is_disposed:
             raise ObjectDisposedException("Opener")
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_STATE_CHANGED,
-                              args=(EVENT_STATE_CHANGED, change_evt))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_STATE_CHANGED, change_evt)
 
     def on_lock_state_change(self, change_evt):
         """Fire the lock state change event.
@@ -84,11 +81,8 @@ class Opener(Device):
         if self.is_disposed:
             raise ObjectDisposedException("Opener")
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_LOCK_STATE_CHANGED,
-                              args=(EVENT_LOCK_STATE_CHANGED, change_evt))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_LOCK_STATE_CHANGED, change_evt)
 
     @property
     def state(self):
@@ -3,8 +3,9 @@
 
 import datetime
 import threading
-from pyee import EventEmitter
+from raspy import event_dispatcher
 from raspy.invalid_operation_exception import InvalidOperationException
+from raspy.listener_registry import ListenerRegistry
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.devices.device import Device
 from raspy.devices.fireplaces import fireplace_state
@@ -28,7 +29,7 @@ class Fireplace(Device):
     def __init__(self):
         """Initialize a new instance of Fireplace."""
         Device.__init__(self)
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
         self.__timeoutDelay = 0
         self.__timeoutDelayMillis = 0
         self.__timeoutUnit = time_unit.MINUTES
@@ -98,11 +99,7 @@ class Fireplace(Device):
         if self.is_disposed:
             raise ObjectDisposedException("Fireplace")
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_STATE_CHANGED,
-                              args=(EVENT_STATE_CHANGED, evt))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit, EVENT_STATE_CHANGED, evt)
 
     def on_operation_timeout(self, evt):
         """Fire the operation timeout event.
@@ -113,11 +110,8 @@ class Fireplace(Device):
         if self.is_disposed:
             raise ObjectDisposedException("Fireplace")
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_OPERATION_TIMEOUT,
-                              args=(EVENT_OPERATION_TIMEOUT, evt))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_OPERATION_TIMEOUT, evt)
 
     def on_pilot_light_state_change(self, evt):
         """Fire the pilot light state change event.
@@ -128,11 +122,8 @@ class Fireplace(Device):
         if self.is_disposed:
             raise ObjectDisposedException("Fireplace")
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_PILOT_LIGHT_STATE_CHANGED,
-                              args=(EVENT_PILOT_LIGHT_STATE_CHANGED, evt))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_PILOT_LIGHT_STATE_CHANGED, evt)
 
     @property
     def state(self):
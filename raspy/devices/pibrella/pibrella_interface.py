@@ -7,7 +7,7 @@ from raspy.devices.pibrella import pibrella_output
 from raspy.components.buttons.button_component import ButtonComponent
 from raspy.components.buzzers.buzzer_component import BuzzerComponent
 from raspy.components.lights.led_component import LedComponent
-from raspy.io import pin_state
+from raspy.io.gpio_bank import GpioBank
 
 
 class PiBrellaInterface(Device):
@@ -47,8 +47,8 @@ class PiBrellaInterface(Device):
         self.__outputs[4].pin_name = "RED LED"
         self.__outputs[5].pin_name = "YELLOW LED"
         self.__outputs[6].pin_name = "GREEN LED"
-        for out in self.__outputs:
-            out.provision()
+        self.__outputBank = GpioBank(self.__outputs)
+        self.__outputBank.provision()
 
         self.__leds = [
             LedComponent(self.__outputs[4]),
@@ -66,9 +66,9 @@ class PiBrellaInterface(Device):
         if self.is_disposed:
             return
 
-        for out in self.__outputs:
-            out.write(pin_state.LOW)
-
+        self.__outputBank.write(0)
+        self.__outputBank.dispose()
+        self.__outputBank = None
         self.__inputs = None
         self.__outputs = None
         self.__leds = None
@@ -213,6 +213,18 @@ class PiBrellaInterface(Device):
         """
         return self.__outputs[3]
 
+    @property
+    def output_bank(self):
+        """Get all the PiBrella outputs as a bank.
+
+        Bit 0 to 6 drive outputs E, F, G, H and the red, yellow and green
+        LEDs, in the same order as the outputs list.
+
+        :returns: The output bank.
+        :rtype: raspy.io.gpio_bank.GpioBank
+        """
+        return self.__outputBank
+
     @property
     def outputs(self):
         """Get all the PiBrella outputs.
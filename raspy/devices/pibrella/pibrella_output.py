@@ -28,5 +28,5 @@ LED_YELLOW = GpioStandard(gpio_pins.Gpio00(), pin_mode.OUT, pin_state.LOW)
 LED_GREEN = GpioStandard(gpio_pins.Gpio07(), pin_mode.OUT, pin_state.LOW)
 """PiBrella green LED."""
 
-BUZZER = GpioStandard(gpio_pins.Gpio01(), pin_mode.PWM, pin_state.LOW)
+BUZZER = GpioStandard(gpio_pins.Gpio18(), pin_mode.PWM, pin_state.LOW)
 """PiBrella buzzer."""
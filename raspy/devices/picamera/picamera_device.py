@@ -4,8 +4,9 @@
 import sys
 import threading
 from Queue import Queue, Empty
-from pyee import EventEmitter
 from subprocess import Popen, PIPE
+from raspy import event_dispatcher
+from raspy.listener_registry import ListenerRegistry
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.devices.device import Device
 from raspy.devices.picamera.events import CaptureDoneEvent
@@ -42,7 +43,7 @@ class PiCameraDevice(Device):
         """
         Device.__init__(self)
         self.__settings = settings
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
         self.__isRunning = False
         self.__processID = -1
         self.__exitCode = -1
@@ -138,11 +139,8 @@ class PiCameraDevice(Device):
         if self.is_disposed:
             raise ObjectDisposedException("PiCameraDevice")
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_CAPTURE_START,
-                              args=(EVENT_CAPTURE_START, start_evt))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_CAPTURE_START, start_evt)
 
     def on_capture_output_received(self, out_evt):
         """Fire the capture output event.
@@ -153,11 +151,8 @@ class PiCameraDevice(Device):
         if self.is_disposed:
             raise ObjectDisposedException("PiCameraDevice")
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_CAPTURE_OUTPUT,
-                              args=(EVENT_CAPTURE_OUTPUT, out_evt))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_CAPTURE_OUTPUT, out_evt)
 
     def on_capture_done(self, done_evt):
         """Fire the capture done event.
@@ -168,11 +163,8 @@ class PiCameraDevice(Device):
         if self.is_disposed:
             raise ObjectDisposedException("PiCameraDevice")
 
-        _t = threading.Thread(target=self.emit,
-                              name=EVENT_CAPTURE_DONE,
-                              args=(EVENT_CAPTURE_DONE, done_evt))
-        _t.daemon = True
-        _t.start()
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_CAPTURE_DONE, done_evt)
 
     def cancel(self):
         """Cancel the still capture process, if running.
@@ -0,0 +1,287 @@
+"""A shared dispatcher that runs event handlers on a bounded worker pool.
+
+Emitting each event on a thread of its own costs a thread per event under
+bursty input and lets events from the same object reach handlers out of
+order. Instead, every emit in the framework goes through dispatch(), which
+queues the call behind any earlier calls from the same source object. A
+source is handled by one worker at a time, so its events run in the order
+they were raised, while different sources run in parallel on up to
+max_workers threads.
+"""
+
+
+import collections
+import threading
+import traceback
+from raspy.disposable import Disposable
+from raspy.illegal_argument_exception import IllegalArgumentException
+from raspy.object_disposed_exception import ObjectDisposedException
+from raspy.pi_system import core_utils
+
+
+DEFAULT_MAX_WORKERS = 4
+"""The default number of worker threads."""
+
+
+class EventDispatcher(Disposable):
+    """Runs queued calls on a bounded pool, in order per source."""
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS):
+        """Initialize a new instance of raspy.event_dispatcher.EventDispatcher.
+
+        Workers are started on demand, up to max_workers, and then wait for
+        work until the dispatcher is disposed. They wait without a timeout
+        because a timed Condition.wait() polls on Python 2.
+
+        :param int max_workers: The maximum number of worker threads.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        max_workers is less than 1.
+        """
+        Disposable.__init__(self)
+        if max_workers is None or max_workers < 1:
+            raise IllegalArgumentException("max_workers must be at least 1.")
+
+        self.__maxWorkers = max_workers
+        self.__lock = threading.Lock()
+        self.__work = threading.Condition(self.__lock)
+        self.__done = threading.Condition(self.__lock)
+        self.__queues = {}
+        self.__ready = collections.deque()
+        self.__workers = 0
+        self.__idle = 0
+        self.__busy = 0
+        self.__depth = 0
+        self.__stats = None
+        self.reset_stats()
+
+    @property
+    def max_workers(self):
+        """Get the maximum number of worker threads.
+
+        :returns: The maximum number of workers.
+        :rtype: int
+        """
+        return self.__maxWorkers
+
+    @property
+    def queue_depth(self):
+        """Get the number of calls waiting to run.
+
+        :returns: The number of queued calls.
+        :rtype: int
+        """
+        return self.__depth
+
+    def submit(self, source, func, *args):
+        """Queue a call behind any earlier calls from the same source.
+
+        :param object source: The object raising the event. Calls from the
+        same source run one at a time in submission order.
+        :param callable func: The function to call.
+        :param args: The arguments to pass to func.
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("EventDispatcher")
+
+        entry = (func, args, core_utils.monotonic_ns())
+        with self.__lock:
+            key = id(source)
+            queue = self.__queues.get(key)
+            if queue is None:
+                # The source holds its own place in the ready queue and
+                # keeps the object alive while calls are pending.
+                queue = collections.deque()
+                self.__queues[key] = queue
+                self.__ready.append((key, source))
+
+            queue.append(entry)
+            self.__depth += 1
+            stats = self.__stats
+            stats["submitted"] += 1
+            stats["max_queue_depth"] = max(stats["max_queue_depth"],
+                                           self.__depth)
+            if self.__idle > 0:
+                self.__idle -= 1
+                self.__work.notify()
+            elif self.__workers < self.__maxWorkers:
+                self.__workers += 1
+                worker = threading.Thread(target=self.__run,
+                                          name="eventDispatcher")
+                worker.daemon = True
+                worker.start()
+
+    def __run(self):
+        """Take sources off the ready queue and run their next call."""
+        lock = self.__lock
+        lock.acquire()
+        try:
+            while True:
+                while not self.__ready:
+                    if self.is_disposed:
+                        self.__workers -= 1
+                        return
+
+                    self.__idle += 1
+                    self.__work.wait()
+
+                key, source = self.__ready.popleft()
+                func, args, queued_ns = self.__queues[key].popleft()
+                self.__depth -= 1
+                self.__busy += 1
+                lock.release()
+                start_ns = core_utils.monotonic_ns()
+                failed = False
+                try:
+                    func(*args)
+                except Exception:
+                    failed = True
+                    traceback.print_exc()
+
+                end_ns = core_utils.monotonic_ns()
+                lock.acquire()
+                self.__busy -= 1
+                self.__record(start_ns - queued_ns, end_ns - start_ns, failed)
+                if self.__queues[key]:
+                    # Go to the back so one busy source cannot starve others.
+                    self.__ready.append((key, source))
+                else:
+                    del self.__queues[key]
+
+                if not self.__queues and self.__busy == 0:
+                    self.__done.notify_all()
+        finally:
+            lock.release()
+
+    def __record(self, wait_ns, handler_ns, failed):
+        """Record the timing of a completed call. Called with the lock held.
+
+        :param int wait_ns: How long the call waited in the queue.
+        :param int handler_ns: How long the call ran.
+        :param bool failed: True if the call raised an exception.
+        """
+        stats = self.__stats
+        stats["dispatched"] += 1
+        if failed:
+            stats["errors"] += 1
+
+        stats["total_wait_ns"] += wait_ns
+        stats["max_wait_ns"] = max(stats["max_wait_ns"], wait_ns)
+        stats["total_handler_ns"] += handler_ns
+        stats["max_handler_ns"] = max(stats["max_handler_ns"], handler_ns)
+
+    def wait_idle(self, timeout=None):
+        """Wait until every queued call has run.
+
+        :param float timeout: The maximum time to wait in seconds, or None
+        to wait indefinitely.
+        :returns: True if the dispatcher is idle; False if the wait timed out.
+        :rtype: bool
+        """
+        deadline = None
+        if timeout is not None:
+            deadline = core_utils.monotonic_ns() + int(timeout * 1000000000)
+
+        with self.__lock:
+            while self.__queues or self.__busy > 0:
+                remaining = None
+                if deadline is not None:
+                    remaining = (deadline - core_utils.monotonic_ns()) / 1e9
+                    if remaining <= 0:
+                        return False
+
+                self.__done.wait(remaining)
+
+        return True
+
+    def get_stats(self):
+        """Get the dispatch counters and latencies.
+
+        :returns: A dictionary with the submitted, dispatched and errors
+        counts, the current and maximum queue depth, the number of workers,
+        and the total, maximum and mean queue wait and handler times in
+        nanoseconds.
+        :rtype: dict
+        """
+        with self.__lock:
+            stats = dict(self.__stats)
+            stats["queue_depth"] = self.__depth
+            stats["workers"] = self.__workers
+
+        count = stats["dispatched"]
+        stats["mean_wait_ns"] = 0
+        stats["mean_handler_ns"] = 0
+        if count > 0:
+            stats["mean_wait_ns"] = stats["total_wait_ns"] // count
+            stats["mean_handler_ns"] = stats["total_handler_ns"] // count
+
+        return stats
+
+    def reset_stats(self):
+        """Reset the dispatch counters and latencies."""
+        with self.__lock:
+            self.__stats = {
+                "submitted": 0,
+                "dispatched": 0,
+                "errors": 0,
+                "max_queue_depth": self.__depth,
+                "total_wait_ns": 0,
+                "max_wait_ns": 0,
+                "total_handler_ns": 0,
+                "max_handler_ns": 0
+            }
+
+    def dispose(self):
+        """Stop accepting calls.
+
+        Calls already queued still run, then the workers exit.
+        """
+        if self.is_disposed:
+            return
+
+        Disposable.dispose(self)
+        with self.__lock:
+            self.__idle = 0
+            self.__work.notify_all()
+
+
+_dispatcher = None
+_dispatcherLock = threading.Lock()
+
+
+def get_dispatcher():
+    """Get the shared dispatcher, creating it on first use.
+
+    :returns: The shared dispatcher.
+    :rtype: EventDispatcher
+    """
+    global _dispatcher
+    with _dispatcherLock:
+        if _dispatcher is None or _dispatcher.is_disposed:
+            _dispatcher = EventDispatcher()
+
+        return _dispatcher
+
+
+def set_dispatcher(dispatcher):
+    """Replace the shared dispatcher.
+
+    The previous dispatcher is not disposed.
+
+    :param EventDispatcher dispatcher: The dispatcher to use, or None to
+    create a default one on next use.
+    """
+    global _dispatcher
+    with _dispatcherLock:
+        _dispatcher = dispatcher
+
+
+def dispatch(source, func, *args):
+    """Queue a call on the shared dispatcher.
+
+    :param object source: The object raising the event.
+    :param callable func: The function to call, usually source.emit.
+    :param args: The arguments to pass to func.
+    """
+    get_dispatcher().submit(source, func, *args)
@@ -7,9 +7,18 @@ is the core namespace of raspy.
 
 
 __all__ = (
+    "async_gpio",
+    "debounce",
+    "edge_capture",
     "file_info",
     "gpio",
+    "gpio_bank",
+    "gpio_chardev",
+    "gpio_chip",
+    "gpio_export_registry",
+    "gpio_mem",
     "gpio_pins",
+    "gpio_simulator",
     "gpio_standard",
     "invalid_pin_mode_exception",
     "io_exception",
@@ -18,15 +27,21 @@ __all__ = (
     "pi_face_pin_factory",
     "pi_face_pins",
     "pin",
+    "pin_edge",
     "pin_mode",
     "pin_poll_fail_event",
     "pin_pull_resistance",
     "pin_state",
     "pin_state_change_event",
+    "pin_stats",
     "pin_utils",
     "pwm_channel",
     "pwm_clock_divider",
+    "pwm_mem",
     "pwm_mode",
+    "pwm_sysfs",
     "raspi_gpio",
-    "unrecognized_pin_found_event"
+    "soft_pwm",
+    "unrecognized_pin_found_event",
+    "waveform"
 )
@@ -0,0 +1,355 @@
+"""An asynchronous facade over raspy.io.gpio.Gpio pins.
+
+AsyncGpio wraps a pin for use from a Tornado IOLoop. Reads, writes and
+pulses return futures and are run on a small executor shared by all pins,
+so the loop is never blocked by a slow backend. Edges are delivered to the
+loop as they arrive: pins backed by the GPIO character device have their
+kernel event queue watched by the loop itself, so no thread is spent per
+pin; other pins fall back to their own interrupt mode or to the state
+change events they already raise.
+
+On Python 3 with Tornado 5 or later the returned futures are asyncio
+futures, so they can be awaited from asyncio code and events() can be used
+with "async for". On Python 2 they are yielded from tornado.gen coroutines.
+"""
+
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from tornado.concurrent import Future
+from tornado.ioloop import IOLoop
+from tornado.queues import Queue, QueueFull
+from raspy.argument_null_exception import ArgumentNullException
+from raspy.disposable import Disposable
+from raspy.object_disposed_exception import ObjectDisposedException
+from raspy.io import gpio
+from raspy.io import pin_edge
+from raspy.io import pin_mode
+from raspy.io import pin_state
+
+
+DEFAULT_MAX_WORKERS = 4
+"""The default number of threads blocking pin operations are run on."""
+
+_executor = None
+_executorLock = threading.Lock()
+
+
+def get_executor():
+    """Get the executor blocking pin operations are run on.
+
+    The executor is created on first use with DEFAULT_MAX_WORKERS threads.
+
+    :returns: The shared executor.
+    :rtype: concurrent.futures.Executor
+    """
+    global _executor
+    with _executorLock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS)
+
+        return _executor
+
+
+def set_executor(executor):
+    """Set the executor blocking pin operations are run on.
+
+    Only affects AsyncGpio instances created afterwards.
+
+    :param concurrent.futures.Executor executor: The executor to use, or
+    None to create the default one on next use.
+    """
+    global _executor
+    with _executorLock:
+        _executor = executor
+
+
+def _matches(edge, psce):
+    """Check whether a state change is the specified edge.
+
+    :param int edge: The edge (a raspy.io.pin_edge value).
+    :param raspy.io.pin_state_change_event.PinStateChangeEvent psce: The
+    state change.
+    :returns: True if the change matches the edge; Otherwise, False.
+    :rtype: bool
+    """
+    if edge == pin_edge.RISING:
+        return psce.new_state == pin_state.HIGH
+
+    if edge == pin_edge.FALLING:
+        return psce.new_state == pin_state.LOW
+
+    return edge == pin_edge.BOTH
+
+
+class AsyncGpio(Disposable):
+    """Awaitable reads, writes and edge waits on a GPIO pin."""
+
+    def __init__(self, pin, io_loop=None, executor=None):
+        """Initialize a new instance of raspy.io.async_gpio.AsyncGpio.
+
+        The pin is not disposed along with this instance.
+
+        :param raspy.io.gpio.Gpio pin: The pin to wrap.
+        :param tornado.ioloop.IOLoop io_loop: The loop futures are resolved
+        on. Defaults to the current loop.
+        :param concurrent.futures.Executor executor: The executor blocking
+        operations are run on. Defaults to get_executor().
+        :raises: raspy.argument_null_exception.ArgumentNullException if pin
+        is None.
+        """
+        Disposable.__init__(self)
+        if pin is None:
+            raise ArgumentNullException("pin cannot be None.")
+
+        if io_loop is None:
+            io_loop = IOLoop.current()
+
+        if executor is None:
+            executor = get_executor()
+
+        self.__pin = pin
+        self.__loop = io_loop
+        self.__executor = executor
+        self.__waiters = []
+        self.__queues = []
+        self.__edgeFd = None
+        self.__ownsInterrupts = False
+        self.__dropped = 0
+        self.__pin.on(gpio.EVENT_GPIO_STATE_CHANGED, self.__on_state_change)
+
+    @property
+    def pin(self):
+        """Get the wrapped pin.
+
+        :returns: The pin.
+        :rtype: raspy.io.gpio.Gpio
+        """
+        return self.__pin
+
+    @property
+    def is_watching(self):
+        """Get whether or not edges are being watched.
+
+        :returns: True if edges are watched; Otherwise, False.
+        :rtype: bool
+        """
+        return self.__edgeFd is not None or self.__ownsInterrupts
+
+    @property
+    def dropped_events(self):
+        """Get the number of events dropped because a queue was full.
+
+        :returns: The dropped event count.
+        :rtype: int
+        """
+        return self.__dropped
+
+    def __run(self, func, *args):
+        """Run a blocking pin operation on the executor.
+
+        :param function func: The operation.
+        :returns: A future resolved with the result of the operation.
+        :rtype: tornado.concurrent.Future
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("AsyncGpio")
+
+        return self.__loop.run_in_executor(self.__executor, func, *args)
+
+    def read(self):
+        """Read a value from the pin.
+
+        :returns: A future resolved with the state of the pin.
+        :rtype: tornado.concurrent.Future
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        return self.__run(self.__pin.read)
+
+    def write(self, ps):
+        """Write a value to the pin.
+
+        :param int ps: The pin state value to write to the pin.
+        :returns: A future resolved when the write completes.
+        :rtype: tornado.concurrent.Future
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        return self.__run(self.__pin.write, ps)
+
+    def pulse(self, millis):
+        """Pulse the pin output for the specified number of milliseconds.
+
+        :param int millis: The number of milliseconds to wait between
+        states.
+        :returns: A future resolved when the pulse completes.
+        :rtype: tornado.concurrent.Future
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        return self.__run(self.__pin.pulse, millis)
+
+    def start(self):
+        """Start watching the pin for edges.
+
+        Pins that expose an edge event descriptor are watched by the loop.
+        Pins with an interrupt mode of their own have it enabled if it is
+        not already. Any other pin is only seen to change when it raises
+        state change events itself. Output pins raise an event for each
+        change written to them and are not watched. This is called by
+        wait_for_edge() and events() as needed.
+
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("AsyncGpio")
+
+        pin = self.__pin
+        if self.is_watching or pin.mode != pin_mode.IN:
+            return
+
+        if hasattr(pin, "edge_fd") and hasattr(pin, "edge"):
+            if pin.edge == pin_edge.NONE:
+                pin.edge = pin_edge.BOTH
+
+            fd = pin.edge_fd
+            if fd is not None:
+                self.__loop.add_handler(fd, self.__on_readable, IOLoop.READ)
+                self.__edgeFd = fd
+                return
+
+        if hasattr(pin, "enable_interrupts") and not pin.interrupts_enabled:
+            pin.enable_interrupts(pin_edge.BOTH)
+            self.__ownsInterrupts = True
+
+    def stop(self):
+        """Stop watching the pin for edges started by start()."""
+        if self.__edgeFd is not None:
+            self.__loop.remove_handler(self.__edgeFd)
+            self.__edgeFd = None
+
+        if self.__ownsInterrupts:
+            self.__pin.disable_interrupts()
+            self.__ownsInterrupts = False
+
+    def __on_readable(self, fd, events):
+        """Read the pending kernel edge event.
+
+        This is the handler the loop calls when the edge descriptor is
+        readable. The pin raises the state change event for it.
+
+        :param int fd: The edge event descriptor.
+        :param int events: The ready events.
+        """
+        self.__pin.wait_for_edge(0)
+
+    def __on_state_change(self, psce):
+        """Hand a state change from the pin over to the loop.
+
+        :param raspy.io.pin_state_change_event.PinStateChangeEvent psce: The
+        event object.
+        """
+        if not self.is_disposed:
+            self.__loop.add_callback(self.__deliver, psce)
+
+    def __deliver(self, psce):
+        """Resolve the edge waiters and feed the queues a state change.
+
+        Runs on the loop.
+
+        :param raspy.io.pin_state_change_event.PinStateChangeEvent psce: The
+        event object.
+        """
+        waiters = self.__waiters
+        self.__waiters = []
+        for edge, future in waiters:
+            if future.done():
+                continue
+
+            if _matches(edge, psce):
+                future.set_result(psce)
+            else:
+                self.__waiters.append((edge, future))
+
+        for queue in self.__queues:
+            try:
+                queue.put_nowait(psce)
+            except QueueFull:
+                self.__dropped += 1
+
+    def wait_for_edge(self, edge=pin_edge.BOTH, timeout=None):
+        """Wait for the specified edge on the pin.
+
+        :param int edge: The edge to wait for (a raspy.io.pin_edge value
+        other than NONE). Default is BOTH.
+        :param int timeout: The maximum number of milliseconds to wait. If
+        None or negative, waits indefinitely.
+        :returns: A future resolved with the state change event, or with
+        None if the wait timed out.
+        :rtype: tornado.concurrent.Future
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        self.start()
+        future = Future()
+        self.__waiters.append((edge, future))
+        if timeout is not None and timeout >= 0:
+            def expire():
+                if not future.done():
+                    future.set_result(None)
+
+            self.__loop.call_later(timeout / 1000.0, expire)
+
+        return future
+
+    def events(self, maxsize=0):
+        """Get a queue of the state change events of the pin.
+
+        Events are dropped (and counted by dropped_events) rather than
+        blocking the loop when a bounded queue is full.
+
+        :param int maxsize: The maximum number of queued events. If zero,
+        the queue is unbounded.
+        :returns: The queue. Use "yield queue.get()" or "async for".
+        :rtype: tornado.queues.Queue
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        self.start()
+        queue = Queue(maxsize)
+        self.__queues.append(queue)
+        return queue
+
+    def close_events(self, queue):
+        """Stop feeding a queue returned by events().
+
+        :param tornado.queues.Queue queue: The queue.
+        """
+        if queue in self.__queues:
+            self.__queues.remove(queue)
+
+    def dispose(self):
+        """Stop watching the pin and release pending waiters.
+
+        Waiters still pending are resolved with None.
+        """
+        if self.is_disposed:
+            return
+
+        self.stop()
+        if not self.__pin.is_disposed:
+            self.__pin.remove_listener(gpio.EVENT_GPIO_STATE_CHANGED,
+                                       self.__on_state_change)
+
+        for _edge, future in self.__waiters:
+            if not future.done():
+                future.set_result(None)
+
+        self.__waiters = []
+        self.__queues = []
+        self.__pin = None
+        Disposable.dispose(self)
@@ -0,0 +1,206 @@
+"""Debounce and glitch filtering of pin state change events.
+
+A DebounceFilter sits between the raw state changes a pin observes and the
+state change events it raises. A change is only reported once the new level
+has held for the hold time; a level that reverts sooner is a glitch (or
+contact bounce) and is suppressed without raising anything. Decisions are
+made from the timestamps of the raw changes, so a burst of bounces costs a
+few comparisons rather than an event and a thread each.
+
+A change that is never followed by another raw change still has to be
+reported when its hold time is up. All filters in the process share one
+scheduler thread for that, which sleeps until the earliest pending
+deadline; there are no per-event timers.
+"""
+
+
+import heapq
+import itertools
+import threading
+from raspy.io.pin_state_change_event import PinStateChangeEvent
+from raspy.pi_system import core_utils
+
+
+class _Scheduler(object):
+    """Wakes filters when the hold time of a pending change is up."""
+
+    def __init__(self):
+        """ctor."""
+        self.__cond = threading.Condition()
+        self.__queue = []
+        self.__seq = itertools.count()
+        self.__thread = None
+
+    def schedule(self, deadline, flt, generation):
+        """Check a filter at the specified deadline.
+
+        :param int deadline: The deadline in nanoseconds of
+        core_utils.monotonic_ns().
+        :param DebounceFilter flt: The filter to check.
+        :param int generation: The filter generation the check is for.
+        """
+        with self.__cond:
+            entry = (deadline, next(self.__seq), flt, generation)
+            heapq.heappush(self.__queue, entry)
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run,
+                                                 name="debounce")
+                self.__thread.daemon = True
+                self.__thread.start()
+
+            if self.__queue[0] is entry:
+                self.__cond.notify()
+
+    def __run(self):
+        """Check filters as their deadlines come due."""
+        while True:
+            with self.__cond:
+                if len(self.__queue) == 0:
+                    self.__cond.wait()
+                    continue
+
+                deadline = self.__queue[0][0]
+                now = core_utils.monotonic_ns()
+                if deadline > now:
+                    self.__cond.wait((deadline - now) / 1000000000.0)
+                    continue
+
+                _deadline, _seq, flt, generation = heapq.heappop(self.__queue)
+
+            flt._expire(generation)
+
+
+_scheduler = _Scheduler()
+
+
+class DebounceFilter(object):
+    """Suppresses pin changes that don't last."""
+
+    def __init__(self, callback, glitch_us=0, stable_ms=0):
+        """Initialize a new instance of raspy.io.debounce.DebounceFilter.
+
+        :param function callback: Receives each accepted change as a
+        raspy.io.pin_state_change_event.PinStateChangeEvent, timestamped
+        with when the change first occurred.
+        :param int glitch_us: Pulses shorter than this many microseconds are
+        suppressed.
+        :param int stable_ms: A new level must hold for this many
+        milliseconds before it is reported.
+        """
+        self.__callback = callback
+        self.__holdNs = max(int(glitch_us * 1000), int(stable_ms * 1000000),
+                            0)
+        self.__lock = threading.Lock()
+        self.__reported = None
+        self.__pending = None
+        self.__generation = 0
+        self.__accepted = 0
+        self.__suppressed = 0
+
+    @property
+    def hold_ns(self):
+        """Get how long a new level must hold before it is reported.
+
+        :returns: The hold time in nanoseconds.
+        :rtype: int
+        """
+        return self.__holdNs
+
+    @property
+    def accepted(self):
+        """Get the number of changes reported.
+
+        :returns: The accepted change count.
+        :rtype: int
+        """
+        return self.__accepted
+
+    @property
+    def suppressed(self):
+        """Get the number of changes that reverted within the hold time.
+
+        :returns: The suppressed change count.
+        :rtype: int
+        """
+        return self.__suppressed
+
+    @property
+    def is_pending(self):
+        """Get whether or not a change is waiting out its hold time.
+
+        :returns: True if a change is pending; Otherwise, False.
+        :rtype: bool
+        """
+        return self.__pending is not None
+
+    def process(self, psce):
+        """Feed a raw state change into the filter.
+
+        :param raspy.io.pin_state_change_event.PinStateChangeEvent psce: The
+        raw change.
+        """
+        accept = None
+        with self.__lock:
+            if self.__reported is None:
+                self.__reported = psce.old_state
+
+            pending = self.__pending
+            if pending is not None:
+                # Report a pending change whose hold time passed before
+                # this change arrived, ahead of the scheduler.
+                if psce.timestamp_ns - pending.timestamp_ns >= self.__holdNs:
+                    accept = self.__accept()
+                    pending = None
+
+            if psce.new_state == self.__reported:
+                if pending is not None:
+                    self.__pending = None
+                    self.__generation += 1
+                    self.__suppressed += 1
+            elif pending is None or pending.new_state != psce.new_state:
+                self.__pending = PinStateChangeEvent(self.__reported,
+                                                     psce.new_state,
+                                                     psce.pin_address,
+                                                     psce.timestamp_ns)
+                self.__generation += 1
+                generation = self.__generation
+                deadline = psce.timestamp_ns + self.__holdNs
+                _scheduler.schedule(deadline, self, generation)
+
+        if accept is not None:
+            self.__callback(accept)
+
+    def __accept(self):
+        """Report the pending change. The lock must be held.
+
+        :returns: The accepted change.
+        :rtype: raspy.io.pin_state_change_event.PinStateChangeEvent
+        """
+        result = self.__pending
+        self.__reported = result.new_state
+        self.__pending = None
+        self.__generation += 1
+        self.__accepted += 1
+        return result
+
+    def _expire(self, generation):
+        """Report the pending change if it is still the one scheduled.
+
+        Called by the scheduler thread.
+
+        :param int generation: The generation the check was scheduled for.
+        """
+        with self.__lock:
+            if generation != self.__generation or self.__pending is None:
+                return
+
+            accept = self.__accept()
+
+        self.__callback(accept)
+
+    def reset(self):
+        """Drop any pending change and forget the reported level."""
+        with self.__lock:
+            self.__reported = None
+            self.__pending = None
+            self.__generation += 1
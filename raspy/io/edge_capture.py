@@ -0,0 +1,239 @@
+"""Timestamped capture of pin transitions.
+
+An EdgeCapture is a preallocated ring buffer of (monotonic_ns, level) pairs
+held in two ctypes arrays. Every transition a pin observes is recorded
+without allocating, and the memory used is fixed by the capacity. Readers
+take an EdgeCaptureView of a range of the buffer, which refers to the
+arrays directly rather than copying them. The view's ranges() can be handed
+to bulk analysis code (for example numpy.ctypeslib.as_array()).
+
+Entries are numbered by a sequence number that increases forever. Once the
+writer has wrapped around past an entry, it is gone, and views report how
+many entries they missed.
+"""
+
+
+import ctypes
+import threading
+from raspy.illegal_argument_exception import IllegalArgumentException
+
+
+DEFAULT_CAPACITY = 4096
+"""The default number of transitions kept."""
+
+
+class EdgeCaptureView(object):
+    """A range of captured transitions."""
+
+    def __init__(self, capture, start, end, lost):
+        """Initialize a new instance of raspy.io.edge_capture.EdgeCaptureView.
+
+        :param EdgeCapture capture: The capture buffer.
+        :param int start: The sequence number of the first entry.
+        :param int end: The sequence number after the last entry.
+        :param int lost: The number of requested entries that had already
+        been overwritten.
+        """
+        self.__capture = capture
+        self.__start = start
+        self.__end = end
+        self.__lost = lost
+
+    @property
+    def start(self):
+        """Get the sequence number of the first entry.
+
+        :returns: The first sequence number.
+        :rtype: int
+        """
+        return self.__start
+
+    @property
+    def end(self):
+        """Get the sequence number following the last entry.
+
+        :returns: The end sequence number.
+        :rtype: int
+        """
+        return self.__end
+
+    @property
+    def lost(self):
+        """Get the number of entries overwritten before the view was taken.
+
+        :returns: The number of lost transitions.
+        :rtype: int
+        """
+        return self.__lost
+
+    @property
+    def is_valid(self):
+        """Get whether or not the entries are still in the buffer.
+
+        The writer keeps running after a view is taken and will eventually
+        overwrite it. Check this after processing a view to be sure that
+        what was read was not overwritten in the meantime.
+
+        :returns: True if no entry of the view has been overwritten;
+        Otherwise, False.
+        :rtype: bool
+        """
+        return self.__start >= self.__capture.total - self.__capture.capacity
+
+    def __len__(self):
+        """Get the number of entries."""
+        return self.__end - self.__start
+
+    def __getitem__(self, index):
+        """Get an entry.
+
+        :param int index: The index within the view.
+        :returns: A (timestamp_ns, level) tuple.
+        :rtype: tuple
+        """
+        if index < 0:
+            index += len(self)
+
+        if index < 0 or index >= len(self):
+            raise IndexError("EdgeCaptureView index out of range.")
+
+        slot = (self.__start + index) % self.__capture.capacity
+        return (self.__capture.times[slot], self.__capture.levels[slot])
+
+    def __iter__(self):
+        """Iterate over the entries as (timestamp_ns, level) tuples."""
+        times = self.__capture.times
+        levels = self.__capture.levels
+        for offset, count in self.ranges():
+            for slot in range(offset, offset + count):
+                yield (times[slot], levels[slot])
+
+    def ranges(self):
+        """Get the contiguous array ranges making up the view.
+
+        :returns: A list of up to two (offset, count) tuples indexing the
+        times and levels arrays of the capture, oldest first.
+        :rtype: list
+        """
+        capacity = self.__capture.capacity
+        count = len(self)
+        if count == 0:
+            return []
+
+        offset = self.__start % capacity
+        first = min(count, capacity - offset)
+        result = [(offset, first)]
+        if first < count:
+            result.append((0, count - first))
+
+        return result
+
+
+class EdgeCapture(object):
+    """A ring buffer of timestamped pin transitions."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """Initialize a new instance of raspy.io.edge_capture.EdgeCapture.
+
+        :param int capacity: The number of transitions kept.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        the capacity is less than 1.
+        """
+        if capacity is None or capacity < 1:
+            raise IllegalArgumentException("'capacity' must be at least 1.")
+
+        self.__capacity = int(capacity)
+        self.__times = (ctypes.c_uint64 * self.__capacity)()
+        self.__levels = (ctypes.c_uint8 * self.__capacity)()
+        self.__total = 0
+        self.__readPos = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def capacity(self):
+        """Get the number of transitions kept.
+
+        :returns: The capacity.
+        :rtype: int
+        """
+        return self.__capacity
+
+    @property
+    def times(self):
+        """Get the timestamp array.
+
+        :returns: The monotonic timestamps in nanoseconds, indexed by slot.
+        :rtype: ctypes.Array
+        """
+        return self.__times
+
+    @property
+    def levels(self):
+        """Get the level array.
+
+        :returns: The pin states, indexed by slot.
+        :rtype: ctypes.Array
+        """
+        return self.__levels
+
+    @property
+    def total(self):
+        """Get the number of transitions recorded so far.
+
+        This is also the sequence number of the next entry.
+
+        :returns: The total number of transitions.
+        :rtype: int
+        """
+        return self.__total
+
+    def record(self, timestamp_ns, level):
+        """Record a transition.
+
+        :param int timestamp_ns: When the transition was observed, in
+        nanoseconds of raspy.pi_system.core_utils.monotonic_ns().
+        :param int level: The new pin state.
+        """
+        with self.__lock:
+            slot = self.__total % self.__capacity
+            self.__times[slot] = timestamp_ns
+            self.__levels[slot] = level
+            self.__total += 1
+
+    def view(self, start=None):
+        """Get a view of the transitions recorded from a sequence number on.
+
+        :param int start: The sequence number of the first entry wanted. If
+        None, the view starts at the oldest entry still kept.
+        :returns: The view.
+        :rtype: EdgeCaptureView
+        """
+        end = self.__total
+        oldest = max(end - self.__capacity, 0)
+        if start is None:
+            start = oldest
+
+        start = min(start, end)
+        lost = 0
+        if start < oldest:
+            lost = oldest - start
+            start = oldest
+
+        return EdgeCaptureView(self, start, end, lost)
+
+    def consume(self):
+        """Get the transitions recorded since the last call.
+
+        :returns: The view of the new entries. Its lost count tells how many
+        were overwritten before they could be consumed.
+        :rtype: EdgeCaptureView
+        """
+        result = self.view(self.__readPos)
+        self.__readPos = result.end
+        return result
+
+    def clear(self):
+        """Discard all entries."""
+        with self.__lock:
+            self.__total = 0
+            self.__readPos = 0
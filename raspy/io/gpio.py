@@ -1,19 +1,76 @@
 """Implemented by classes that represent GPIO pins on the Raspberry Pi."""
 
-import threading
-import time
-from pyee import EventEmitter
 from raspy import board_revision
+from raspy import event_dispatcher
+from raspy.listener_registry import ListenerRegistry
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.io import gpio_pins
+from raspy.io.debounce import DebounceFilter
+from raspy.io.edge_capture import EdgeCapture
 from raspy.io import pin_state
 from raspy.io import pin_mode
+from raspy.io import pin_stats
 from raspy.io.pin import Pin
+from raspy.pi_system import core_utils
 
 
 EVENT_GPIO_STATE_CHANGED = "gpioStateChanged"
 """The name of the GPIO state changed event."""
 
+_default_lazy = False
+
+
+def is_lazy_by_default():
+    """Check to see if pins created from now on are provisioned lazily.
+
+    :returns: True if new pins are lazy; Otherwise, False.
+    :rtype: bool
+    """
+    return _default_lazy
+
+
+def set_lazy_by_default(flag):
+    """Set whether pins created from now on are provisioned lazily.
+
+    A lazy pin defers the work of provision() (exporting, setting the
+    direction and writing the initial value) until it is first read or
+    written, or until it is passed to provision_pins().
+
+    :param bool flag: Set True to make new pins lazy.
+    """
+    global _default_lazy
+    _default_lazy = bool(flag)
+
+
+def provision_pins(pins):
+    """Provision the specified pins now.
+
+    Each pin is provisioned regardless of whether it is lazy. Pins of the
+    same class are provisioned together through that class's
+    _provision_group(), which lets a backend use fewer operations than one
+    per pin (GpioCharDev requests the lines of each chip as one handle).
+    This lets an application declare many lazy pins and then pay for the
+    ones it needs at a time of its choosing.
+
+    :param list pins: The pins (raspy.io.gpio.Gpio) to provision. None and
+    disposed pins are skipped.
+    """
+    groups = {}
+    order = []
+    for pin in pins:
+        if pin is None or pin.is_disposed:
+            continue
+
+        cls = type(pin)
+        if cls not in groups:
+            groups[cls] = []
+            order.append(cls)
+
+        groups[cls].append(pin)
+
+    for cls in order:
+        cls._provision_group(groups[cls])
+
 
 class Gpio(Pin):
     """Implemented by classes that represent GPIO pins on the Raspberry Pi."""
@@ -26,7 +83,7 @@ class Gpio(Pin):
         :param int value: The initial pin value.
         """
         super(Pin, self).__init__()
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
 
         self.__pin = pn
         if self.__pin is None:
@@ -42,6 +99,14 @@ class Gpio(Pin):
 
         self.__revision = board_revision.REV2
         self.__state = pin_state.LOW
+        self.__capture = None
+        self.__debounce = None
+        self.__lazy = _default_lazy
+        self.__provisionPending = False
+        self.__forceProvision = False
+        self.__stats = None
+        if pin_stats.is_enabled_by_default():
+            self.__stats = pin_stats.create(self.__pin.name)
 
     def on(self, evt, callback):
         """Register an event with a callback to handle it.
@@ -71,6 +136,18 @@ class Gpio(Pin):
 
         self.__emitter.emit(evt, args)
 
+    def remove_listener(self, evt, callback):
+        """Remove a callback registered with on().
+
+        :param str evt: The name of the event the handler is registered for.
+        :param function callback: The callback to remove.
+        """
+        if self.is_disposed:
+            return
+
+        if self.__emitter is not None:
+            self.__emitter.remove_listener(evt, callback)
+
     def remove_all_listeners(self):
         """Remove all registered event listeners."""
         if self.is_disposed:
@@ -89,6 +166,9 @@ class Gpio(Pin):
         if self.is_disposed:
             raise ObjectDisposedException("Gpio")
 
+        if self.__provisionPending:
+            self._provision_now()
+
         self.__state = ps
 
     def pulse(self, millis):
@@ -105,12 +185,10 @@ class Gpio(Pin):
         if self.is_disposed:
             raise ObjectDisposedException("Gpio")
 
-        seconds = 0
+        self.write(pin_state.HIGH)
         if millis > 0:
-            seconds = millis / 1000
+            core_utils.sleep_nanoseconds(millis * 1000000)
 
-        self.write(pin_state.HIGH)
-        time.sleep(seconds)
         self.write(pin_state.LOW)
 
     def read(self):
@@ -137,11 +215,174 @@ class Gpio(Pin):
         if self.is_disposed:
             raise ObjectDisposedException("Gpio")
 
-        _t = threading.Thread(target=self.emit,
-                              name="stateChange",
-                              args=(EVENT_GPIO_STATE_CHANGED, psce))
-        _t.daemon = True
-        _t.start()
+        if self.__stats is not None:
+            self.__stats.record_event()
+
+        capture = self.__capture
+        if capture is not None:
+            capture.record(psce.timestamp_ns, psce.new_state)
+
+        debounce = self.__debounce
+        if debounce is not None:
+            debounce.process(psce)
+        else:
+            self.__dispatch_state_change(psce)
+
+    def __dispatch_state_change(self, psce):
+        """Emit the pin state change event on the shared dispatcher.
+
+        :param raspy.io.pin_state_change_event.PinStateChangeEvent psce: The
+        event object.
+        """
+        # The debounce scheduler may report a change after disposal.
+        if self.is_disposed:
+            return
+
+        # Don't queue a change nobody is listening to.
+        if not self.__emitter.listeners(EVENT_GPIO_STATE_CHANGED):
+            return
+
+        event_dispatcher.dispatch(self, self.emit,
+                                  EVENT_GPIO_STATE_CHANGED, psce)
+
+    @property
+    def debounce(self):
+        """Get the debounce filter of this pin.
+
+        :returns: The filter state change events pass through, or None if
+        debouncing is off.
+        :rtype: raspy.io.debounce.DebounceFilter
+        """
+        return self.__debounce
+
+    def set_debounce(self, glitch_us=0, stable_ms=0):
+        """Debounce the state change events of this pin.
+
+        Raw changes are still recorded by edge capture and statistics; only
+        the events are filtered. Each accepted event is timestamped with
+        when the change first occurred.
+
+        :param int glitch_us: Pulses shorter than this many microseconds are
+        suppressed.
+        :param int stable_ms: A new level must hold for this many
+        milliseconds before an event is raised.
+        :returns: The new filter, or None if both values are zero, which
+        turns debouncing off.
+        :rtype: raspy.io.debounce.DebounceFilter
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("Gpio")
+
+        self.__debounce = None
+        if glitch_us > 0 or stable_ms > 0:
+            self.__debounce = DebounceFilter(self.__dispatch_state_change,
+                                             glitch_us, stable_ms)
+
+        return self.__debounce
+
+    @property
+    def capture(self):
+        """Get the edge capture buffer of this pin.
+
+        :returns: The buffer every state change is recorded into, or None if
+        capture is not enabled.
+        :rtype: raspy.io.edge_capture.EdgeCapture
+        """
+        return self.__capture
+
+    def enable_capture(self, capacity=None):
+        """Record every state change of this pin into a ring buffer.
+
+        The buffer is filled whenever the pin raises a state change event,
+        which for inputs means whenever a read or an interrupt observes a
+        new level.
+
+        :param int capacity: The number of transitions to keep. If None,
+        raspy.io.edge_capture.DEFAULT_CAPACITY is used.
+        :returns: The capture buffer.
+        :rtype: raspy.io.edge_capture.EdgeCapture
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("Gpio")
+
+        if capacity is None:
+            self.__capture = EdgeCapture()
+        else:
+            self.__capture = EdgeCapture(capacity)
+
+        return self.__capture
+
+    def disable_capture(self):
+        """Stop recording state changes and drop the capture buffer."""
+        self.__capture = None
+
+    @property
+    def stats_enabled(self):
+        """Get whether or not this pin records I/O statistics.
+
+        :returns: True if recording; Otherwise, False.
+        :rtype: bool
+        """
+        return self.__stats is not None
+
+    @stats_enabled.setter
+    def stats_enabled(self, flag):
+        """Set whether or not this pin records I/O statistics.
+
+        Disabling discards the statistics of this pin. What it recorded
+        remains in the process-wide aggregate (raspy.io.pin_stats).
+
+        :param bool flag: Set True to start recording.
+        """
+        if not flag:
+            self.__stats = None
+        elif self.__stats is None:
+            self.__stats = pin_stats.create(self.__pin.name)
+
+    def stats(self):
+        """Get a snapshot of the I/O statistics of this pin.
+
+        :returns: The statistics (see raspy.io.pin_stats.PinStats.snapshot())
+        or None if this pin is not recording.
+        :rtype: dict
+        """
+        stats = self.__stats
+        if stats is None:
+            return None
+
+        return stats.snapshot()
+
+    def _op_start(self):
+        """Note the start of a backend operation.
+
+        :returns: The start time to pass to _op_end(), or None if this pin is
+        not recording.
+        :rtype: int
+        """
+        if self.__stats is None:
+            return None
+
+        return core_utils.monotonic_ns()
+
+    def _op_end(self, op, start):
+        """Record a completed backend operation.
+
+        :param int op: The operation (raspy.io.pin_stats.OP_*).
+        :param int start: The value returned by _op_start().
+        """
+        stats = self.__stats
+        if start is not None and stats is not None:
+            stats.record(op, core_utils.monotonic_ns() - start)
+
+    def _op_error(self):
+        """Record a failed backend operation."""
+        stats = self.__stats
+        if stats is not None:
+            stats.record_error()
 
     @property
     def revision(self):
@@ -182,8 +423,88 @@ class Gpio(Pin):
         if self.is_disposed:
             raise ObjectDisposedException("Gpio")
 
+        if self._defer_provision():
+            return
+
         self.write(self.__initValue)
 
+    @property
+    def lazy(self):
+        """Get whether or not provisioning is deferred until first use.
+
+        :returns: True if the pin is lazy; Otherwise, False.
+        :rtype: bool
+        """
+        return self.__lazy
+
+    @lazy.setter
+    def lazy(self, flag):
+        """Set whether or not provisioning is deferred until first use.
+
+        Takes effect on the next call to provision().
+
+        :param bool flag: Set True to make the pin lazy.
+        """
+        self.__lazy = bool(flag)
+
+    @property
+    def is_provision_pending(self):
+        """Get whether or not a deferred provision() is waiting to be done.
+
+        :returns: True if the pin still has to be provisioned; Otherwise,
+        False.
+        :rtype: bool
+        """
+        return self.__provisionPending
+
+    def _defer_provision(self):
+        """Check whether provision() should be deferred until first use.
+
+        Implementations call this at the start of provision() and return at
+        once if it returns True.
+
+        :returns: True if the pin is lazy and the work has been deferred;
+        Otherwise, False.
+        :rtype: bool
+        """
+        if self.__lazy and not self.__forceProvision:
+            self.__provisionPending = True
+            return True
+
+        self.__provisionPending = False
+        return False
+
+    @classmethod
+    def _provision_group(cls, pins):
+        """Provision several pins of this class now, even if they are lazy.
+
+        Called by provision_pins(). The default provisions each pin in turn;
+        implementations override it to share work between the pins.
+
+        :param list pins: The pins to provision.
+        """
+        for pin in pins:
+            pin._provision_now()
+
+    def _provision_now(self):
+        """Provision this pin even if it is lazy."""
+        self.__forceProvision = True
+        try:
+            self.provision()
+        finally:
+            self.__forceProvision = False
+
+    def ensure_provisioned(self):
+        """Do a deferred provision() now, if there is one.
+
+        Implementations call this before the first real use of the pin.
+
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        if self.__provisionPending:
+            self._provision_now()
+
     @property
     def mode(self):
         """Get the pin mode.
@@ -279,6 +600,9 @@ class Gpio(Pin):
 
         self.__emitter.remove_all_listeners()
         self.__emitter = None
+        self.__stats = None
+        self.__capture = None
+        self.__debounce = None
         self.__state = None
         self.__mode = None
         self.__pin = None
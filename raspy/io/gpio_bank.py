@@ -0,0 +1,310 @@
+"""Multi-pin read and write in the fewest backend operations.
+
+A GpioBank groups output pins so that bit N of a value drives pins[N]. A
+write takes a mask of the bits to change and commits them according to the
+backend the pins share:
+
+* raspy.io.gpio_mem.GpioMem pins on one register map: one GPSET and one
+  GPCLR store per 32-pin bank.
+* raspy.io.gpio_chardev.GpioCharDev pins on one chip: the bank requests all
+  lines as a single handle, so a write is one ioctl.
+* Anything else (sysfs, PiFace, mixed backends): each selected pin is
+  written. Pins may also be driven on their own, so the bank does not skip
+  pins that match its last write; set elide_writes on a pin to skip writes
+  that would not change its level.
+
+Writes that bypass the individual pins (register and ioctl writes) do not
+raise per-pin state change events.
+"""
+
+
+from raspy.argument_null_exception import ArgumentNullException
+from raspy.disposable import Disposable
+from raspy.illegal_argument_exception import IllegalArgumentException
+from raspy.object_disposed_exception import ObjectDisposedException
+from raspy.io import gpio_chip
+from raspy.io import pin_state
+from raspy.io.gpio_chardev import GpioCharDev
+from raspy.io.gpio_mem import GpioMem
+
+
+BACKEND_PINS = 0
+"""Pins are written individually."""
+
+BACKEND_MEM = 1
+"""Pins are written through a shared register map."""
+
+BACKEND_CHARDEV = 2
+"""Pins are written through a shared character device line handle."""
+
+
+def _get_backend(pins):
+    """Get the fastest backend every connected pin supports.
+
+    :param list pins: The connected pins.
+    :returns: The backend (BACKEND_*).
+    :rtype: int
+    """
+    if all(isinstance(p, GpioMem) for p in pins):
+        if len(set(id(p.mem_map) for p in pins)) == 1:
+            return BACKEND_MEM
+
+    if all(isinstance(p, GpioCharDev) for p in pins):
+        if len(set(id(p.chip) for p in pins)) == 1:
+            return BACKEND_CHARDEV
+
+    return BACKEND_PINS
+
+
+class GpioBank(Disposable):
+    """A group of output pins written together."""
+
+    def __init__(self, pins):
+        """Initialize a new instance of raspy.io.gpio_bank.GpioBank.
+
+        :param list pins: The pins, where pins[N] is driven by bit N. Entries
+        may be None for bits that are not connected. The bank does not take
+        ownership of the pins.
+        :raises: raspy.argument_null_exception.ArgumentNullException if no
+        pins are connected.
+        """
+        Disposable.__init__(self)
+        if pins is None or all(p is None for p in pins):
+            raise ArgumentNullException("'pins' param cannot be empty.")
+
+        self.__pins = list(pins)
+        self.__bits = [i for i, p in enumerate(self.__pins) if p is not None]
+        connected = [self.__pins[i] for i in self.__bits]
+        self.__mask = 0
+        for i in self.__bits:
+            self.__mask |= 1 << i
+
+        self.__backend = _get_backend(connected)
+        self.__handle = None
+        self.__value = None
+        self.__writeCount = 0
+
+    @property
+    def pins(self):
+        """Get the pins in bit order.
+
+        :returns: A copy of the pin list.
+        :rtype: list
+        """
+        return list(self.__pins)
+
+    @property
+    def mask(self):
+        """Get the mask of all connected bits.
+
+        :returns: The bit mask.
+        :rtype: int
+        """
+        return self.__mask
+
+    @property
+    def backend(self):
+        """Get the backend used to commit writes.
+
+        :returns: The backend (BACKEND_*).
+        :rtype: int
+        """
+        return self.__backend
+
+    @property
+    def value(self):
+        """Get the value last written.
+
+        :returns: The last value written, or None if nothing has been
+        written yet.
+        :rtype: int
+        """
+        return self.__value
+
+    @property
+    def write_count(self):
+        """Get the number of backend operations performed by write().
+
+        :returns: The operation count.
+        :rtype: int
+        """
+        return self.__writeCount
+
+    def provision(self):
+        """Provision all connected pins.
+
+        Character device pins are requested together as one line handle
+        that every pin is then attached to.
+
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.io.io_exception.IOException if a pin could not be
+        provisioned.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioBank")
+
+        if self.__backend != BACKEND_CHARDEV:
+            for i in self.__bits:
+                self.__pins[i].provision()
+
+            return
+
+        self.__release_handle()
+        pins = [self.__pins[i] for i in self.__bits]
+        offsets = [p.inner_pin.value for p in pins]
+        values = [p.get_initial_pin_value() for p in pins]
+        handle = pins[0].chip.request_lines(offsets,
+                                            gpio_chip.HANDLE_REQUEST_OUTPUT,
+                                            values)
+        for pin in pins:
+            pin.attach_handle(handle)
+
+        self.__handle = handle
+
+    def __release_handle(self):
+        """Detach the pins from the shared line handle and release it."""
+        if self.__handle is None:
+            return
+
+        for i in self.__bits:
+            self.__pins[i].detach_handle()
+
+        self.__handle.dispose()
+        self.__handle = None
+
+    def __write_mem(self, mask, value):
+        """Commit a write through the register map.
+
+        :param int mask: The bank bits to change.
+        :param int value: The bank bit values.
+        """
+        gpio_mask = 0
+        gpio_value = 0
+        for i in self.__bits:
+            bit = 1 << i
+            if mask & bit:
+                pin_mask = self.__pins[i].mask
+                gpio_mask |= pin_mask
+                if value & bit:
+                    gpio_value |= pin_mask
+
+        mem_map = self.__pins[self.__bits[0]].mem_map
+        mem_map.write_masked(gpio_mask, gpio_value)
+        self.__writeCount += 1
+
+    def __write_chardev(self, mask, value):
+        """Commit a write as one ioctl on the shared line handle.
+
+        :param int mask: The bank bits to change.
+        :param int value: The bank bit values.
+        """
+        if self.__handle is None:
+            self.provision()
+
+        values = self.__handle.values
+        for idx, i in enumerate(self.__bits):
+            if mask & (1 << i):
+                values[idx] = (value >> i) & 0x01
+
+        self.__handle.set_values(values)
+        self.__writeCount += 1
+
+    def __write_pins(self, mask, value):
+        """Commit a write by writing each selected pin.
+
+        :param int mask: The bank bits to change.
+        :param int value: The bank bit values.
+        """
+        for i in self.__bits:
+            bit = 1 << i
+            if mask & bit:
+                state = pin_state.LOW
+                if value & bit:
+                    state = pin_state.HIGH
+
+                self.__pins[i].write(state)
+                self.__writeCount += 1
+
+    def write(self, value, mask=None):
+        """Drive the pins selected by mask to the levels given by value.
+
+        :param int value: The pin levels, bit N for pins[N].
+        :param int mask: The bits to change. If None, all connected pins
+        are written.
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        the mask selects no connected pin.
+        :raises: raspy.io.io_exception.IOException if the pins could not be
+        written.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioBank")
+
+        if mask is None:
+            mask = self.__mask
+
+        mask &= self.__mask
+        if mask == 0:
+            raise IllegalArgumentException("'mask' selects no bank pins.")
+
+        if self.__backend == BACKEND_MEM:
+            self.__write_mem(mask, value)
+        elif self.__backend == BACKEND_CHARDEV:
+            self.__write_chardev(mask, value)
+        else:
+            self.__write_pins(mask, value)
+
+        previous = self.__value
+        if previous is None:
+            previous = 0
+
+        self.__value = (previous & ~mask) | (value & mask)
+
+    def read(self):
+        """Read the levels of all connected pins.
+
+        :returns: The pin levels, bit N for pins[N].
+        :rtype: int
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.io.io_exception.IOException if the pins could not be
+        read.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioBank")
+
+        result = 0
+        if self.__backend == BACKEND_MEM:
+            levels = self.__pins[self.__bits[0]].mem_map.levels()
+            for i in self.__bits:
+                if levels & self.__pins[i].mask:
+                    result |= 1 << i
+        elif self.__backend == BACKEND_CHARDEV:
+            if self.__handle is None:
+                self.provision()
+
+            values = self.__handle.get_values()
+            for idx, i in enumerate(self.__bits):
+                if values[idx]:
+                    result |= 1 << i
+        else:
+            for i in self.__bits:
+                if self.__pins[i].read() == pin_state.HIGH:
+                    result |= 1 << i
+
+        return result
+
+    def dispose(self):
+        """Release the shared line handle, if any.
+
+        The pins themselves are not disposed.
+        """
+        if self.is_disposed:
+            return
+
+        self.__release_handle()
+        self.__pins = None
+        self.__bits = None
+        Disposable.dispose(self)
@@ -0,0 +1,535 @@
+"""Raspberry Pi GPIO using the GPIO character device (/dev/gpiochipN)."""
+
+
+import threading
+from raspy.illegal_argument_exception import IllegalArgumentException
+from raspy.invalid_operation_exception import InvalidOperationException
+from raspy.object_disposed_exception import ObjectDisposedException
+from raspy.io import gpio
+from raspy.io import gpio_chip
+from raspy.io import gpio_pins
+from raspy.io import pin_edge
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.io import pin_stats
+from raspy.io.gpio_chip import GpioChip
+from raspy.io.io_exception import IOException
+from raspy.io.pin_state_change_event import PinStateChangeEvent
+from raspy.pi_system import core_utils
+
+
+INTERRUPT_WAIT_MILLIS = 100
+"""How long the interrupt thread waits for an event before re-checking
+whether it has been asked to stop."""
+
+_defaultChip = None
+_defaultChipLock = threading.Lock()
+
+
+def get_default_chip():
+    """Get the shared chip for raspy.io.gpio_chip.DEFAULT_CHIP_PATH.
+
+    The chip is opened on first use and shared by every GpioCharDev that was
+    not given a chip explicitly.
+
+    :returns: The default GPIO chip.
+    :rtype: raspy.io.gpio_chip.GpioChip
+    :raises: raspy.io.io_exception.IOException if the chip could not be
+    opened.
+    """
+    global _defaultChip
+    with _defaultChipLock:
+        if _defaultChip is None or _defaultChip.is_disposed:
+            _defaultChip = GpioChip(gpio_chip.DEFAULT_CHIP_PATH)
+
+        return _defaultChip
+
+
+def _get_event_flags(edge):
+    """Convert a raspy.io.pin_edge value to line event request flags.
+
+    :param int edge: The edge.
+    :returns: The EVENT_REQUEST_* flags.
+    :rtype: int
+    """
+    if edge == pin_edge.RISING:
+        return gpio_chip.EVENT_REQUEST_RISING_EDGE
+
+    if edge == pin_edge.FALLING:
+        return gpio_chip.EVENT_REQUEST_FALLING_EDGE
+
+    return gpio_chip.EVENT_REQUEST_BOTH_EDGES
+
+
+class GpioCharDev(gpio.Gpio):
+    """Raspberry Pi GPIO using the GPIO character device.
+
+    Each pin holds a kernel line request instead of sysfs files. Pins can
+    also share a multi-line handle so that several lines are updated with a
+    single ioctl.
+    """
+
+    def __init__(self, pn, mode, initial_val, chip=None):
+        """Initialize a new instance of raspy.io.gpio_chardev.GpioCharDev.
+
+        :param raspy.io.gpio_pins.GpioPin pn: The GPIO pin. The pin value is
+        used as the line offset on the chip.
+        :param int mode: The I/O pin mode.
+        :param int initial_val: The initial pin value.
+        :param raspy.io.gpio_chip.GpioChip chip: The chip the line belongs
+        to. If None, the default chip is used.
+        """
+        gpio.Gpio.__init__(self, pn, mode, initial_val)
+        self.__chip = chip
+        self.__handle = None
+        self.__handleRefs = None
+        self.__batch = None
+        self.__index = 0
+        self.__events = None
+        self.__edge = pin_edge.NONE
+        self.__lastState = pin_state.LOW
+        self.__lastEvent = None
+        self.__interruptThread = None
+        self.__stopEvent = threading.Event()
+
+    @property
+    def chip(self):
+        """Get the chip the line belongs to.
+
+        :returns: The GPIO chip.
+        :rtype: raspy.io.gpio_chip.GpioChip
+        """
+        if self.__chip is None:
+            self.__chip = get_default_chip()
+
+        return self.__chip
+
+    @property
+    def line_handle(self):
+        """Get the line handle currently used by this pin.
+
+        :returns: The line handle, or None if not provisioned.
+        :rtype: raspy.io.gpio_chip.GpioLineHandle
+        """
+        return self.__handle
+
+    @property
+    def edge_fd(self):
+        """Get the descriptor the kernel edge events are read from.
+
+        The descriptor becomes readable when an edge event is queued, so it
+        can be watched by an event loop and drained with wait_for_edge(0).
+
+        :returns: The file descriptor, or None if no edge is configured.
+        :rtype: int
+        """
+        if self.__events is None:
+            return None
+
+        return self.__events.fd
+
+    def __release(self):
+        """Release any lines held by this pin."""
+        if self.__events is not None:
+            self.__events.dispose()
+            self.__events = None
+
+        # A handle attached with attach_handle() belongs to whoever attached
+        # it. One requested by provision() may be shared by the pins of a
+        # group, and is released by the last of them.
+        if self.__handle is not None and self.__handleRefs is not None:
+            self.__handleRefs[0] -= 1
+            if self.__handleRefs[0] == 0:
+                self.__handle.dispose()
+
+        self.__handle = None
+        self.__handleRefs = None
+        self.__edge = pin_edge.NONE
+
+    @classmethod
+    def _provision_group(cls, pins):
+        """Provision several pins now, even if they are lazy.
+
+        The lines of the pins on the same chip and with the same direction
+        are requested with one ioctl, as a single handle shared by those
+        pins.
+
+        :param list pins: The pins to provision.
+        """
+        groups = {}
+        order = []
+        for pin in pins:
+            key = (id(pin.chip), pin.mode == pin_mode.IN)
+            if pin.inner_pin.value == gpio_pins.GpioNone.value:
+                key = None
+
+            if key not in groups:
+                groups[key] = []
+                order.append(key)
+
+            groups[key].append(pin)
+
+        for key in order:
+            group = groups[key]
+            offsets = [p.inner_pin.value for p in group]
+            if (key is None or len(group) == 1 or
+                    len(group) > gpio_chip.MAX_LINES or
+                    len(set(offsets)) != len(offsets)):
+                gpio.Gpio._provision_group(group)
+                continue
+
+            for pin in group:
+                pin.disable_interrupts()
+                pin.__release()
+
+            flags = gpio_chip.HANDLE_REQUEST_OUTPUT
+            values = [p.get_initial_pin_value() for p in group]
+            if key[1]:
+                flags = gpio_chip.HANDLE_REQUEST_INPUT
+                values = [pin_state.LOW] * len(group)
+
+            handle = group[0].chip.request_lines(offsets, flags, values)
+            refs = [len(group)]
+            for index, pin in enumerate(group):
+                pin.__batch = (handle, index, refs)
+                pin._provision_now()
+
+    def provision(self):
+        """Provision this pin.
+
+        Requests the line from the chip as an input or output depending on
+        the pin mode.
+
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.io.io_exception.IOException if the line could not be
+        requested.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioCharDev")
+
+        if self.inner_pin.value == gpio_pins.GpioNone.value:
+            return
+
+        if self._defer_provision():
+            return
+
+        self.disable_interrupts()
+        self.__release()
+        flags = gpio_chip.HANDLE_REQUEST_OUTPUT
+        init_val = self.get_initial_pin_value()
+        if self.mode == pin_mode.IN:
+            flags = gpio_chip.HANDLE_REQUEST_INPUT
+            init_val = pin_state.LOW
+
+        start = self._op_start()
+        batch = self.__batch
+        self.__batch = None
+        if batch is not None:
+            # The line was requested together with others by
+            # _provision_group().
+            self.__handle, self.__index, self.__handleRefs = batch
+            self._op_end(pin_stats.OP_EXPORT, start)
+            self.__lastState = init_val
+            return
+
+        offsets = [self.inner_pin.value]
+        try:
+            self.__handle = self.chip.request_lines(offsets, flags,
+                                                    [init_val])
+        except IOException:
+            self._op_error()
+            raise
+
+        self._op_end(pin_stats.OP_EXPORT, start)
+        self.__handleRefs = [1]
+        self.__index = 0
+        self.__lastState = init_val
+
+    def attach_handle(self, handle):
+        """Use a shared multi-line handle for this pin.
+
+        Any line this pin currently holds is released first. The handle is
+        owned by the caller, which is responsible for disposing it.
+
+        :param raspy.io.gpio_chip.GpioLineHandle handle: The handle that
+        includes this pin's line.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        the handle does not include this pin's line.
+        """
+        index = handle.index_of(self.inner_pin.value)
+        if index < 0:
+            msg = "The handle does not include line "
+            msg += str(self.inner_pin.value) + "."
+            raise IllegalArgumentException(msg)
+
+        self.disable_interrupts()
+        self.__release()
+        self.__handle = handle
+        self.__index = index
+
+    def detach_handle(self):
+        """Stop using a shared handle set by attach_handle().
+
+        The pin is left unprovisioned; the next read or write requests the
+        line again.
+        """
+        self.disable_interrupts()
+        self.__release()
+
+    def write(self, ps):
+        """Write a value to the pin.
+
+        :param int ps: The pin state value to write to the pin.
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.io.io_exception.IOException if the line could not be
+        written.
+        """
+        gpio.Gpio.write(self, ps)
+        if self.__handle is None:
+            self._provision_now()
+
+        start = self._op_start()
+        try:
+            self.__handle.set_value(self.__index, ps)
+        except IOException:
+            self._op_error()
+            raise
+
+        self._op_end(pin_stats.OP_WRITE, start)
+        if self.__lastState != ps:
+            pin_addr = self.inner_pin.value
+            evt = PinStateChangeEvent(self.__lastState, ps, pin_addr)
+            self.__lastState = ps
+            self.on_pin_state_change(evt)
+
+    def read(self):
+        """Read a value from the pin.
+
+        :returns: The state (value) of the pin.
+        :rtype: int
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.io.io_exception.IOException if the line could not be
+        read.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioCharDev")
+
+        if self.__events is None and self.__handle is None:
+            self._provision_now()
+
+        start = self._op_start()
+        try:
+            if self.__events is not None:
+                val = self.__events.get_value()
+            else:
+                val = self.__handle.get_value(self.__index)
+        except IOException:
+            self._op_error()
+            raise
+
+        self._op_end(pin_stats.OP_READ, start)
+
+        if self.__lastState != val:
+            pin_addr = self.inner_pin.value
+            evt = PinStateChangeEvent(self.__lastState, val, pin_addr)
+            self.__lastState = val
+            self.on_pin_state_change(evt)
+
+        return val
+
+    @property
+    def edge(self):
+        """Get the interrupt edge.
+
+        :returns: The interrupt edge (one of the raspy.io.pin_edge values).
+        :rtype: int
+        """
+        return self.__edge
+
+    @edge.setter
+    def edge(self, edge):
+        """Set the interrupt edge.
+
+        Setting an edge other than NONE re-requests the line for kernel edge
+        events (the line must be an input). Setting NONE re-requests the line
+        as a plain handle.
+
+        :param int edge: The interrupt edge (one of the raspy.io.pin_edge
+        values).
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.invalid_operation_exception.InvalidOperationException
+        if the pin is not an input.
+        :raises: raspy.io.io_exception.IOException if the line could not be
+        requested.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioCharDev")
+
+        if edge is None:
+            edge = pin_edge.NONE
+
+        if self.__edge == edge:
+            return
+
+        if edge == pin_edge.NONE:
+            self.provision()
+            return
+
+        if self.mode != pin_mode.IN:
+            msg = "Edge events can only be requested on an input pin."
+            raise InvalidOperationException(msg)
+
+        self.disable_interrupts()
+        self.__release()
+        flags = _get_event_flags(edge)
+        self.__events = self.chip.request_events(self.inner_pin.value, flags)
+        self.__edge = edge
+
+    @property
+    def last_event(self):
+        """Get the last edge event received from the kernel.
+
+        :returns: The last event, or None if no event has been received.
+        :rtype: raspy.io.gpio_chip.GpioLineEvent
+        """
+        return self.__lastEvent
+
+    def wait_for_edge(self, timeout=None):
+        """Block until the configured edge occurs on the pin.
+
+        When an event arrives the pin state is updated from the event and the
+        raspy.io.gpio.EVENT_GPIO_STATE_CHANGED event is fired if it changed.
+
+        :param int timeout: The maximum number of milliseconds to wait. If
+        None or negative, waits indefinitely.
+        :returns: The kernel-timestamped event, or None if the wait timed out.
+        :rtype: raspy.io.gpio_chip.GpioLineEvent
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.invalid_operation_exception.InvalidOperationException
+        if no interrupt edge has been configured.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioCharDev")
+
+        if self.__events is None:
+            msg = "No interrupt edge configured on this pin."
+            raise InvalidOperationException(msg)
+
+        line_evt = self.__events.read_event(timeout)
+        if line_evt is not None:
+            self.__process_event(line_evt)
+
+        return line_evt
+
+    def __process_event(self, line_evt):
+        """Update the pin state from a kernel edge event.
+
+        :param raspy.io.gpio_chip.GpioLineEvent line_evt: The event.
+        """
+        self.__lastEvent = line_evt
+        val = pin_state.LOW
+        if line_evt.is_rising:
+            val = pin_state.HIGH
+
+        if self.__lastState != val:
+            # Since Linux 5.7 the kernel stamps edges with CLOCK_MONOTONIC,
+            # the clock monotonic_ns() reads. Older kernels use
+            # CLOCK_REALTIME, which is always ahead of the monotonic clock;
+            # those edges are stamped on arrival instead.
+            stamp = line_evt.timestamp
+            if stamp > core_utils.monotonic_ns():
+                stamp = None
+
+            pin_addr = self.inner_pin.value
+            evt = PinStateChangeEvent(self.__lastState, val, pin_addr, stamp)
+            self.__lastState = val
+            self.on_pin_state_change(evt)
+
+    @property
+    def interrupts_enabled(self):
+        """Get whether or not interrupt mode is enabled.
+
+        :returns: True if interrupt mode is enabled; Otherwise, False.
+        :rtype: bool
+        """
+        return self.__interruptThread is not None
+
+    def __background_interrupt(self, events):
+        """Read kernel edge events and fire state change events until stopped.
+
+        This is the callback executed by the interrupt thread.
+
+        :param raspy.io.gpio_chip.GpioLineEventRequest events: The request to
+        read events from.
+        """
+        while not self.__stopEvent.is_set():
+            line_evt = events.read_event(INTERRUPT_WAIT_MILLIS)
+            if line_evt is not None and not self.__stopEvent.is_set():
+                self.__process_event(line_evt)
+
+    def enable_interrupts(self, edge=pin_edge.BOTH):
+        """Enable interrupt mode.
+
+        Starts a background thread that blocks on the kernel event queue and
+        fires the raspy.io.gpio.EVENT_GPIO_STATE_CHANGED event for each edge.
+
+        :param int edge: The edge to interrupt on (one of the
+        raspy.io.pin_edge values other than NONE). Default is BOTH.
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        edge is raspy.io.pin_edge.NONE.
+        :raises: raspy.invalid_operation_exception.InvalidOperationException
+        if interrupt mode is already enabled.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioCharDev")
+
+        if edge is None or edge == pin_edge.NONE:
+            msg = "An edge must be specified to enable interrupts."
+            raise IllegalArgumentException(msg)
+
+        if self.__interruptThread is not None:
+            raise InvalidOperationException("Interrupts already enabled.")
+
+        self.edge = edge
+        self.__stopEvent.clear()
+        self.__interruptThread = threading.Thread(
+            target=self.__background_interrupt, args=(self.__events,))
+        self.__interruptThread.name = "GpioCharDevInterrupt"
+        self.__interruptThread.daemon = True
+        self.__interruptThread.start()
+
+    def disable_interrupts(self):
+        """Disable interrupt mode started by enable_interrupts()."""
+        if self.__interruptThread is None:
+            return
+
+        self.__stopEvent.set()
+        if self.__interruptThread is not threading.current_thread():
+            self.__interruptThread.join()
+
+        self.__interruptThread = None
+
+    def dispose(self):
+        """Dispose managed resources.
+
+        Performs application-defined tasks associated with freeing, releasing,
+        or resetting resources. The chip itself is not closed since it may be
+        shared with other pins.
+        """
+        if self.is_disposed:
+            return
+
+        self.disable_interrupts()
+        if self.__handle is not None and self.mode != pin_mode.IN:
+            self.__handle.set_value(self.__index, pin_state.LOW)
+
+        self.__release()
+        self.__chip = None
+        gpio.Gpio.dispose(self)
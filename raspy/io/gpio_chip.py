@@ -0,0 +1,576 @@
+"""Access to a GPIO character device (/dev/gpiochipN).
+
+This module talks to the kernel GPIO character device through the line
+handle and line event ioctls. Unlike the deprecated sysfs interface, a single
+line handle can cover many lines, so N pins can be read or written with one
+ioctl, and line events carry a kernel timestamp.
+
+The ioctl and open functions used are injectable so the protocol can be
+exercised against a fake device.
+"""
+
+
+import fcntl
+import os
+import select
+import struct
+from raspy.argument_null_exception import ArgumentNullException
+from raspy.disposable import Disposable
+from raspy.illegal_argument_exception import IllegalArgumentException
+from raspy.object_disposed_exception import ObjectDisposedException
+from raspy.io.io_exception import IOException
+
+
+DEFAULT_CHIP_PATH = "/dev/gpiochip0"
+"""The default GPIO character device (the SoC GPIO bank on a Pi)."""
+
+MAX_LINES = 64
+"""The maximum number of lines a single line handle can request."""
+
+CONSUMER_LABEL = "raspy"
+"""The default consumer label attached to requested lines."""
+
+HANDLE_REQUEST_INPUT = 1 << 0
+"""Request the lines as inputs."""
+
+HANDLE_REQUEST_OUTPUT = 1 << 1
+"""Request the lines as outputs."""
+
+HANDLE_REQUEST_ACTIVE_LOW = 1 << 2
+"""Invert the logical value of the lines."""
+
+HANDLE_REQUEST_OPEN_DRAIN = 1 << 3
+"""Drive the lines as open drain."""
+
+HANDLE_REQUEST_OPEN_SOURCE = 1 << 4
+"""Drive the lines as open source."""
+
+EVENT_REQUEST_RISING_EDGE = 1 << 0
+"""Report rising edge events."""
+
+EVENT_REQUEST_FALLING_EDGE = 1 << 1
+"""Report falling edge events."""
+
+EVENT_REQUEST_BOTH_EDGES = EVENT_REQUEST_RISING_EDGE | EVENT_REQUEST_FALLING_EDGE
+"""Report both rising and falling edge events."""
+
+EVENT_RISING_EDGE = 0x01
+"""Event id of a rising edge event."""
+
+EVENT_FALLING_EDGE = 0x02
+"""Event id of a falling edge event."""
+
+CHIP_INFO_FORMAT = "=32s32sI"
+"""struct gpiochip_info: name, label, lines."""
+
+HANDLE_REQUEST_FORMAT = "=64II64B32sIi"
+"""struct gpiohandle_request: offsets, flags, defaults, label, lines, fd."""
+
+EVENT_REQUEST_FORMAT = "=III32si"
+"""struct gpioevent_request: offset, handle flags, event flags, label, fd."""
+
+HANDLE_DATA_FORMAT = "=64B"
+"""struct gpiohandle_data: values."""
+
+EVENT_DATA_FORMAT = "=QI4x"
+"""struct gpioevent_data: timestamp (ns), id (padded to 16 bytes)."""
+
+
+def _ioc(direction, nr, size):
+    """Compute an ioctl request number for the GPIO ioctl type (0xB4).
+
+    :param int direction: The transfer direction (1 = write, 2 = read).
+    :param int nr: The command number.
+    :param int size: The size of the argument structure.
+    :returns: The ioctl request number.
+    :rtype: int
+    """
+    return (direction << 30) | (size << 16) | (0xB4 << 8) | nr
+
+
+GET_CHIPINFO_IOCTL = _ioc(2, 0x01, struct.calcsize(CHIP_INFO_FORMAT))
+"""GPIO_GET_CHIPINFO_IOCTL."""
+
+GET_LINEHANDLE_IOCTL = _ioc(3, 0x03, struct.calcsize(HANDLE_REQUEST_FORMAT))
+"""GPIO_GET_LINEHANDLE_IOCTL."""
+
+GET_LINEEVENT_IOCTL = _ioc(3, 0x04, struct.calcsize(EVENT_REQUEST_FORMAT))
+"""GPIO_GET_LINEEVENT_IOCTL."""
+
+GET_LINE_VALUES_IOCTL = _ioc(3, 0x08, struct.calcsize(HANDLE_DATA_FORMAT))
+"""GPIOHANDLE_GET_LINE_VALUES_IOCTL."""
+
+SET_LINE_VALUES_IOCTL = _ioc(3, 0x09, struct.calcsize(HANDLE_DATA_FORMAT))
+"""GPIOHANDLE_SET_LINE_VALUES_IOCTL."""
+
+EVENT_DATA_SIZE = struct.calcsize(EVENT_DATA_FORMAT)
+"""The size in bytes of a single line event read from an event fd."""
+
+
+def default_ioctl(fd, request, buf):
+    """Perform an ioctl, mutating buf in place.
+
+    :param int fd: The file descriptor.
+    :param int request: The ioctl request number.
+    :param bytearray buf: The argument structure.
+    """
+    fcntl.ioctl(fd, request, buf, True)
+
+
+def default_opener(path):
+    """Open the specified character device.
+
+    :param str path: The device path.
+    :returns: The file descriptor.
+    :rtype: int
+    """
+    return os.open(path, os.O_RDWR)
+
+
+class GpioLineEvent(object):
+    """An edge event reported by the kernel for a requested line."""
+
+    def __init__(self, offset, timestamp, event_id):
+        """Initialize a new instance of GpioLineEvent.
+
+        :param int offset: The line offset the event occurred on.
+        :param int timestamp: The kernel timestamp in nanoseconds.
+        :param int event_id: The event id (EVENT_RISING_EDGE or
+        EVENT_FALLING_EDGE).
+        """
+        self.__offset = offset
+        self.__timestamp = timestamp
+        self.__id = event_id
+
+    @property
+    def offset(self):
+        """Get the line offset.
+
+        :returns: The line offset the event occurred on.
+        :rtype: int
+        """
+        return self.__offset
+
+    @property
+    def timestamp(self):
+        """Get the kernel timestamp of the event.
+
+        :returns: The timestamp in nanoseconds.
+        :rtype: int
+        """
+        return self.__timestamp
+
+    @property
+    def is_rising(self):
+        """Get whether or not this is a rising edge event.
+
+        :returns: True if rising edge; Otherwise, False.
+        :rtype: bool
+        """
+        return self.__id == EVENT_RISING_EDGE
+
+    @property
+    def is_falling(self):
+        """Get whether or not this is a falling edge event.
+
+        :returns: True if falling edge; Otherwise, False.
+        :rtype: bool
+        """
+        return self.__id == EVENT_FALLING_EDGE
+
+
+class GpioLineHandle(Disposable):
+    """A set of lines requested together from a GPIO chip.
+
+    All lines in the handle are read or written with a single ioctl. The
+    handle keeps a shadow copy of the output values so that a single line
+    can be changed without disturbing the others.
+    """
+
+    def __init__(self, fd, offsets, values, ioctl_func):
+        """Initialize a new instance of GpioLineHandle.
+
+        :param int fd: The line handle file descriptor.
+        :param list offsets: The requested line offsets.
+        :param list values: The initial output values.
+        :param function ioctl_func: The ioctl function to use.
+        """
+        Disposable.__init__(self)
+        self.__fd = fd
+        self.__offsets = list(offsets)
+        self.__values = list(values)
+        self.__ioctl = ioctl_func
+        self.__getBuf = bytearray(struct.calcsize(HANDLE_DATA_FORMAT))
+        self.__setBuf = bytearray(struct.calcsize(HANDLE_DATA_FORMAT))
+
+    @property
+    def fd(self):
+        """Get the line handle file descriptor.
+
+        :returns: The file descriptor.
+        :rtype: int
+        """
+        return self.__fd
+
+    @property
+    def offsets(self):
+        """Get the line offsets in request order.
+
+        :returns: The line offsets.
+        :rtype: list
+        """
+        return list(self.__offsets)
+
+    @property
+    def values(self):
+        """Get the output values last written, in request order.
+
+        :returns: The shadow copy of the output values.
+        :rtype: list
+        """
+        return list(self.__values)
+
+    def index_of(self, offset):
+        """Get the position of the specified line within this handle.
+
+        :param int offset: The line offset.
+        :returns: The index of the line, or -1 if not part of this handle.
+        :rtype: int
+        """
+        try:
+            return self.__offsets.index(offset)
+        except ValueError:
+            return -1
+
+    def get_values(self):
+        """Read all lines with a single ioctl.
+
+        :returns: The line values in request order.
+        :rtype: list
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.io.io_exception.IOException if the ioctl failed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioLineHandle")
+
+        buf = self.__getBuf
+        try:
+            self.__ioctl(self.__fd, GET_LINE_VALUES_IOCTL, buf)
+        except (IOError, OSError) as ex:
+            raise IOException(ex.strerror)
+
+        return list(buf[0:len(self.__offsets)])
+
+    def get_value(self, index):
+        """Read the line at the specified index.
+
+        :param int index: The index of the line within this handle.
+        :returns: The line value.
+        :rtype: int
+        """
+        return self.get_values()[index]
+
+    def set_values(self, values):
+        """Write all lines with a single ioctl.
+
+        :param list values: The line values in request order.
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.io.io_exception.IOException if the ioctl failed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioLineHandle")
+
+        buf = self.__setBuf
+        for i, val in enumerate(values):
+            buf[i] = 1 if val else 0
+            self.__values[i] = buf[i]
+
+        try:
+            self.__ioctl(self.__fd, SET_LINE_VALUES_IOCTL, buf)
+        except (IOError, OSError) as ex:
+            raise IOException(ex.strerror)
+
+    def set_value(self, index, value):
+        """Write the line at the specified index.
+
+        The other lines keep their last written values.
+
+        :param int index: The index of the line within this handle.
+        :param int value: The value to write.
+        """
+        values = self.__values
+        values[index] = 1 if value else 0
+        self.set_values(values)
+
+    def dispose(self):
+        """Release the lines."""
+        if self.is_disposed:
+            return
+
+        try:
+            os.close(self.__fd)
+        except OSError:
+            pass
+
+        self.__fd = None
+        Disposable.dispose(self)
+
+
+class GpioLineEventRequest(Disposable):
+    """A single line requested from a GPIO chip for edge events."""
+
+    def __init__(self, fd, offset, ioctl_func):
+        """Initialize a new instance of GpioLineEventRequest.
+
+        :param int fd: The line event file descriptor.
+        :param int offset: The line offset.
+        :param function ioctl_func: The ioctl function to use.
+        """
+        Disposable.__init__(self)
+        self.__fd = fd
+        self.__offset = offset
+        self.__ioctl = ioctl_func
+        self.__buf = bytearray(struct.calcsize(HANDLE_DATA_FORMAT))
+        self.__poller = select.poll()
+        self.__poller.register(fd, select.POLLIN | select.POLLPRI)
+
+    @property
+    def fd(self):
+        """Get the line event file descriptor.
+
+        :returns: The file descriptor.
+        :rtype: int
+        """
+        return self.__fd
+
+    @property
+    def offset(self):
+        """Get the line offset.
+
+        :returns: The line offset.
+        :rtype: int
+        """
+        return self.__offset
+
+    def get_value(self):
+        """Read the current value of the line.
+
+        :returns: The line value.
+        :rtype: int
+        :raises: raspy.io.io_exception.IOException if the ioctl failed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioLineEventRequest")
+
+        buf = self.__buf
+        try:
+            self.__ioctl(self.__fd, GET_LINE_VALUES_IOCTL, buf)
+        except (IOError, OSError) as ex:
+            raise IOException(ex.strerror)
+
+        return buf[0]
+
+    def read_event(self, timeout=None):
+        """Wait for and read the next edge event.
+
+        :param int timeout: The maximum number of milliseconds to wait. If
+        None or negative, waits indefinitely.
+        :returns: The event, or None if the wait timed out.
+        :rtype: GpioLineEvent
+        :raises: raspy.io.io_exception.IOException if the event could not be
+        read.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioLineEventRequest")
+
+        if timeout is None or timeout < 0:
+            timeout = -1
+
+        try:
+            if len(self.__poller.poll(timeout)) == 0:
+                return None
+
+            data = os.read(self.__fd, EVENT_DATA_SIZE)
+        except (IOError, OSError, select.error) as ex:
+            raise IOException(str(ex))
+
+        if len(data) < EVENT_DATA_SIZE:
+            raise IOException("Short read from line event.")
+
+        timestamp, event_id = struct.unpack(EVENT_DATA_FORMAT, data)
+        return GpioLineEvent(self.__offset, timestamp, event_id)
+
+    def dispose(self):
+        """Release the line."""
+        if self.is_disposed:
+            return
+
+        try:
+            os.close(self.__fd)
+        except OSError:
+            pass
+
+        self.__fd = None
+        Disposable.dispose(self)
+
+
+class GpioChip(Disposable):
+    """A GPIO character device (/dev/gpiochipN)."""
+
+    def __init__(self, path=DEFAULT_CHIP_PATH, ioctl_func=None, opener=None):
+        """Initialize a new instance of GpioChip.
+
+        :param str path: The character device path.
+        :param function ioctl_func: The ioctl function to use. Must accept
+        (fd, request, buf) and mutate buf in place. Defaults to fcntl.ioctl.
+        :param function opener: The function used to open the device. Must
+        accept the path and return a file descriptor. Defaults to os.open.
+        :raises: raspy.io.io_exception.IOException if the device could not be
+        opened or queried.
+        """
+        Disposable.__init__(self)
+        if ioctl_func is None:
+            ioctl_func = default_ioctl
+
+        if opener is None:
+            opener = default_opener
+
+        self.__path = path
+        self.__ioctl = ioctl_func
+        try:
+            self.__fd = opener(path)
+        except (IOError, OSError) as ex:
+            raise IOException("Unable to open " + path + ": " + str(ex))
+
+        buf = bytearray(struct.calcsize(CHIP_INFO_FORMAT))
+        try:
+            self.__ioctl(self.__fd, GET_CHIPINFO_IOCTL, buf)
+        except (IOError, OSError) as ex:
+            raise IOException(ex.strerror)
+
+        name, label, lines = struct.unpack(CHIP_INFO_FORMAT, bytes(buf))
+        self.__name = name.split(b"\0", 1)[0].decode("ascii")
+        self.__label = label.split(b"\0", 1)[0].decode("ascii")
+        self.__lines = lines
+
+    @property
+    def path(self):
+        """Get the character device path.
+
+        :returns: The device path.
+        :rtype: str
+        """
+        return self.__path
+
+    @property
+    def name(self):
+        """Get the kernel name of the chip.
+
+        :returns: The chip name.
+        :rtype: str
+        """
+        return self.__name
+
+    @property
+    def label(self):
+        """Get the label of the chip.
+
+        :returns: The chip label.
+        :rtype: str
+        """
+        return self.__label
+
+    @property
+    def lines(self):
+        """Get the number of lines on the chip.
+
+        :returns: The number of lines.
+        :rtype: int
+        """
+        return self.__lines
+
+    def request_lines(self, offsets, flags, default_values=None,
+                      consumer=CONSUMER_LABEL):
+        """Request one or more lines as a single handle.
+
+        :param list offsets: The line offsets to request.
+        :param int flags: The HANDLE_REQUEST_* flags.
+        :param list default_values: The initial output values, in the same
+        order as offsets. Default is all low.
+        :param str consumer: The consumer label.
+        :returns: The line handle.
+        :rtype: GpioLineHandle
+        :raises: raspy.argument_null_exception.ArgumentNullException if no
+        offsets were specified.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        more than MAX_LINES offsets were specified.
+        :raises: raspy.io.io_exception.IOException if the request failed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioChip")
+
+        if offsets is None or len(offsets) == 0:
+            raise ArgumentNullException("'offsets' param cannot be empty.")
+
+        count = len(offsets)
+        if count > MAX_LINES:
+            msg = "Cannot request more than " + str(MAX_LINES) + " lines."
+            raise IllegalArgumentException(msg)
+
+        if default_values is None:
+            default_values = [0] * count
+
+        values = [1 if v else 0 for v in default_values]
+        padded_offsets = list(offsets) + [0] * (MAX_LINES - count)
+        padded_values = values + [0] * (MAX_LINES - count)
+        args = padded_offsets + [flags] + padded_values
+        args += [consumer.encode("ascii"), count, -1]
+        buf = bytearray(struct.pack(HANDLE_REQUEST_FORMAT, *args))
+        try:
+            self.__ioctl(self.__fd, GET_LINEHANDLE_IOCTL, buf)
+        except (IOError, OSError) as ex:
+            raise IOException(ex.strerror)
+
+        fd = struct.unpack(HANDLE_REQUEST_FORMAT, bytes(buf))[-1]
+        return GpioLineHandle(fd, offsets, values, self.__ioctl)
+
+    def request_events(self, offset, event_flags,
+                       handle_flags=HANDLE_REQUEST_INPUT,
+                       consumer=CONSUMER_LABEL):
+        """Request a line for edge events.
+
+        :param int offset: The line offset to request.
+        :param int event_flags: The EVENT_REQUEST_* flags.
+        :param int handle_flags: The HANDLE_REQUEST_* flags.
+        :param str consumer: The consumer label.
+        :returns: The line event request.
+        :rtype: GpioLineEventRequest
+        :raises: raspy.io.io_exception.IOException if the request failed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioChip")
+
+        args = (offset, handle_flags, event_flags, consumer.encode("ascii"), -1)
+        buf = bytearray(struct.pack(EVENT_REQUEST_FORMAT, *args))
+        try:
+            self.__ioctl(self.__fd, GET_LINEEVENT_IOCTL, buf)
+        except (IOError, OSError) as ex:
+            raise IOException(ex.strerror)
+
+        fd = struct.unpack(EVENT_REQUEST_FORMAT, bytes(buf))[-1]
+        return GpioLineEventRequest(fd, offset, self.__ioctl)
+
+    def dispose(self):
+        """Close the character device."""
+        if self.is_disposed:
+            return
+
+        try:
+            os.close(self.__fd)
+        except OSError:
+            pass
+
+        self.__fd = None
+        Disposable.dispose(self)
@@ -0,0 +1,148 @@
+"""Process-wide registry of exported sysfs GPIO pins.
+
+Every raspy.io.gpio_standard.GpioStandard instance in the process shares this
+registry, which records the GPIO numbers that have been exported through the
+sysfs interface along with the direction each one was configured for. Once a
+pin is registered, hot-path reads and writes can skip the filesystem checks
+entirely and only genuine direction changes need to touch sysfs.
+"""
+
+
+import threading
+
+
+DIRECTION_IN = "in"
+"""The sysfs direction string for an input pin."""
+
+DIRECTION_OUT = "out"
+"""The sysfs direction string for an output pin."""
+
+_lock = threading.RLock()
+_directions = dict()
+_adoptedLevels = dict()
+_keepExported = False
+
+
+def get_lock():
+    """Get the lock that serializes export and direction changes.
+
+    :returns: The registry lock.
+    :rtype: threading.RLock
+    """
+    return _lock
+
+
+def get_direction(gpio_num):
+    """Get the direction the specified GPIO was exported with.
+
+    :param int gpio_num: The GPIO number.
+    :returns: The direction string (DIRECTION_IN or DIRECTION_OUT) if the
+    pin is exported; Otherwise, None.
+    :rtype: str
+    """
+    return _directions.get(gpio_num)
+
+
+def is_exported(gpio_num):
+    """Check to see if the specified GPIO has been exported.
+
+    :param int gpio_num: The GPIO number.
+    :returns: True if the pin is exported; Otherwise, False.
+    :rtype: bool
+    """
+    return gpio_num in _directions
+
+
+def register(gpio_num, direction):
+    """Record the specified GPIO as exported with the specified direction.
+
+    :param int gpio_num: The GPIO number.
+    :param str direction: The direction string (DIRECTION_IN or
+    DIRECTION_OUT).
+    """
+    with _lock:
+        _directions[gpio_num] = direction
+
+
+def unregister(gpio_num):
+    """Remove the specified GPIO from the registry.
+
+    :param int gpio_num: The GPIO number.
+    """
+    with _lock:
+        _directions.pop(gpio_num, None)
+        _adoptedLevels.pop(gpio_num, None)
+
+
+def get_exported_pins():
+    """Get a snapshot of all registered pins.
+
+    :returns: A dictionary of GPIO numbers to direction strings.
+    :rtype: dict
+    """
+    with _lock:
+        return dict(_directions)
+
+
+def clear():
+    """Remove all pins from the registry.
+
+    This does not unexport anything; it only forgets what has been recorded.
+    """
+    with _lock:
+        _directions.clear()
+        _adoptedLevels.clear()
+
+
+def adopt(gpio_num, direction, level=None):
+    """Record a GPIO left exported by a previous run of the process.
+
+    The pin is registered as exported, so provisioning it does not touch
+    the export or direction again. An output also keeps its level: the next
+    provision takes the level instead of writing the initial value.
+
+    :param int gpio_num: The GPIO number.
+    :param str direction: The direction string (DIRECTION_IN or
+    DIRECTION_OUT).
+    :param int level: The output level, or None for an input.
+    """
+    with _lock:
+        _directions[gpio_num] = direction
+        if level is None:
+            _adoptedLevels.pop(gpio_num, None)
+        else:
+            _adoptedLevels[gpio_num] = level
+
+
+def take_adopted_level(gpio_num):
+    """Get and forget the level an adopted output was found at.
+
+    :param int gpio_num: The GPIO number.
+    :returns: The level, or None if the pin was not adopted as an output or
+    its level has already been taken.
+    :rtype: int
+    """
+    with _lock:
+        return _adoptedLevels.pop(gpio_num, None)
+
+
+def is_keep_exported():
+    """Check to see if disposed pins are left exported.
+
+    :returns: True if pins are left exported; Otherwise, False.
+    :rtype: bool
+    """
+    return _keepExported
+
+
+def set_keep_exported(flag):
+    """Set whether disposed pins are left exported.
+
+    Set this before shutting down a service that will adopt its pins again
+    on restart (see raspy.io.gpio_standard.save_snapshot()), so outputs keep
+    their levels across the restart.
+
+    :param bool flag: Set True to leave pins exported on dispose.
+    """
+    global _keepExported
+    _keepExported = bool(flag)
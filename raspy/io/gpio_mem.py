@@ -0,0 +1,408 @@
+"""Raspberry Pi GPIO driven directly through the memory-mapped registers.
+
+The BCM283x GPIO register block is mapped into the process through
+/dev/gpiomem (which does not require root) and the function select, set,
+clear and level registers are accessed directly. A pin toggle is a single
+store to GPSET0/GPCLR0 with no system call involved, which makes this the
+fastest backend for bit-banged protocols.
+
+The mapping path is injectable so that a plain file of BLOCK_SIZE bytes can
+stand in for the device in tests and benchmarks.
+"""
+
+
+import mmap
+import os
+import struct
+import threading
+from raspy.disposable import Disposable
+from raspy.illegal_argument_exception import IllegalArgumentException
+from raspy.object_disposed_exception import ObjectDisposedException
+from raspy.io import gpio
+from raspy.io import gpio_pins
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.io import pin_stats
+from raspy.io.io_exception import IOException
+from raspy.io.pin_state_change_event import PinStateChangeEvent
+
+
+DEFAULT_MEM_PATH = "/dev/gpiomem"
+"""The default GPIO register device."""
+
+BLOCK_SIZE = 4096
+"""The size of the GPIO register block mapping."""
+
+MAX_GPIO = 53
+"""The highest GPIO number on the BCM283x."""
+
+GPFSEL0 = 0x00
+"""Function select register 0 (GPIO 0-9). GPFSEL1-5 follow at 4 byte
+intervals."""
+
+GPSET0 = 0x1C
+"""Pin output set register 0 (GPIO 0-31)."""
+
+GPSET1 = 0x20
+"""Pin output set register 1 (GPIO 32-53)."""
+
+GPCLR0 = 0x28
+"""Pin output clear register 0 (GPIO 0-31)."""
+
+GPCLR1 = 0x2C
+"""Pin output clear register 1 (GPIO 32-53)."""
+
+GPLEV0 = 0x34
+"""Pin level register 0 (GPIO 0-31)."""
+
+GPLEV1 = 0x38
+"""Pin level register 1 (GPIO 32-53)."""
+
+FSEL_INPUT = 0
+"""Function select value for an input."""
+
+FSEL_OUTPUT = 1
+"""Function select value for an output."""
+
+FSEL_ALT0 = 4
+"""Function select value for alternate function 0."""
+
+FSEL_ALT5 = 2
+"""Function select value for alternate function 5."""
+
+_REGISTER = struct.Struct("<I")
+_maps = dict()
+_mapsLock = threading.Lock()
+
+
+class GpioMemMap(Disposable):
+    """A memory mapping of the BCM283x GPIO register block."""
+
+    def __init__(self, path=DEFAULT_MEM_PATH, offset=0):
+        """Initialize a new instance of GpioMemMap.
+
+        :param str path: The device (or stand-in file) to map.
+        :param int offset: The offset of the GPIO block within the device.
+        Zero for /dev/gpiomem.
+        :raises: raspy.io.io_exception.IOException if the device could not be
+        opened or mapped.
+        """
+        Disposable.__init__(self)
+        self.__path = path
+        self.__lock = threading.Lock()
+        try:
+            self.__fd = os.open(path, os.O_RDWR | os.O_SYNC)
+        except OSError as ex:
+            raise IOException("Unable to open " + path + ": " + ex.strerror)
+
+        try:
+            prot = mmap.PROT_READ | mmap.PROT_WRITE
+            self.__map = mmap.mmap(self.__fd, BLOCK_SIZE, mmap.MAP_SHARED,
+                                   prot, offset=offset)
+        except (EnvironmentError, ValueError) as ex:
+            os.close(self.__fd)
+            raise IOException("Unable to map " + path + ": " + str(ex))
+
+    @property
+    def path(self):
+        """Get the mapped device path.
+
+        :returns: The device path.
+        :rtype: str
+        """
+        return self.__path
+
+    @property
+    def buffer(self):
+        """Get the underlying mapping.
+
+        :returns: The register block mapping.
+        :rtype: mmap.mmap
+        """
+        return self.__map
+
+    def read_register(self, offset):
+        """Read a 32-bit register.
+
+        :param int offset: The byte offset of the register.
+        :returns: The register value.
+        :rtype: int
+        """
+        return _REGISTER.unpack_from(self.__map, offset)[0]
+
+    def write_register(self, offset, value):
+        """Write a 32-bit register.
+
+        :param int offset: The byte offset of the register.
+        :param int value: The value to write.
+        """
+        _REGISTER.pack_into(self.__map, offset, value & 0xFFFFFFFF)
+
+    def get_function(self, gpio_num):
+        """Get the function select value of the specified GPIO.
+
+        :param int gpio_num: The GPIO number.
+        :returns: The function select value (FSEL_*).
+        :rtype: int
+        """
+        reg = GPFSEL0 + (gpio_num // 10) * 4
+        shift = (gpio_num % 10) * 3
+        return (self.read_register(reg) >> shift) & 0x07
+
+    def set_function(self, gpio_num, fsel):
+        """Set the function select value of the specified GPIO.
+
+        The read-modify-write of the shared GPFSEL register is serialized so
+        that pins configured concurrently don't clobber each other.
+
+        :param int gpio_num: The GPIO number.
+        :param int fsel: The function select value (FSEL_*).
+        """
+        reg = GPFSEL0 + (gpio_num // 10) * 4
+        shift = (gpio_num % 10) * 3
+        with self.__lock:
+            val = self.read_register(reg)
+            val = (val & ~(0x07 << shift)) | ((fsel & 0x07) << shift)
+            self.write_register(reg, val)
+
+    def set_bits(self, mask):
+        """Drive every GPIO whose bit is set in mask high.
+
+        :param int mask: The bit mask of GPIO numbers (bit N = GPIO N).
+        """
+        if mask & 0xFFFFFFFF:
+            _REGISTER.pack_into(self.__map, GPSET0, mask & 0xFFFFFFFF)
+
+        if mask >> 32:
+            _REGISTER.pack_into(self.__map, GPSET1, (mask >> 32) & 0xFFFFFFFF)
+
+    def clear_bits(self, mask):
+        """Drive every GPIO whose bit is set in mask low.
+
+        :param int mask: The bit mask of GPIO numbers (bit N = GPIO N).
+        """
+        if mask & 0xFFFFFFFF:
+            _REGISTER.pack_into(self.__map, GPCLR0, mask & 0xFFFFFFFF)
+
+        if mask >> 32:
+            _REGISTER.pack_into(self.__map, GPCLR1, (mask >> 32) & 0xFFFFFFFF)
+
+    def write_masked(self, mask, value):
+        """Drive the GPIOs selected by mask to the levels given by value.
+
+        At most one GPSET and one GPCLR store is needed per 32-pin bank.
+
+        :param int mask: The bit mask of GPIO numbers to change.
+        :param int value: The bit values to drive them to.
+        """
+        self.set_bits(mask & value)
+        self.clear_bits(mask & ~value)
+
+    def levels(self):
+        """Read the level of every GPIO.
+
+        :returns: A bit mask of the GPIO levels (bit N = GPIO N).
+        :rtype: int
+        """
+        low = _REGISTER.unpack_from(self.__map, GPLEV0)[0]
+        high = _REGISTER.unpack_from(self.__map, GPLEV1)[0]
+        return low | (high << 32)
+
+    def dispose(self):
+        """Unmap the register block and close the device."""
+        if self.is_disposed:
+            return
+
+        self.__map.close()
+        os.close(self.__fd)
+        self.__map = None
+        self.__fd = None
+        Disposable.dispose(self)
+
+
+def get_mem_map(path=DEFAULT_MEM_PATH):
+    """Get the shared register mapping for the specified path.
+
+    :param str path: The device (or stand-in file) to map.
+    :returns: The register mapping. The same mapping is returned for every
+    call with the same path until it is disposed.
+    :rtype: GpioMemMap
+    :raises: raspy.io.io_exception.IOException if the device could not be
+    opened or mapped.
+    """
+    with _mapsLock:
+        mem_map = _maps.get(path)
+        if mem_map is None or mem_map.is_disposed:
+            mem_map = GpioMemMap(path)
+            _maps[path] = mem_map
+
+        return mem_map
+
+
+class GpioMem(gpio.Gpio):
+    """Raspberry Pi GPIO using direct register access."""
+
+    def __init__(self, pn, mode, initial_val, mem_map=None):
+        """Initialize a new instance of raspy.io.gpio_mem.GpioMem.
+
+        :param raspy.io.gpio_pins.GpioPin pn: The GPIO pin.
+        :param int mode: The I/O pin mode.
+        :param int initial_val: The initial pin value.
+        :param GpioMemMap mem_map: The register mapping to use. If None, the
+        shared mapping of DEFAULT_MEM_PATH is used.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        the pin is not a valid BCM283x GPIO.
+        """
+        gpio.Gpio.__init__(self, pn, mode, initial_val)
+        num = self.inner_pin.value
+        if num != gpio_pins.GpioNone.value and (num < 0 or num > MAX_GPIO):
+            msg = "GPIO " + str(num) + " is not a valid BCM283x GPIO."
+            raise IllegalArgumentException(msg)
+
+        self.__memMap = mem_map
+        self.__lastState = pin_state.LOW
+        self.__bit = 0
+        self.__setOffset = GPSET0
+        self.__clrOffset = GPCLR0
+        self.__levOffset = GPLEV0
+        if num >= 32:
+            self.__setOffset = GPSET1
+            self.__clrOffset = GPCLR1
+            self.__levOffset = GPLEV1
+
+        if num >= 0:
+            self.__bit = 1 << (num % 32)
+
+    @property
+    def mem_map(self):
+        """Get the register mapping used by this pin.
+
+        :returns: The register mapping.
+        :rtype: GpioMemMap
+        """
+        if self.__memMap is None:
+            self.__memMap = get_mem_map()
+
+        return self.__memMap
+
+    @property
+    def mask(self):
+        """Get the bit mask of this pin in the 64-bit GPIO space.
+
+        :returns: The pin mask (bit N = GPIO N), or 0 for GpioNone.
+        :rtype: int
+        """
+        num = self.inner_pin.value
+        if num < 0:
+            return 0
+
+        return 1 << num
+
+    def provision(self):
+        """Provision this pin.
+
+        Sets the function select of the pin to input or output and drives
+        outputs to their initial value.
+
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioMem")
+
+        num = self.inner_pin.value
+        if num == gpio_pins.GpioNone.value:
+            return
+
+        if self._defer_provision():
+            return
+
+        start = self._op_start()
+        if self.mode == pin_mode.IN:
+            self.mem_map.set_function(num, FSEL_INPUT)
+            self._op_end(pin_stats.OP_EXPORT, start)
+            return
+
+        init_val = self.get_initial_pin_value()
+        self.__store(init_val)
+        self.mem_map.set_function(num, FSEL_OUTPUT)
+        self._op_end(pin_stats.OP_EXPORT, start)
+        self.__lastState = init_val
+
+    def __store(self, ps):
+        """Store to the set or clear register for this pin.
+
+        :param int ps: The pin state to drive.
+        """
+        if self.__bit == 0:
+            return
+
+        offset = self.__clrOffset
+        if ps == pin_state.HIGH:
+            offset = self.__setOffset
+
+        _REGISTER.pack_into(self.mem_map.buffer, offset, self.__bit)
+
+    def write(self, ps):
+        """Write a value to the pin.
+
+        :param int ps: The pin state value to write to the pin.
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        gpio.Gpio.write(self, ps)
+        start = self._op_start()
+        self.__store(ps)
+        self._op_end(pin_stats.OP_WRITE, start)
+        if self.__lastState != ps:
+            pin_addr = self.inner_pin.value
+            evt = PinStateChangeEvent(self.__lastState, ps, pin_addr)
+            self.__lastState = ps
+            self.on_pin_state_change(evt)
+
+    def read(self):
+        """Read a value from the pin.
+
+        :returns: The state (value) of the pin.
+        :rtype: int
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioMem")
+
+        self.ensure_provisioned()
+        val = pin_state.LOW
+        start = self._op_start()
+        buf = self.mem_map.buffer
+        if _REGISTER.unpack_from(buf, self.__levOffset)[0] & self.__bit:
+            val = pin_state.HIGH
+
+        self._op_end(pin_stats.OP_READ, start)
+
+        if self.__lastState != val:
+            pin_addr = self.inner_pin.value
+            evt = PinStateChangeEvent(self.__lastState, val, pin_addr)
+            self.__lastState = val
+            self.on_pin_state_change(evt)
+
+        return val
+
+    def dispose(self):
+        """Dispose managed resources.
+
+        Drives outputs low and returns the pin to an input. The shared
+        register mapping is left open.
+        """
+        if self.is_disposed:
+            return
+
+        num = self.inner_pin.value
+        if num != gpio_pins.GpioNone.value and self.__memMap is not None:
+            if self.mode != pin_mode.IN:
+                self.__store(pin_state.LOW)
+
+            self.__memMap.set_function(num, FSEL_INPUT)
+
+        self.__memMap = None
+        gpio.Gpio.dispose(self)
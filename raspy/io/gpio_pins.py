@@ -24,829 +24,398 @@ pi connector P1 pin    = GPIOnum
                 P1-26 = GPIO7
 So to turn on Pin7 on the GPIO connector, pass in GpioPins.Gpio04 as
 the pin parameter.
-"""
-
-
-class GpioPin:
-    """Base type for GPIO pins."""
-
-    def __init__(self):
-        """ctor."""
-        pass
-
-    value = -1
-    name = ""
-
-
-class GpioNone(GpioPin):
-    """No pin (null)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = -1
-    name = "GpioNone"
-
-
-class Gpio00(GpioPin):
-    """GPIO 00 (pin P1-03)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 0
-    name = "Gpio00"
-
-
-class Gpio01(GpioPin):
-    """GPIO 01 (pin P1-05)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 1
-    name = "Gpio01"
-
-
-class Gpio04(GpioPin):
-    """GPIO 04 (pin P1-07)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 4
-    name = "Gpio04"
-
-
-class Gpio07(GpioPin):
-    """GPIO 07 (pin P1-26)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 7
-    name = "Gpio07"
-
-
-class Gpio08(GpioPin):
-    """GPIO 08 (pin P1-24)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 8
-    name = "Gpio08"
-
-
-class Gpio09(GpioPin):
-    """GPIO 09 (pin P1-21)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 9
-    name = "Gpio09"
-
-
-class Gpio10(GpioPin):
-    """GPIO 10 (pin P1-19)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 10
-    name = "Gpio10"
-
-
-class Gpio11(GpioPin):
-    """GPIO 11 (pin P1-23)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 11
-    name = "Gpio11"
-
-
-class Gpio14(GpioPin):
-    """GPIO 14 (pin P1-08)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 14
-    name = "Gpio14"
-
-
-class Gpio15(GpioPin):
-    """GPIO 15 (pin P1-10)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 15
-    name = "Gpio15"
-
-
-class Gpio17(GpioPin):
-    """GPIO 17 (pin P1-11)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 17
-    name = "Gpio17"
-
-
-class Gpio18(GpioPin):
-    """GPIO 18 (pin P1-12)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 18
-    name = "Gpio18"
-
-
-class Gpio21(GpioPin):
-    """GPIO 21 (pin P1-13)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 21
-    name = "Gpio21"
-
-
-class Gpio22(GpioPin):
-    """GPIO 22 (pin P1-15)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 22
-    name = "Gpio22"
-
-
-class Gpio23(GpioPin):
-    """GPIO 23 (pin P1-16)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 23
-    name = "Gpio23"
-
-
-class Gpio24(GpioPin):
-    """GPIO 24 (pin P1-18)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 24
-    name = "Gpio24"
-
-
-class Gpio25(GpioPin):
-    """GPIO 25 (pin P1-22)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 25
-    name = "Gpio25"
-
-
-class Pin03(GpioPin):
-    """Pin 3."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 0
-    name = "Pin03"
-
-
-class Pin05(GpioPin):
-    """Pin 5."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 1
-    name = "Pin05"
-
-
-class Pin07(GpioPin):
-    """Pin 7."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 4
-    name = "Pin07"
-
-
-class Pin08(GpioPin):
-    """Pin 8."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 14
-    name = "Pin08"
 
-
-class Pin10(GpioPin):
-    """Pin 10."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 15
-    name = "Pin10"
-
-
-class Pin11(GpioPin):
-    """Pin 11."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 17
-    name = "Pin11"
-
-
-class Pin12(GpioPin):
-    """Pin 12."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 18
-    name = "Pin12"
-
-
-class Pin13(GpioPin):
-    """Pin 13."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 21
-    name = "Pin13"
-
-
-class Pin15(GpioPin):
-    """Pin 15."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 22
-    name = "Pin15"
-
-
-class Pin16(GpioPin):
-    """Pin 16."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 23
-    name = "Pin16"
-
-
-class Pin18(GpioPin):
-    """Pin 18."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 24
-    name = "Pin18"
-
-
-class Pin19(GpioPin):
-    """Pin 19."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 10
-    name = "Pin19"
-
-
-class Pin21(GpioPin):
-    """Pin 21."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 9
-    name = "Pin21"
-
-
-class Pin22(GpioPin):
-    """Pin 22."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 25
-    name = "Pin22"
-
-
-class Pin23(GpioPin):
-    """Pin 23."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 11
-    name = "Pin23"
-
-
-class Pin24(GpioPin):
-    """Pin 24."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 8
-    name = "Pin24"
-
-
-class Pin26(GpioPin):
-    """Pin 26."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 7
-    name = "Pin26"
-
-
-class Led(GpioPin):
-    """led driver pin."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 16
-    name = "led"
-
-
-class V2Gpio02(GpioPin):
-    """Rev 2 GPIO 02 (P1-03)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 2
-    name = "V2Gpio02"
-
-
-class V2Gpio03(GpioPin):
-    """Rev 2 GPIO 03 (P1-05)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 3
-    name = "V2Gpio03"
-
-
-class V2Gpio04(GpioPin):
-    """Rev 2 GPIO 04 (pin P1-07)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 4
-    name = "V2Gpio04"
-
-
-class V2Gpio07(GpioPin):
-    """Rev 2 GPIO 07 (pin P1-26)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 7
-    name = "V2Gpio07"
-
-
-class V2Gpio08(GpioPin):
-    """Rev 2 GPIO 08 (pin P1-24)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 8
-    name = "V2Gpio08"
-
-
-class V2Gpio09(GpioPin):
-    """Rev GPIO 09 (pin P1-21)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 9
-    name = "V2Gpio09"
-
-
-class V2Gpio10(GpioPin):
-    """Rev 2 GPIO 10 (pin P1-19)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 10
-    name = "V2Gpio10"
-
-
-class V2Gpio11(GpioPin):
-    """Rev 2 GPIO 11 (pin P1-23)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 11
-    name = "V2Gpio11"
-
-
-class V2Gpio14(GpioPin):
-    """Rev 2 GPIO 14 (pin P1-08)."""
-
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
-
-    value = 14
-    name = "V2Gpio14"
+Each pin is a single shared raspy.io.gpio_pins.GpioPin descriptor. Pins can
+be looked up by BCM number, header position or name with the get_* functions
+below, and compared by identity or set membership. A pin called like a
+function returns itself, so Gpio17() and Gpio17 are the same pin.
+"""
 
 
-class V2Gpio15(GpioPin):
-    """Rev 2 GPIO 15 (pin P1-10)."""
+from raspy import board_revision
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
 
-    value = 15
-    name = "V2Gpio15"
+class GpioPin(object):
+    """A GPIO pin on the Raspberry Pi."""
 
+    __slots__ = ("__value", "__name", "__header", "__revision")
 
-class V2Gpio17(GpioPin):
-    """Rev 2 GPIO 17 (pin P1-11)."""
+    def __init__(self, value, name, header=None, revision=None):
+        """Initialize a new instance of raspy.io.gpio_pins.GpioPin.
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+        :param int value: The BCM GPIO number, or -1 for no pin.
+        :param str name: The pin name.
+        :param str header: The header position (such as "P1-11"), or None
+        if the pin is not on a header.
+        :param int revision: The board revision (a raspy.board_revision
+        value) the pin belongs to, or None if it is the same on all
+        revisions.
+        """
+        self.__value = value
+        self.__name = name
+        self.__header = header
+        self.__revision = revision
 
-    value = 17
-    name = "V2Gpio17"
+    def __call__(self):
+        """Get this pin.
 
+        Pins used to be classes that were instantiated to get the pin.
 
-class V2Gpio18(GpioPin):
-    """Rev 2 GPIO 18 (pin P1-12)."""
+        :returns: This pin.
+        :rtype: GpioPin
+        """
+        return self
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+    def __repr__(self):
+        """Get the string representation of this pin.
 
-    value = 18
-    name = "V2Gpio18"
+        :returns: The pin name.
+        :rtype: str
+        """
+        return "GpioPin(" + self.__name + ")"
 
+    @property
+    def value(self):
+        """Get the BCM GPIO number.
 
-class V2Gpio22(GpioPin):
-    """Rev 2 GPIO 22 (pin P1-15)."""
+        :returns: The GPIO number, or -1 for no pin.
+        :rtype: int
+        """
+        return self.__value
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+    @property
+    def name(self):
+        """Get the pin name.
 
-    value = 22
-    name = "V2Gpio22"
+        :returns: The name.
+        :rtype: str
+        """
+        return self.__name
 
+    @property
+    def header(self):
+        """Get the header position.
 
-class V2Gpio23(GpioPin):
-    """Rev 2 GPIO 23 (pin P1-16)."""
+        :returns: The header position (such as "P1-11"), or None if the pin
+        is not on a header.
+        :rtype: str
+        """
+        return self.__header
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+    @property
+    def revision(self):
+        """Get the board revision the pin belongs to.
 
-    value = 23
-    name = "V2Gpio23"
+        :returns: The board revision, or None if the pin is the same on all
+        revisions.
+        :rtype: int
+        """
+        return self.__revision
 
 
-class V2Gpio24(GpioPin):
-    """Rev 2 GPIO 24 (pin P1-18)."""
+GpioNone = GpioPin(-1, "GpioNone")
+"""No pin (null)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+Gpio00 = GpioPin(0, "Gpio00", "P1-03", board_revision.REV1)
+"""GPIO 00 (pin P1-03)."""
 
-    value = 24
-    name = "V2Gpio24"
+Gpio01 = GpioPin(1, "Gpio01", "P1-05", board_revision.REV1)
+"""GPIO 01 (pin P1-05)."""
 
+Gpio04 = GpioPin(4, "Gpio04", "P1-07", board_revision.REV1)
+"""GPIO 04 (pin P1-07)."""
 
-class V2Gpio25(GpioPin):
-    """Rev 2 GPIO 25 (pin P1-22)."""
+Gpio07 = GpioPin(7, "Gpio07", "P1-26", board_revision.REV1)
+"""GPIO 07 (pin P1-26)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+Gpio08 = GpioPin(8, "Gpio08", "P1-24", board_revision.REV1)
+"""GPIO 08 (pin P1-24)."""
 
-    value = 25
-    name = "V2Gpio25"
+Gpio09 = GpioPin(9, "Gpio09", "P1-21", board_revision.REV1)
+"""GPIO 09 (pin P1-21)."""
 
+Gpio10 = GpioPin(10, "Gpio10", "P1-19", board_revision.REV1)
+"""GPIO 10 (pin P1-19)."""
 
-class V2Gpio27(GpioPin):
-    """Rev 2 GPIO 27 (pin P1 - 13)."""
+Gpio11 = GpioPin(11, "Gpio11", "P1-23", board_revision.REV1)
+"""GPIO 11 (pin P1-23)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+Gpio14 = GpioPin(14, "Gpio14", "P1-08", board_revision.REV1)
+"""GPIO 14 (pin P1-08)."""
 
-    value = 27
-    name = "V2Gpio27"
+Gpio15 = GpioPin(15, "Gpio15", "P1-10", board_revision.REV1)
+"""GPIO 15 (pin P1-10)."""
 
+Gpio17 = GpioPin(17, "Gpio17", "P1-11", board_revision.REV1)
+"""GPIO 17 (pin P1-11)."""
 
-class V2Pin03(GpioPin):
-    """Rev 2 Pin 3 (GPIO 02)."""
+Gpio18 = GpioPin(18, "Gpio18", "P1-12", board_revision.REV1)
+"""GPIO 18 (pin P1-12)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+Gpio21 = GpioPin(21, "Gpio21", "P1-13", board_revision.REV1)
+"""GPIO 21 (pin P1-13)."""
 
-    value = 2
-    name = "V2Pin03"
+Gpio22 = GpioPin(22, "Gpio22", "P1-15", board_revision.REV1)
+"""GPIO 22 (pin P1-15)."""
 
+Gpio23 = GpioPin(23, "Gpio23", "P1-16", board_revision.REV1)
+"""GPIO 23 (pin P1-16)."""
 
-class V2Pin05(GpioPin):
-    """Rev 2 Pin 05 (GPIO 03)."""
+Gpio24 = GpioPin(24, "Gpio24", "P1-18", board_revision.REV1)
+"""GPIO 24 (pin P1-18)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+Gpio25 = GpioPin(25, "Gpio25", "P1-22", board_revision.REV1)
+"""GPIO 25 (pin P1-22)."""
 
-    value = 3
-    name = "V2Pin05"
+Pin03 = GpioPin(0, "Pin03", "P1-03", board_revision.REV1)
+"""Pin 3."""
 
+Pin05 = GpioPin(1, "Pin05", "P1-05", board_revision.REV1)
+"""Pin 5."""
 
-class V2Pin07(GpioPin):
-    """Rev 2 Pin 01 (GPIO 04)."""
+Pin07 = GpioPin(4, "Pin07", "P1-07", board_revision.REV1)
+"""Pin 7."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+Pin08 = GpioPin(14, "Pin08", "P1-08", board_revision.REV1)
+"""Pin 8."""
 
-    value = 4
-    name = "V2Pin07"
+Pin10 = GpioPin(15, "Pin10", "P1-10", board_revision.REV1)
+"""Pin 10."""
 
+Pin11 = GpioPin(17, "Pin11", "P1-11", board_revision.REV1)
+"""Pin 11."""
 
-class V2Pin08(GpioPin):
-    """Rev 2 Pin 08 (GPIO 14)."""
+Pin12 = GpioPin(18, "Pin12", "P1-12", board_revision.REV1)
+"""Pin 12."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+Pin13 = GpioPin(21, "Pin13", "P1-13", board_revision.REV1)
+"""Pin 13."""
 
-    value = 14
-    name = "V2Pin08"
+Pin15 = GpioPin(22, "Pin15", "P1-15", board_revision.REV1)
+"""Pin 15."""
 
+Pin16 = GpioPin(23, "Pin16", "P1-16", board_revision.REV1)
+"""Pin 16."""
 
-class V2Pin10(GpioPin):
-    """Rev 2 Pin 10 (GPIO 15)."""
+Pin18 = GpioPin(24, "Pin18", "P1-18", board_revision.REV1)
+"""Pin 18."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+Pin19 = GpioPin(10, "Pin19", "P1-19", board_revision.REV1)
+"""Pin 19."""
 
-    value = 15
-    name = "V2Pin10"
+Pin21 = GpioPin(9, "Pin21", "P1-21", board_revision.REV1)
+"""Pin 21."""
 
+Pin22 = GpioPin(25, "Pin22", "P1-22", board_revision.REV1)
+"""Pin 22."""
 
-class V2Pin11(GpioPin):
-    """Rev 2 Pin 11 (GPIO 17)."""
+Pin23 = GpioPin(11, "Pin23", "P1-23", board_revision.REV1)
+"""Pin 23."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+Pin24 = GpioPin(8, "Pin24", "P1-24", board_revision.REV1)
+"""Pin 24."""
 
-    value = 17
-    name = "V2Pin11"
+Pin26 = GpioPin(7, "Pin26", "P1-26", board_revision.REV1)
+"""Pin 26."""
 
+Led = GpioPin(16, "led")
+"""led driver pin."""
 
-class V2Pin12(GpioPin):
-    """Rev 2 Pin 12 (GPIO 18)."""
+V2Gpio02 = GpioPin(2, "V2Gpio02", "P1-03", board_revision.REV2)
+"""Rev 2 GPIO 02 (P1-03)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+V2Gpio03 = GpioPin(3, "V2Gpio03", "P1-05", board_revision.REV2)
+"""Rev 2 GPIO 03 (P1-05)."""
 
-    value = 18
-    name = "V2Pin12"
+V2Gpio04 = GpioPin(4, "V2Gpio04", "P1-07", board_revision.REV2)
+"""Rev 2 GPIO 04 (pin P1-07)."""
 
+V2Gpio07 = GpioPin(7, "V2Gpio07", "P1-26", board_revision.REV2)
+"""Rev 2 GPIO 07 (pin P1-26)."""
 
-class V2Pin13(GpioPin):
-    """Rev 2 Pin 13 (GPIO 27)."""
+V2Gpio08 = GpioPin(8, "V2Gpio08", "P1-24", board_revision.REV2)
+"""Rev 2 GPIO 08 (pin P1-24)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+V2Gpio09 = GpioPin(9, "V2Gpio09", "P1-21", board_revision.REV2)
+"""Rev GPIO 09 (pin P1-21)."""
 
-    value = 27
-    name = "V2Pin13"
+V2Gpio10 = GpioPin(10, "V2Gpio10", "P1-19", board_revision.REV2)
+"""Rev 2 GPIO 10 (pin P1-19)."""
 
+V2Gpio11 = GpioPin(11, "V2Gpio11", "P1-23", board_revision.REV2)
+"""Rev 2 GPIO 11 (pin P1-23)."""
 
-class V2Pin15(GpioPin):
-    """Rev 2 Pin 15 (GPIO 22)."""
+V2Gpio14 = GpioPin(14, "V2Gpio14", "P1-08", board_revision.REV2)
+"""Rev 2 GPIO 14 (pin P1-08)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+V2Gpio15 = GpioPin(15, "V2Gpio15", "P1-10", board_revision.REV2)
+"""Rev 2 GPIO 15 (pin P1-10)."""
 
-    value = 22
-    name = "V2Pin15"
+V2Gpio17 = GpioPin(17, "V2Gpio17", "P1-11", board_revision.REV2)
+"""Rev 2 GPIO 17 (pin P1-11)."""
 
+V2Gpio18 = GpioPin(18, "V2Gpio18", "P1-12", board_revision.REV2)
+"""Rev 2 GPIO 18 (pin P1-12)."""
 
-class V2Pin16(GpioPin):
-    """Rev 2 Pin 16 (GPIO 23)."""
+V2Gpio22 = GpioPin(22, "V2Gpio22", "P1-15", board_revision.REV2)
+"""Rev 2 GPIO 22 (pin P1-15)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+V2Gpio23 = GpioPin(23, "V2Gpio23", "P1-16", board_revision.REV2)
+"""Rev 2 GPIO 23 (pin P1-16)."""
 
-    value = 23
-    name = "V2Pin16"
+V2Gpio24 = GpioPin(24, "V2Gpio24", "P1-18", board_revision.REV2)
+"""Rev 2 GPIO 24 (pin P1-18)."""
 
+V2Gpio25 = GpioPin(25, "V2Gpio25", "P1-22", board_revision.REV2)
+"""Rev 2 GPIO 25 (pin P1-22)."""
 
-class V2Pin18(GpioPin):
-    """Rev 2 Pin 18 (GPIO 24)."""
+V2Gpio27 = GpioPin(27, "V2Gpio27", "P1-13", board_revision.REV2)
+"""Rev 2 GPIO 27 (pin P1 - 13)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+V2Pin03 = GpioPin(2, "V2Pin03", "P1-03", board_revision.REV2)
+"""Rev 2 Pin 3 (GPIO 02)."""
 
-    value = 24
-    name = "V2Pin18"
+V2Pin05 = GpioPin(3, "V2Pin05", "P1-05", board_revision.REV2)
+"""Rev 2 Pin 05 (GPIO 03)."""
 
+V2Pin07 = GpioPin(4, "V2Pin07", "P1-07", board_revision.REV2)
+"""Rev 2 Pin 01 (GPIO 04)."""
 
-class V2Pin19(GpioPin):
-    """Rev 2 Pin 19 (GPIO 10)."""
+V2Pin08 = GpioPin(14, "V2Pin08", "P1-08", board_revision.REV2)
+"""Rev 2 Pin 08 (GPIO 14)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+V2Pin10 = GpioPin(15, "V2Pin10", "P1-10", board_revision.REV2)
+"""Rev 2 Pin 10 (GPIO 15)."""
 
-    value = 10
-    name = "V2Pin19"
+V2Pin11 = GpioPin(17, "V2Pin11", "P1-11", board_revision.REV2)
+"""Rev 2 Pin 11 (GPIO 17)."""
 
+V2Pin12 = GpioPin(18, "V2Pin12", "P1-12", board_revision.REV2)
+"""Rev 2 Pin 12 (GPIO 18)."""
 
-class V2Pin21(GpioPin):
-    """Rev 2 Pin 21 (GPIO 09)."""
+V2Pin13 = GpioPin(27, "V2Pin13", "P1-13", board_revision.REV2)
+"""Rev 2 Pin 13 (GPIO 27)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+V2Pin15 = GpioPin(22, "V2Pin15", "P1-15", board_revision.REV2)
+"""Rev 2 Pin 15 (GPIO 22)."""
 
-    value = 9
-    name = "V2Pin21"
+V2Pin16 = GpioPin(23, "V2Pin16", "P1-16", board_revision.REV2)
+"""Rev 2 Pin 16 (GPIO 23)."""
 
+V2Pin18 = GpioPin(24, "V2Pin18", "P1-18", board_revision.REV2)
+"""Rev 2 Pin 18 (GPIO 24)."""
 
-class V2Pin22(GpioPin):
-    """Rev 2 Pin 22 (GPIO 25)."""
+V2Pin19 = GpioPin(10, "V2Pin19", "P1-19", board_revision.REV2)
+"""Rev 2 Pin 19 (GPIO 10)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+V2Pin21 = GpioPin(9, "V2Pin21", "P1-21", board_revision.REV2)
+"""Rev 2 Pin 21 (GPIO 09)."""
 
-    value = 25
-    name = "V2Pin22"
+V2Pin22 = GpioPin(25, "V2Pin22", "P1-22", board_revision.REV2)
+"""Rev 2 Pin 22 (GPIO 25)."""
 
+V2Pin23 = GpioPin(11, "V2Pin23", "P1-23", board_revision.REV2)
+"""Rev 2 Pin 23 (GPIO 11)."""
 
-class V2Pin23(GpioPin):
-    """Rev 2 Pin 23 (GPIO 11)."""
+V2Pin24 = GpioPin(8, "V2Pin24", "P1-24", board_revision.REV2)
+"""Rev 2 Pin 24 (GPIO 08)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+V2Pin26 = GpioPin(7, "V2Pin26", "P1-26", board_revision.REV2)
+"""Rev 2 Pin 26 (GPIO 07)."""
 
-    value = 11
-    name = "V2Pin23"
+V2P5Pin03 = GpioPin(28, "V2P5Pin03", "P5-03", board_revision.REV2)
+"""Rev 2 P5 header GPIO 28 (P5-03)."""
 
+V2P5Pin04 = GpioPin(29, "V2P5Pin04", "P5-04", board_revision.REV2)
+"""Rev 2 P5 header GPIO 29 (P5-04)."""
 
-class V2Pin24(GpioPin):
-    """Rev 2 Pin 24 (GPIO 08)."""
+V2P5Pin05 = GpioPin(30, "V2P5Pin05", "P5-05", board_revision.REV2)
+"""Rev 2 P5 header GPIO 30 (P5-05)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+V2P5Pin06 = GpioPin(31, "V2P5Pin06", "P5-06", board_revision.REV2)
+"""Rev 2 P5 header GPIO 31 (P5-06)."""
 
-    value = 8
-    name = "V2Pin24"
+ALL = (
+    GpioNone, Gpio00, Gpio01, Gpio04, Gpio07, Gpio08, Gpio09, Gpio10, Gpio11,
+    Gpio14, Gpio15, Gpio17, Gpio18, Gpio21, Gpio22, Gpio23, Gpio24, Gpio25,
+    Pin03, Pin05, Pin07, Pin08, Pin10, Pin11, Pin12, Pin13, Pin15, Pin16,
+    Pin18, Pin19, Pin21, Pin22, Pin23, Pin24, Pin26, Led, V2Gpio02, V2Gpio03,
+    V2Gpio04, V2Gpio07, V2Gpio08, V2Gpio09, V2Gpio10, V2Gpio11, V2Gpio14,
+    V2Gpio15, V2Gpio17, V2Gpio18, V2Gpio22, V2Gpio23, V2Gpio24, V2Gpio25,
+    V2Gpio27, V2Pin03, V2Pin05, V2Pin07, V2Pin08, V2Pin10, V2Pin11, V2Pin12,
+    V2Pin13, V2Pin15, V2Pin16, V2Pin18, V2Pin19, V2Pin21, V2Pin22, V2Pin23,
+    V2Pin24, V2Pin26, V2P5Pin03, V2P5Pin04, V2P5Pin05, V2P5Pin06
+)
+"""All pins, in definition order."""
 
+_byName = {}
+_byValue = {}
+_byHeader = {}
 
-class V2Pin26(GpioPin):
-    """Rev 2 Pin 26 (GPIO 07)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+def _build_index():
+    """Build the lookup tables.
 
-    value = 7
-    name = "V2Pin26"
+    The GpioNN pins come before their PinNN aliases, so lookups by number
+    or header return the GpioNN pin.
+    """
+    revisions = (board_revision.REV1, board_revision.REV2)
+    for pin in ALL:
+        _byName[pin.name] = pin
+        if pin.value < 0:
+            continue
 
+        for rev in revisions:
+            if pin.revision is not None and pin.revision != rev:
+                continue
 
-class V2P5Pin03(GpioPin):
-    """Rev 2 P5 header GPIO 28 (P5-03)."""
+            _byValue.setdefault((rev, pin.value), pin)
+            if pin.header is not None:
+                _byHeader.setdefault((rev, pin.header), pin)
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
 
-    value = 28
-    name = "V2P5Pin03"
+_build_index()
 
 
-class V2P5Pin04(GpioPin):
-    """Rev 2 P5 header GPIO 29 (P5-04)."""
+def get_by_name(name):
+    """Get a pin by name.
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+    :param str name: The pin name (such as "Gpio17" or "V2Pin11").
+    :returns: The pin, or GpioNone if there is no such pin.
+    :rtype: GpioPin
+    """
+    return _byName.get(name, GpioNone)
 
-    value = 29
-    name = "V2P5Pin04"
 
+def get_by_value(value, revision=board_revision.REV2):
+    """Get a pin by BCM GPIO number.
 
-class V2P5Pin05(GpioPin):
-    """Rev 2 P5 header GPIO 30 (P5-05)."""
+    :param int value: The GPIO number.
+    :param int revision: The board revision. Default is REV2.
+    :returns: The pin, or GpioNone if the board has no such pin.
+    :rtype: GpioPin
+    """
+    return _byValue.get((revision, value), GpioNone)
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
 
-    value = 30
-    name = "V2P5Pin05"
+def get_by_header(header, revision=board_revision.REV2):
+    """Get a pin by header position.
 
+    :param str header: The header position (such as "P1-11").
+    :param int revision: The board revision. Default is REV2.
+    :returns: The pin, or GpioNone if there is no GPIO at that position.
+    :rtype: GpioPin
+    """
+    return _byHeader.get((revision, header), GpioNone)
 
-class V2P5Pin06(GpioPin):
-    """Rev 2 P5 header GPIO 31 (P5-06)."""
 
-    def __init__(self):
-        """ctor."""
-        GpioPin.__init__(self)
+def get_pins(revision=board_revision.REV2):
+    """Get the GPIO pins of a board revision.
 
-    value = 31
-    name = "V2P5Pin06"
+    :param int revision: The board revision. Default is REV2.
+    :returns: The pins, ordered by GPIO number.
+    :rtype: tuple
+    """
+    pins = [pin for (rev, _value), pin in _byValue.items() if rev == revision]
+    pins.sort(key=lambda pin: pin.value)
+    return tuple(pins)
@@ -0,0 +1,447 @@
+"""Off-device GPIO simulation.
+
+SysfsSimulator builds a stand-in for /sys/class/gpio (and /sys/class/pwm) in
+a temporary directory, preferably on tmpfs, and points GpioStandard and
+SysfsPwm at it. Writes to the export and unexport control files create and
+remove the gpioN directories just as the kernel does, so the real
+GpioStandard code paths run unchanged, with real open/read/write/lseek
+system calls, on machines that have no GPIO at all. Since a regular file
+never raises the POLLPRI the kernel uses to signal an edge, set_input()
+notifies interrupt waiters through a pipe per pin instead, honoring the
+edge written to the pin.
+
+SimulatedGpio is a purely in-memory pin for benchmarking higher-level
+components without any system call cost. Its input level can be driven by an
+injected waveform.
+"""
+
+
+import bisect
+import errno
+import fcntl
+import os
+import shutil
+import tempfile
+from raspy.disposable import Disposable
+from raspy.object_disposed_exception import ObjectDisposedException
+from raspy.io import gpio
+from raspy.io import gpio_export_registry
+from raspy.io import pin_edge
+from raspy.io import gpio_standard
+from raspy.io import pin_state
+from raspy.io import pin_stats
+from raspy.io import pin_utils
+from raspy.io import pwm_sysfs
+from raspy.io.pin_state_change_event import PinStateChangeEvent
+from raspy.pi_system import core_utils
+
+
+TMPFS_PATH = "/dev/shm"
+"""Where the simulated tree is created when available."""
+
+PWM_CHANNELS = 2
+"""The number of channels on the simulated PWM chip."""
+
+
+def _write_file(path, content):
+    """Create or replace a file with the specified content.
+
+    :param str path: The file path.
+    :param str content: The file content.
+    """
+    target = open(path, 'w')
+    target.write(content)
+    target.close()
+
+
+class SysfsSimulator(Disposable):
+    """A simulated sysfs GPIO and PWM tree."""
+
+    def __init__(self, root=None):
+        """Initialize a new instance of SysfsSimulator and activate it.
+
+        :param str root: The directory to build the tree in. If None, a new
+        temporary directory is created (on tmpfs where available) and
+        removed again on dispose.
+        """
+        Disposable.__init__(self)
+        self.__ownsRoot = root is None
+        if root is None:
+            parent = None
+            if os.path.isdir(TMPFS_PATH):
+                parent = TMPFS_PATH
+
+            root = tempfile.mkdtemp(prefix="raspy-gpio-", dir=parent)
+
+        self.__root = os.path.join(root, "")
+        self.__gpioPath = self.__root + "gpio/"
+        self.__pwmPath = self.__root + "pwm/"
+        self.__chipPath = self.__pwmPath + "pwmchip0/"
+        for path in (self.__gpioPath, self.__chipPath):
+            if not os.path.isdir(path):
+                os.makedirs(path)
+
+        for path in (self.__gpioPath, self.__chipPath):
+            _write_file(path + "export", "")
+            _write_file(path + "unexport", "")
+
+        _write_file(self.__chipPath + "npwm", str(PWM_CHANNELS))
+        self.__edgePipes = {}
+        self.__origIoPath = gpio_standard.get_io_path()
+        self.__origPwmPath = pwm_sysfs.get_pwm_path()
+        gpio_standard.set_io_path(self.__gpioPath)
+        pwm_sysfs.set_pwm_path(self.__pwmPath)
+        pin_utils.set_fs_write_hook(self.__on_write)
+        pin_utils.set_fs_edge_hook(self.__get_edge_fd)
+        gpio_export_registry.clear()
+
+    @property
+    def root(self):
+        """Get the root of the simulated tree.
+
+        :returns: The root directory.
+        :rtype: str
+        """
+        return self.__root
+
+    @property
+    def gpio_path(self):
+        """Get the simulated /sys/class/gpio/ directory.
+
+        :returns: The GPIO directory.
+        :rtype: str
+        """
+        return self.__gpioPath
+
+    @property
+    def pwm_path(self):
+        """Get the simulated /sys/class/pwm/ directory.
+
+        :returns: The PWM directory.
+        :rtype: str
+        """
+        return self.__pwmPath
+
+    def __on_write(self, path, val):
+        """Emulate the kernel's handling of a control file write.
+
+        :param str path: The path written.
+        :param str val: The value string written.
+        """
+        if path == self.__gpioPath + "export":
+            self.__export_gpio(int(val))
+        elif path == self.__gpioPath + "unexport":
+            self.__remove(self.__gpioPath + "gpio" + str(int(val)))
+        elif path == self.__chipPath + "export":
+            self.__export_pwm(int(val))
+        elif path == self.__chipPath + "unexport":
+            self.__remove(self.__chipPath + "pwm" + str(int(val)))
+        elif path.startswith(self.__gpioPath) and path.endswith("/direction"):
+            # Writing "high" or "low" sets an output and its level at once.
+            pin_dir = os.path.dirname(path)
+            if val in ("high", "low"):
+                _write_file(path, "out")
+                _write_file(pin_dir + "/value", "1" if val == "high" else "0")
+
+    def __get_edge_fd(self, path):
+        """Get the descriptor that signals edges on a simulated value file.
+
+        :param str path: The value file path.
+        :returns: The read end of the pin's edge pipe, or None if path is
+        not a simulated value file.
+        :rtype: int
+        """
+        pin_dir = os.path.dirname(path)
+        if (os.path.dirname(pin_dir) + "/" != self.__gpioPath or
+                os.path.basename(path) != "value"):
+            return None
+
+        pipe = self.__edgePipes.get(pin_dir)
+        if pipe is None:
+            pipe = os.pipe()
+            for fd in pipe:
+                flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+                fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+
+            self.__edgePipes[pin_dir] = pipe
+
+        return pipe[0]
+
+    def __export_gpio(self, gpio_num):
+        """Create the attribute files of an exported GPIO.
+
+        :param int gpio_num: The GPIO number.
+        """
+        pin_dir = self.__gpioPath + "gpio" + str(gpio_num)
+        if os.path.isdir(pin_dir):
+            return
+
+        os.mkdir(pin_dir)
+        for name, content in (("direction", "in"), ("value", "0"),
+                              ("edge", "none"), ("active_low", "0")):
+            _write_file(pin_dir + "/" + name, content)
+
+    def __export_pwm(self, channel):
+        """Create the attribute files of an exported PWM channel.
+
+        :param int channel: The PWM channel.
+        """
+        pwm_dir = self.__chipPath + "pwm" + str(channel)
+        if os.path.isdir(pwm_dir):
+            return
+
+        os.mkdir(pwm_dir)
+        for name in ("period", "duty_cycle", "enable"):
+            _write_file(pwm_dir + "/" + name, "0")
+
+    def __remove(self, path):
+        """Remove an exported directory if present.
+
+        :param str path: The directory.
+        """
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+
+    def is_exported(self, gpio_num):
+        """Check to see if the specified GPIO is exported.
+
+        :param int gpio_num: The GPIO number.
+        :returns: True if exported; Otherwise, False.
+        :rtype: bool
+        """
+        return os.path.isdir(self.__gpioPath + "gpio" + str(gpio_num))
+
+    def __read_attr(self, gpio_num, name):
+        """Read an attribute file of an exported GPIO.
+
+        :param int gpio_num: The GPIO number.
+        :param str name: The attribute name.
+        :returns: The attribute content.
+        :rtype: str
+        """
+        path = self.__gpioPath + "gpio" + str(gpio_num) + "/" + name
+        target = open(path, 'r')
+        content = target.read()
+        target.close()
+        return content.strip()
+
+    def get_direction(self, gpio_num):
+        """Get the direction of an exported GPIO.
+
+        :param int gpio_num: The GPIO number.
+        :returns: The direction string ("in" or "out").
+        :rtype: str
+        """
+        return self.__read_attr(gpio_num, "direction")
+
+    def get_edge(self, gpio_num):
+        """Get the interrupt edge of an exported GPIO.
+
+        :param int gpio_num: The GPIO number.
+        :returns: The edge string ("none", "rising", "falling" or "both").
+        :rtype: str
+        """
+        return self.__read_attr(gpio_num, "edge")
+
+    def get_value(self, gpio_num):
+        """Get the level of an exported GPIO.
+
+        :param int gpio_num: The GPIO number.
+        :returns: The pin state.
+        :rtype: int
+        """
+        if self.__read_attr(gpio_num, "value")[0:1] == "1":
+            return pin_state.HIGH
+
+        return pin_state.LOW
+
+    def set_input(self, gpio_num, ps):
+        """Drive the level of an exported GPIO from outside.
+
+        :param int gpio_num: The GPIO number.
+        :param int ps: The pin state.
+        """
+        pin_dir = self.__gpioPath + "gpio" + str(gpio_num)
+        old = self.get_value(gpio_num)
+        _write_file(pin_dir + "/value", "1" if ps == pin_state.HIGH else "0")
+        pipe = self.__edgePipes.get(pin_dir)
+        if pipe is None or old == ps:
+            return
+
+        edges = (pin_edge.BOTH, pin_edge.FALLING)
+        if ps == pin_state.HIGH:
+            edges = (pin_edge.BOTH, pin_edge.RISING)
+
+        names = [pin_utils.get_pin_edge_name(e) for e in edges]
+        if self.get_edge(gpio_num) in names:
+            try:
+                os.write(pipe[1], b"x")
+            except OSError as ex:
+                # A full pipe already holds an unacknowledged edge.
+                if ex.errno != errno.EAGAIN:
+                    raise
+
+    def dispose(self):
+        """Deactivate the simulator and remove the tree it created."""
+        if self.is_disposed:
+            return
+
+        pin_utils.set_fs_write_hook(None)
+        pin_utils.set_fs_edge_hook(None)
+        for pipe in self.__edgePipes.values():
+            os.close(pipe[0])
+            os.close(pipe[1])
+
+        self.__edgePipes = {}
+        gpio_standard.set_io_path(self.__origIoPath)
+        pwm_sysfs.set_pwm_path(self.__origPwmPath)
+        gpio_export_registry.clear()
+        if self.__ownsRoot:
+            shutil.rmtree(self.__root, ignore_errors=True)
+
+        Disposable.dispose(self)
+
+
+class SimulatedGpio(gpio.Gpio):
+    """An in-memory GPIO pin."""
+
+    def __init__(self, pn, mode, initial_val):
+        """Initialize a new instance of SimulatedGpio.
+
+        :param raspy.io.gpio_pins.GpioPin pn: The GPIO pin.
+        :param int mode: The I/O pin mode.
+        :param int initial_val: The initial pin value.
+        """
+        gpio.Gpio.__init__(self, pn, mode, initial_val)
+        self.__level = pin_state.LOW
+        self.__lastState = pin_state.LOW
+        self.__times = None
+        self.__states = None
+        self.__length = 0
+        self.__repeat = False
+        self.__start = 0
+        self.__writeCount = 0
+        self.__readCount = 0
+
+    @property
+    def write_count(self):
+        """Get the number of writes made to this pin.
+
+        :returns: The write count.
+        :rtype: int
+        """
+        return self.__writeCount
+
+    @property
+    def read_count(self):
+        """Get the number of reads made from this pin.
+
+        :returns: The read count.
+        :rtype: int
+        """
+        return self.__readCount
+
+    def provision(self):
+        """Provision this pin.
+
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("SimulatedGpio")
+
+        if self._defer_provision():
+            return
+
+        start = self._op_start()
+        self.__level = self.get_initial_pin_value()
+        self.__lastState = self.__level
+        self._op_end(pin_stats.OP_EXPORT, start)
+
+    def set_input(self, ps):
+        """Set the level of the pin, clearing any waveform.
+
+        :param int ps: The pin state.
+        """
+        self.__times = None
+        self.__level = ps
+
+    def set_waveform(self, samples, repeat=False):
+        """Drive the pin level from a waveform starting now.
+
+        :param list samples: A list of (offset_ns, state) tuples sorted by
+        offset. The pin has the state of the latest sample whose offset has
+        elapsed, and LOW before the first one.
+        :param bool repeat: Set True to loop the waveform. The waveform length
+        is the offset of its last sample.
+        """
+        self.__times = [int(t) for t, _ in samples]
+        self.__states = [s for _, s in samples]
+        self.__length = 0
+        if len(self.__times) > 0:
+            self.__length = self.__times[-1]
+
+        self.__repeat = repeat and self.__length > 0
+        self.__start = core_utils.monotonic_ns()
+
+    def __sample(self):
+        """Get the current level from the waveform, if any.
+
+        :returns: The pin state.
+        :rtype: int
+        """
+        if self.__times is None:
+            return self.__level
+
+        elapsed = core_utils.monotonic_ns() - self.__start
+        if self.__repeat:
+            elapsed %= self.__length
+
+        idx = bisect.bisect_right(self.__times, elapsed) - 1
+        if idx < 0:
+            return pin_state.LOW
+
+        return self.__states[idx]
+
+    def write(self, ps):
+        """Write a value to the pin.
+
+        :param int ps: The pin state value to write to the pin.
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        gpio.Gpio.write(self, ps)
+        start = self._op_start()
+        self.__writeCount += 1
+        self.__times = None
+        self.__level = ps
+        self._op_end(pin_stats.OP_WRITE, start)
+        if self.__lastState != ps:
+            evt = PinStateChangeEvent(self.__lastState, ps,
+                                      self.inner_pin.value)
+            self.__lastState = ps
+            self.on_pin_state_change(evt)
+
+    def read(self):
+        """Read a value from the pin.
+
+        :returns: The state (value) of the pin.
+        :rtype: int
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("SimulatedGpio")
+
+        self.ensure_provisioned()
+        start = self._op_start()
+        self.__readCount += 1
+        val = self.__sample()
+        self._op_end(pin_stats.OP_READ, start)
+        if self.__lastState != val:
+            evt = PinStateChangeEvent(self.__lastState, val,
+                                      self.inner_pin.value)
+            self.__lastState = val
+            self.on_pin_state_change(evt)
+
+        return val
@@ -1,13 +1,24 @@
 """Implemented by classes that represent GPIO pins on the Raspberry Pi."""
 
-import os.path
-from raspy import exec_utils
+import contextlib
+import errno
+import json
+import os
+import select
+import threading
+from raspy.illegal_argument_exception import IllegalArgumentException
 from raspy.invalid_operation_exception import InvalidOperationException
+from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.io import gpio
+from raspy.io import gpio_export_registry
 from raspy.io import gpio_pins
+from raspy.io import pin_edge
 from raspy.io import pin_state
 from raspy.io import pin_mode
+from raspy.io import pin_stats
 from raspy.io import pin_utils
+from raspy.io import pwm_mode
+from raspy.io import pwm_sysfs
 from raspy.io.io_exception import IOException
 from raspy.io.pin_state_change_event import PinStateChangeEvent
 
@@ -15,11 +26,169 @@ IO_PATH = "/sys/class/gpio/"
 """The filesystem base path for I/O pins."""
 
 
+def get_io_path():
+    """Get the filesystem base path for I/O pins.
+
+    :returns: The sysfs GPIO root, including the trailing separator.
+    :rtype: str
+    """
+    return IO_PATH
+
+
+def set_io_path(path):
+    """Set the filesystem base path for I/O pins.
+
+    This allows the sysfs GPIO tree to be replaced by a simulated one (see
+    raspy.io.gpio_simulator). It only affects pins provisioned afterward.
+
+    :param str path: The sysfs GPIO root. If None, the default
+    /sys/class/gpio/ is restored.
+    """
+    global IO_PATH
+    if path is None:
+        path = "/sys/class/gpio/"
+
+    if not path.endswith("/"):
+        path += "/"
+
+    IO_PATH = path
+
+
+SNAPSHOT_VERSION = 1
+"""The version of the pin snapshot format."""
+
+
+def _read_direction(gpio_num):
+    """Read the direction of an exported GPIO from sysfs.
+
+    :param int gpio_num: The GPIO number.
+    :returns: The direction string.
+    :rtype: str
+    :raises: raspy.io.io_exception.IOException if the direction could not
+    be read.
+    """
+    try:
+        target = open(IO_PATH + "gpio" + str(gpio_num) + "/direction", 'r')
+        direction = target.read().strip()
+        target.close()
+    except IOError as ex:
+        raise IOException(ex.strerror)
+
+    return direction
+
+
+def save_snapshot(path):
+    """Save the exported pins, their directions and output levels.
+
+    The snapshot covers every pin in the export registry. It is written to
+    a temporary file that then replaces the snapshot, so a crash never
+    leaves a partial snapshot behind.
+
+    :param str path: The snapshot file path.
+    :returns: The number of pins saved.
+    :rtype: int
+    :raises: raspy.io.io_exception.IOException if a pin could not be read or
+    the snapshot could not be written.
+    """
+    pins = {}
+    exported = gpio_export_registry.get_exported_pins()
+    for gpio_num, direction in exported.items():
+        level = None
+        if direction == gpio_export_registry.DIRECTION_OUT:
+            value_path = IO_PATH + "gpio" + str(gpio_num) + "/value"
+            level = pin_utils.read_fs_pin(value_path)
+
+        pins[str(gpio_num)] = [direction, level]
+
+    content = json.dumps({"version": SNAPSHOT_VERSION, "pins": pins},
+                         sort_keys=True, separators=(",", ":"))
+    temp_path = path + ".tmp"
+    try:
+        target = open(temp_path, 'w')
+        target.write(content)
+        target.close()
+        os.rename(temp_path, path)
+    except (IOError, OSError) as ex:
+        raise IOException(ex.strerror)
+
+    return len(pins)
+
+
+def adopt_snapshot(path):
+    """Adopt the pins of a snapshot that are still exported as saved.
+
+    The sysfs GPIO tree is scanned once. Each snapshot pin that is still
+    exported with the same direction (and, for an output, the same level) is
+    registered with the export registry, so provisioning it skips the
+    export and direction writes and keeps the output level. Pins that no
+    longer match are left alone and are provisioned from scratch as usual.
+
+    A missing, unreadable or incompatible snapshot adopts nothing.
+
+    :param str path: The snapshot file path.
+    :returns: The GPIO numbers adopted.
+    :rtype: list
+    """
+    try:
+        target = open(path, 'r')
+        snapshot = json.loads(target.read())
+        target.close()
+    except (IOError, ValueError):
+        return []
+
+    if not isinstance(snapshot, dict):
+        return []
+
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        return []
+
+    try:
+        exported = set(os.listdir(IO_PATH))
+    except OSError:
+        return []
+
+    adopted = []
+    for key, (direction, level) in snapshot.get("pins", {}).items():
+        gpio_num = int(key)
+        if ("gpio" + key) not in exported:
+            continue
+
+        try:
+            if _read_direction(gpio_num) != direction:
+                continue
+
+            if direction == gpio_export_registry.DIRECTION_OUT:
+                value_path = IO_PATH + "gpio" + key + "/value"
+                if pin_utils.read_fs_pin(value_path) != level:
+                    continue
+        except (IOException, ValueError):
+            continue
+
+        gpio_export_registry.adopt(gpio_num, direction, level)
+        adopted.append(gpio_num)
+
+    adopted.sort()
+    return adopted
+
+
+class _IoPathAttribute(object):
+    """A class attribute that reads the current IO_PATH."""
+
+    def __get__(self, instance, owner):
+        """Get the filesystem base path for I/O pins.
+
+        :returns: The current IO_PATH.
+        :rtype: str
+        """
+        return IO_PATH
+
+
 class GpioStandard(gpio.Gpio):
     """Raspberry Pi GPIO using the file-based access method."""
 
-    GPIO_PATH = IO_PATH
-    """The path on the Raspberry Pi for the GPIO interface."""
+    GPIO_PATH = _IoPathAttribute()
+    """The path on the Raspberry Pi for the GPIO interface. This follows
+    set_io_path(); new code should call get_io_path() instead."""
 
     def __init__(self, pn, mode, initial_val):
         """Initialize a new instance of raspy.io.gpio_standard.GpioStandard.
@@ -31,8 +200,20 @@ class GpioStandard(gpio.Gpio):
         gpio.Gpio.__init__(self, pn, mode, initial_val)
 
         self.__lastState = pin_state.LOW
+        self.__shadowValid = False
+        self.__elideWrites = False
+        self.__elidedWrites = 0
+        self.__batchDepth = 0
+        self.__pending = None
+        self.__valueFd = None
+        self.__fdLock = threading.Lock()
+        self.__edge = pin_edge.NONE
+        self.__edgePoller = None
+        self.__interruptThread = None
+        self.__wakeFds = None
         self.__pwm = 0
         self.__pwmRange = 1024
+        self.__pwmOut = None
         self.__isPWM = False
 
     @property
@@ -46,30 +227,29 @@ class GpioStandard(gpio.Gpio):
 
     @pwm.setter
     def pwm(self, val):
-        """Get the PWM (pulse-width modulation) value.
+        """Set the PWM (pulse-width modulation) value.
+
+        The duty cycle is val / pwm_range of the period.
 
         :param int val: The PWM value.
         :raises: raspy.invalid_operation_exception.InvalidOperationException
         if setting a PWM value on a pin that is not configured as PWM.
+        :raises: raspy.io.io_exception.IOException if the PWM channel could
+        not be written.
         """
-        if self.mode == pin_mode.PWM:
+        if self.mode != pin_mode.PWM:
             err_msg = "Cannot set PWM value on a pin not configured for PWM."
             raise InvalidOperationException(err_msg)
 
         if val < 0:
             val = 0
 
-        if val > 1023:
-            val = 1023
+        if val > self.__pwmRange:
+            val = self.__pwmRange
 
         if self.__pwm != val:
             self.__pwm = val
-            if not self.__isPWM:
-                cmd = "gpio mode " + str(self.inner_pin) + " pwm"
-                exec_utils.execute_command(cmd)
-
-            cmd = "gpio pwm " + str(self.inner_pin) + " " + str(self.__pwm)
-            exec_utils.execute_command(cmd)
+            self.__update_pwm()
 
     @property
     def pwm_range(self):
@@ -84,21 +264,107 @@ class GpioStandard(gpio.Gpio):
     def pwm_range(self, rng):
         """Set the PWM (pulse-width modulation) range.
 
+        One unit of range is one tick of the 600 kHz PWM clock, so the range
+        sets the PWM period.
+
         :param int rng: The PWM range.
+        :raises: raspy.io.io_exception.IOException if the PWM channel could
+        not be written.
         """
-        if rng < 0:
-            rng = 0
-
-        if rng > 1024:
-            rng = 1024
+        if rng < 1:
+            rng = 1
 
         if self.__pwmRange != rng:
             self.__pwmRange = rng
+            if self.__pwm > rng:
+                self.__pwm = rng
+
+            if self.__isPWM:
+                self.__update_pwm()
+
+    @property
+    def pwm_mode(self):
+        """Get the PWM mode.
+
+        :returns: The PWM mode (raspy.io.pwm_mode).
+        :rtype: int
+        """
+        return pwm_mode.MARKSPACE
+
+    @pwm_mode.setter
+    def pwm_mode(self, mode):
+        """Set the PWM mode.
+
+        :param int mode: The PWM mode (raspy.io.pwm_mode).
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        the mode is not raspy.io.pwm_mode.MARKSPACE, the only mode supported
+        by the kernel PWM driver.
+        """
+        if mode != pwm_mode.MARKSPACE:
+            msg = "Only mark-space PWM is supported by the sysfs interface."
+            raise IllegalArgumentException(msg)
+
+    @property
+    def pwm_channel(self):
+        """Get the hardware PWM channel this pin is routed to.
+
+        :returns: The PWM channel (raspy.io.pwm_channel), or None if this pin
+        cannot output hardware PWM.
+        :rtype: int
+        """
+        return pwm_sysfs.get_pwm_channel(self.inner_pin.value)
+
+    def __get_pwm(self):
+        """Get the sysfs PWM channel of this pin, exporting it on first use.
+
+        :returns: The PWM channel.
+        :rtype: raspy.io.pwm_sysfs.SysfsPwm
+        :raises: raspy.invalid_operation_exception.InvalidOperationException
+        if this pin cannot output hardware PWM.
+        :raises: raspy.io.io_exception.IOException if the channel could not
+        be exported.
+        """
+        if self.__pwmOut is None:
+            channel = self.pwm_channel
+            if channel is None:
+                err_msg = "GPIO " + str(self.inner_pin.value)
+                err_msg += " does not support hardware PWM."
+                raise InvalidOperationException(err_msg)
+
+            pwm_out = pwm_sysfs.SysfsPwm(channel)
+            pwm_out.export()
+            self.__pwmOut = pwm_out
+            self.__isPWM = True
+
+        return self.__pwmOut
+
+    def __release_pwm(self):
+        """Disable and unexport the PWM channel if this pin exported it."""
+        if self.__pwmOut is not None:
+            self.__pwmOut.dispose()
+            self.__pwmOut = None
+            self.__isPWM = False
+
+    def __update_pwm(self):
+        """Write the current PWM range and value to the PWM channel.
+
+        :raises: raspy.io.io_exception.IOException if the PWM channel could
+        not be written.
+        """
+        pwm_out = self.__get_pwm()
+        period = pwm_sysfs.get_period_ns(self.__pwmRange)
+        duty = pwm_sysfs.get_duty_cycle_ns(self.__pwm, self.__pwmRange,
+                                           period)
+        pwm_out.configure(period, duty)
+        pwm_out.enable(True)
 
     def __internal_export_pin(self, mode, pin_num, pin_name):
         """Export the GPIO setting the direction.
 
-        This creates the /sys/class/gpio/gpioXX directory.
+        This creates the /sys/class/gpio/gpioXX directory. The export and
+        direction are recorded in the process-wide export registry, so this
+        only touches sysfs when the pin is not yet exported or its direction
+        actually changes.
 
         :param int mode: The I/O pin mode.
         :param str pin_num: The pin number.
@@ -106,22 +372,35 @@ class GpioStandard(gpio.Gpio):
         :raises: raspy.io.io_exception.IOException if an IOErr occurs while
         trying to write to the specified pin.
         """
-        pin_path = IO_PATH + "gpio" + pin_num
-        m = pin_utils.get_pin_mode_name(mode)
+        direction = pin_utils.get_pin_direction_name(mode)
+        gpio_num = int(pin_num)
 
         # If the pin is already exported, check it's in the proper direction.
         # If the direction matches, return out of the function. If not,
         # change the direction.
-        if self.mode == mode:
+        if gpio_export_registry.get_direction(gpio_num) == direction:
             return
 
-        # export
-        if os.path.exists(pin_path):
-            pin_utils.write_fs_pin(IO_PATH + "export", pin_num)
+        with gpio_export_registry.get_lock():
+            current = gpio_export_registry.get_direction(gpio_num)
+            if current == direction:
+                return
 
-        # set I/O direction
-        print("Setting direction on pin " + pin_name + "/gpio" + pin_num + " as " + m)
-        pin_utils.write_fs_pin(pin_path + "/direction", m)
+            start = self._op_start()
+            try:
+                # export
+                pin_path = IO_PATH + "gpio" + pin_num
+                if current is None and not os.path.exists(pin_path):
+                    pin_utils.write_fs_pin(IO_PATH + "export", pin_num)
+
+                # set I/O direction
+                pin_utils.write_fs_pin(pin_path + "/direction", direction)
+            except IOException:
+                self._op_error()
+                raise
+
+            gpio_export_registry.register(gpio_num, direction)
+            self._op_end(pin_stats.OP_EXPORT, start)
 
     def __export_pin(self, pn, mode):
         """Export the GPIO setting the direction.
@@ -135,6 +414,70 @@ class GpioStandard(gpio.Gpio):
         """
         self.__internal_export_pin(mode, str(pn.value), pn.name)
 
+    def __open_value_file(self, gpio_num):
+        """Get the cached file descriptor of the pin value file.
+
+        The value file is opened on first use and kept open for the lifetime
+        of the pin so that reads and writes don't have to re-open it.
+
+        :param str gpio_num: The GPIO number associated with the pin.
+        :returns: The file descriptor of the value file.
+        :rtype: int
+        :raises: raspy.io.io_exception.IOException if the value file could
+        not be opened (device does not exist).
+        """
+        if self.__valueFd is None:
+            file_name = IO_PATH + "gpio" + gpio_num + "/value"
+            try:
+                self.__valueFd = pin_utils.open_fs_pin(file_name)
+            except IOException:
+                err_msg = "Cannot open pin " + gpio_num + ". "
+                err_msg += "Device does not exist"
+                raise IOException(err_msg)
+
+        return self.__valueFd
+
+    def __close_value_file(self):
+        """Close the cached file descriptor of the pin value file."""
+        if self.__valueFd is not None:
+            pin_utils.close_fs_pin(self.__valueFd)
+            self.__valueFd = None
+            self.__edgePoller = None
+
+    def __get_edge_fd(self, fd):
+        """Get the descriptor and poll flags that signal an edge on the pin.
+
+        :param int fd: The file descriptor of the value file.
+        :returns: A (file descriptor, poll flags) tuple.
+        :rtype: tuple
+        """
+        path = IO_PATH + "gpio" + str(self.inner_pin.value) + "/value"
+        return pin_utils.get_fs_edge_fd(path, fd)
+
+    def __ack_edge(self, fd, edge_fd):
+        """Acknowledge any pending edge notification.
+
+        :param int fd: The file descriptor of the value file.
+        :param int edge_fd: The descriptor polled for edges.
+        """
+        self.__read_value_file(fd)
+        if edge_fd != fd:
+            pin_utils.drain_fs_edge(edge_fd)
+
+    def __read_value_file(self, fd):
+        """Read the value from the cached value file descriptor.
+
+        Reading also acknowledges any pending edge notification.
+
+        :param int fd: The file descriptor of the value file.
+        :returns: The value read from the pin.
+        :rtype: int
+        :raises: raspy.io.io_exception.IOException if the value could not be
+        read.
+        """
+        with self.__fdLock:
+            return pin_utils.read_fs_pin_fd(fd)
+
     def __internal_write(self, pin_address, val, gpio_num, pin_name):
         """Write the specified value to the specified GPIO pin.
 
@@ -149,9 +492,20 @@ class GpioStandard(gpio.Gpio):
         if pin_address == gpio_pins.GpioNone.value:
             return
 
-        self.__internal_export_pin(pin_mode.OUT, gpio_num, pin_name)
-        pin_path = IO_PATH + "gpio" + gpio_num + "/value"
-        pin_utils.write_fs_pin(pin_path, str(val))
+        exported = gpio_export_registry.get_direction(pin_address)
+        if exported != gpio_export_registry.DIRECTION_OUT:
+            self.__internal_export_pin(pin_mode.OUT, gpio_num, pin_name)
+
+        start = self._op_start()
+        try:
+            fd = self.__open_value_file(gpio_num)
+            with self.__fdLock:
+                pin_utils.write_fs_pin_fd(fd, str(val))
+        except IOException:
+            self._op_error()
+            raise
+
+        self._op_end(pin_stats.OP_WRITE, start)
 
     def __write(self, pn, val):
         """Write specified value to the specified GPIO pin.
@@ -173,6 +527,7 @@ class GpioStandard(gpio.Gpio):
         while trying to write to the specified pin.
         """
         pin_utils.write_fs_pin(IO_PATH + "unexport", gpio_num)
+        gpio_export_registry.unregister(int(gpio_num))
 
     def __unexport_pin(self, pin):
         """Unexport the GPIO.
@@ -183,7 +538,14 @@ class GpioStandard(gpio.Gpio):
         :raises: raspy.io.IOException if an IOError occurs while trying to
         write to the specified pin.
         """
-        self.__write(pin, pin_state.LOW)
+        direction = gpio_export_registry.get_direction(pin.value)
+        if direction is None and self.__valueFd is None:
+            return
+
+        if direction == gpio_export_registry.DIRECTION_OUT:
+            self.__write(pin, pin_state.LOW)
+
+        self.__close_value_file()
         self.__internal_unexport_pin(str(pin.value))
 
     def provision(self):
@@ -192,12 +554,41 @@ class GpioStandard(gpio.Gpio):
         :raises: raspy.object_disposed_exception.ObjectDisposedException if
         this instance has been disposed.
         """
-        self.__export_pin(self.inner_pin, self.mode)
-        self.__write(self.inner_pin, self.get_initial_pin_value())
+        # GpioNone is the same value for both Rev1 and Rev2 boards.
+        if self.inner_pin.value == gpio_pins.GpioNone.value:
+            return
+
+        if self._defer_provision():
+            return
+
+        # PWM pins are muxed to the PWM peripheral by the pwm overlay rather
+        # than exported through /sys/class/gpio.
+        if self.mode == pin_mode.PWM:
+            self.__update_pwm()
+            return
+
+        self.__release_pwm()
 
-    def __internal_read(self, gpio_num, gpio_name):
+        self.__export_pin(self.inner_pin, self.mode)
+        self.__open_value_file(str(self.inner_pin.value))
+        self.__shadowValid = False
+        level = gpio_export_registry.take_adopted_level(self.inner_pin.value)
+        if self.mode != pin_mode.IN:
+            # An adopted output keeps the level it was left at.
+            if level is None:
+                level = self.get_initial_pin_value()
+                self.__write(self.inner_pin, level)
+
+            self.__lastState = level
+            self.__shadowValid = True
+
+    def __internal_read(self, pin_address, gpio_num, gpio_name):
         """Read the value of the specified GPIO pin.
 
+        Reading does not change the direction of a pin that has already been
+        exported, so the current level of an output can be read back.
+
+        :param int pin_address: The address of the pin to read from.
         :param str gpio_num: The GPIO pin number.
         :param str gpio_name: The name of the GPIO.
         :returns: The value of the pin.
@@ -206,17 +597,19 @@ class GpioStandard(gpio.Gpio):
         not be read (device does not exist).
         """
         return_value = pin_state.LOW
-        self.__internal_export_pin(pin_mode.IN, gpio_num, gpio_name)
-        file_name = IO_PATH + "gpio" + gpio_num + "/value"
-        if os.path.exists(file_name):
-            read_value = pin_utils.read_fs_pin(file_name)
-            if read_value == 1:
+        if not gpio_export_registry.is_exported(pin_address):
+            self.__internal_export_pin(pin_mode.IN, gpio_num, gpio_name)
+
+        start = self._op_start()
+        try:
+            fd = self.__open_value_file(gpio_num)
+            if self.__read_value_file(fd) == 1:
                 return_value = pin_state.HIGH
-        else:
-            err_msg = "Cannot read from pin " + gpio_num + ". "
-            err_msg += "Device does not exist"
-            raise IOException(err_msg)
+        except IOException:
+            self._op_error()
+            raise
 
+        self._op_end(pin_stats.OP_READ, start)
         return return_value
 
     def __read(self, pn):
@@ -228,7 +621,83 @@ class GpioStandard(gpio.Gpio):
         :raises: raspy.io.io_exception.IOException if the specified pin could
         not be read (device does not exist).
         """
-        return self.__internal_read(str(pn.value), pn.name)
+        return self.__internal_read(pn.value, str(pn.value), pn.name)
+
+    @property
+    def elide_writes(self):
+        """Get whether or not redundant writes are skipped.
+
+        :returns: True if writes of the level the pin already has are
+        skipped; Otherwise, False.
+        :rtype: bool
+        """
+        return self.__elideWrites
+
+    @elide_writes.setter
+    def elide_writes(self, flag):
+        """Set whether or not redundant writes are skipped.
+
+        When enabled, a write of the level this instance last wrote (or read)
+        does not touch sysfs. Only enable this when nothing else drives the
+        pin, since the shadow state can't see changes made elsewhere.
+
+        :param bool flag: Set True to skip redundant writes.
+        """
+        self.__elideWrites = bool(flag)
+
+    @property
+    def elided_writes(self):
+        """Get the number of writes that never reached sysfs.
+
+        Counts writes skipped by elide_writes and writes coalesced away by
+        batch().
+
+        :returns: The elided write count.
+        :rtype: int
+        """
+        return self.__elidedWrites
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Coalesce the writes made inside a with block.
+
+        Writes made inside the block are queued and only the last one is
+        written when the outermost block exits, so intermediate levels never
+        reach the pin. Batches may be nested.
+
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioStandard")
+
+        self.__batchDepth += 1
+        try:
+            yield self
+        finally:
+            self.__batchDepth -= 1
+            if self.__batchDepth == 0 and self.__pending is not None:
+                ps = self.__pending
+                self.__pending = None
+                self.__commit(ps)
+
+    def __commit(self, ps):
+        """Write the specified state unless it can be elided.
+
+        :param int ps: The pin state value to write to the pin.
+        """
+        if (self.__elideWrites and self.__shadowValid and
+                self.__lastState == ps):
+            self.__elidedWrites += 1
+            return
+
+        self.__write(self.inner_pin, ps)
+        self.__shadowValid = True
+        if self.__lastState != ps:
+            pin_addr = self.inner_pin.value
+            evt = PinStateChangeEvent(self.__lastState, ps, pin_addr)
+            self.__lastState = ps
+            self.on_pin_state_change(evt)
 
     def write(self, ps):
         """Write a value to the pin.
@@ -238,10 +707,14 @@ class GpioStandard(gpio.Gpio):
         this instance has been disposed.
         """
         gpio.Gpio.write(self, ps)
-        self.__write(self.inner_pin, ps)
-        if self.__lastState != self.state:
-            evt = PinStateChangeEvent(self.__lastState, self.state)
-            self.on_pin_state_change(evt)
+        if self.__batchDepth > 0:
+            if self.__pending is not None:
+                self.__elidedWrites += 1
+
+            self.__pending = ps
+            return
+
+        self.__commit(ps)
 
     def pulse(self, millis):
         """Pulse the pin output for the specified number of milliseconds.
@@ -255,6 +728,7 @@ class GpioStandard(gpio.Gpio):
             err_msg = "You cannot pulse a pin set as an input"
             raise InvalidOperationException(err_msg)
 
+        self.ensure_provisioned()
         pin_addr = self.inner_pin.value
         self.__write(self.inner_pin, pin_state.HIGH)
         evt = PinStateChangeEvent(self.state, pin_state.HIGH, pin_addr)
@@ -276,27 +750,216 @@ class GpioStandard(gpio.Gpio):
         :raises: raspy.object_disposed_exception.ObjectDisposedException if
         this instance has been disposed.
         """
+        self.ensure_provisioned()
         val = self.__read(self.inner_pin)
+        self.__shadowValid = True
         if self.__lastState != val:
             pin_addr = self.inner_pin.value
             evt = PinStateChangeEvent(self.__lastState, val, pin_addr)
+            self.__lastState = val
             self.on_pin_state_change(evt)
 
         return val
 
+    @property
+    def edge(self):
+        """Get the interrupt edge.
+
+        :returns: The interrupt edge (one of the raspy.io.pin_edge values).
+        :rtype: int
+        """
+        return self.__edge
+
+    @edge.setter
+    def edge(self, edge):
+        """Set the interrupt edge.
+
+        Selects which transitions of the pin raise an interrupt that can be
+        waited on with wait_for_edge() or delivered as state change events by
+        enable_interrupts().
+
+        :param int edge: The interrupt edge (one of the raspy.io.pin_edge
+        values).
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.io.io_exception.IOException if the edge could not be
+        written to the pin.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioStandard")
+
+        if edge is None:
+            edge = pin_edge.NONE
+
+        if self.__edge == edge:
+            return
+
+        self.ensure_provisioned()
+        pn = self.inner_pin
+        if not gpio_export_registry.is_exported(pn.value):
+            self.__internal_export_pin(pin_mode.IN, str(pn.value), pn.name)
+
+        edge_path = IO_PATH + "gpio" + str(pn.value) + "/edge"
+        pin_utils.write_fs_pin(edge_path, pin_utils.get_pin_edge_name(edge))
+        self.__edge = edge
+
+    def wait_for_edge(self, timeout=None):
+        """Block until the configured edge occurs on the pin.
+
+        The calling thread sleeps in the kernel until the pin value file
+        signals an interrupt, so no CPU is used while waiting. When an edge
+        is detected the pin is read, which fires the
+        raspy.io.gpio.EVENT_GPIO_STATE_CHANGED event if the state changed.
+
+        :param int timeout: The maximum number of milliseconds to wait. If
+        None or negative, waits indefinitely.
+        :returns: True if an edge was detected; False if the wait timed out
+        or was interrupted.
+        :rtype: bool
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.invalid_operation_exception.InvalidOperationException
+        if no interrupt edge has been configured.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioStandard")
+
+        if self.__edge == pin_edge.NONE:
+            err_msg = "No interrupt edge configured on this pin."
+            raise InvalidOperationException(err_msg)
+
+        if timeout is None or timeout < 0:
+            timeout = -1
+
+        fd = self.__open_value_file(str(self.inner_pin.value))
+        edge_fd, flags = self.__get_edge_fd(fd)
+        if self.__edgePoller is None:
+            self.__edgePoller = select.poll()
+            self.__edgePoller.register(edge_fd, flags)
+
+        # Acknowledge any stale notification before going to sleep.
+        self.__ack_edge(fd, edge_fd)
+        try:
+            events = self.__edgePoller.poll(timeout)
+        except select.error as ex:
+            if ex.args[0] == errno.EINTR:
+                return False
+            raise
+
+        if len(events) == 0:
+            return False
+
+        self.read()
+        return True
+
+    @property
+    def interrupts_enabled(self):
+        """Get whether or not interrupt mode is enabled.
+
+        :returns: True if interrupt mode is enabled; Otherwise, False.
+        :rtype: bool
+        """
+        return self.__interruptThread is not None
+
+    def __background_interrupt(self, fd, edge_fd, flags, wake_fd):
+        """Wait for edges and fire state change events until woken.
+
+        This is the callback executed by the interrupt thread.
+
+        :param int fd: The file descriptor of the value file.
+        :param int edge_fd: The descriptor polled for edges.
+        :param int flags: The poll flags that signal an edge on edge_fd.
+        :param int wake_fd: The read end of the wake-up pipe.
+        """
+        poller = select.poll()
+        poller.register(edge_fd, flags)
+        poller.register(wake_fd, select.POLLIN)
+        while True:
+            try:
+                events = poller.poll()
+            except select.error as ex:
+                if ex.args[0] == errno.EINTR:
+                    continue
+                raise
+
+            for event_fd, _flags in events:
+                if event_fd == wake_fd:
+                    return
+
+            if edge_fd != fd:
+                pin_utils.drain_fs_edge(edge_fd)
+
+            self.read()
+
+    def enable_interrupts(self, edge=pin_edge.BOTH):
+        """Enable interrupt mode.
+
+        Starts a background thread that sleeps until the specified edge
+        occurs and then fires the raspy.io.gpio.EVENT_GPIO_STATE_CHANGED
+        event. This replaces polling the pin with read() in a loop.
+
+        :param int edge: The edge to interrupt on (one of the
+        raspy.io.pin_edge values other than NONE). Default is BOTH.
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        edge is raspy.io.pin_edge.NONE.
+        :raises: raspy.invalid_operation_exception.InvalidOperationException
+        if interrupt mode is already enabled.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("GpioStandard")
+
+        if edge is None or edge == pin_edge.NONE:
+            err_msg = "An edge must be specified to enable interrupts."
+            raise IllegalArgumentException(err_msg)
+
+        if self.__interruptThread is not None:
+            raise InvalidOperationException("Interrupts already enabled.")
+
+        self.edge = edge
+        fd = self.__open_value_file(str(self.inner_pin.value))
+        edge_fd, flags = self.__get_edge_fd(fd)
+        # Acknowledge stale notifications here rather than in the thread so
+        # that an edge right after this call is not discarded.
+        self.__ack_edge(fd, edge_fd)
+        self.__wakeFds = os.pipe()
+        self.__interruptThread = threading.Thread(
+            target=self.__background_interrupt,
+            args=(fd, edge_fd, flags, self.__wakeFds[0]))
+        self.__interruptThread.name = "GpioStandardInterrupt"
+        self.__interruptThread.daemon = True
+        self.__interruptThread.start()
+
+    def disable_interrupts(self):
+        """Disable interrupt mode started by enable_interrupts()."""
+        if self.__interruptThread is None:
+            return
+
+        os.write(self.__wakeFds[1], b"x")
+        if self.__interruptThread is not threading.current_thread():
+            self.__interruptThread.join()
+
+        os.close(self.__wakeFds[0])
+        os.close(self.__wakeFds[1])
+        self.__wakeFds = None
+        self.__interruptThread = None
+
     def dispose(self):
         """Dispose managed resources.
 
         Performs application-defined tasks associated with freeing, releasing,
         or resetting resources.
         """
-        if gpio.Gpio.is_disposed:
+        if self.is_disposed:
             return
 
-        self.__unexport_pin(self.inner_pin)
-        if self.__isPWM:
-            cmd = "gpio unexport " + str(self.inner_pin.value)
-            exec_utils.execute_command(cmd)
+        self.disable_interrupts()
+        if gpio_export_registry.is_keep_exported():
+            self.__close_value_file()
+        else:
+            self.__unexport_pin(self.inner_pin)
+
+        self.__release_pwm()
 
-        self.write(pin_state.LOW)
         gpio.Gpio.dispose(self)
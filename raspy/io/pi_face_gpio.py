@@ -17,28 +17,10 @@ class PiFaceGPIO(gpio.Gpio):
     EVENT_STATE_CHANGED = "piFaceGpioStateChanged"
     """The name of the state changed event."""
 
-    OUTPUTS = [
-        pi_face_pins.Output00(),
-        pi_face_pins.Output01(),
-        pi_face_pins.Output02(),
-        pi_face_pins.Output03(),
-        pi_face_pins.Output04(),
-        pi_face_pins.Output05(),
-        pi_face_pins.Output06(),
-        pi_face_pins.Output07()
-    ]
+    OUTPUTS = list(pi_face_pins.OUTPUT_PINS)
     """An array of all the PiFace outputs."""
 
-    INPUTS = [
-        pi_face_pins.Input00(),
-        pi_face_pins.Input01(),
-        pi_face_pins.Input02(),
-        pi_face_pins.Input03(),
-        pi_face_pins.Input04(),
-        pi_face_pins.Input05(),
-        pi_face_pins.Input06(),
-        pi_face_pins.Input07()
-    ]
+    INPUTS = list(pi_face_pins.INPUT_PINS)
     """An array of all PiFace inputs."""
 
     def __init__(self, pn, initial_val, name):
@@ -52,7 +34,11 @@ class PiFaceGPIO(gpio.Gpio):
         :raises: raspy.illegal_argument_exception.IllegalArgumentException if
         the specified pin is not of type raspy.io.pi_face_pins.PiFacePin.
         """
-        gpio.Gpio.__init__(self, pn, pin_mode.IN, initial_val)
+        mode = pin_mode.IN
+        if pn in pi_face_pins.OUTPUTS:
+            mode = pin_mode.OUT
+
+        gpio.Gpio.__init__(self, pn, mode, initial_val)
         self.__pwm = 0
         self.__pwmRange = 0
 
@@ -67,21 +53,14 @@ class PiFaceGPIO(gpio.Gpio):
         if string_utils.is_null_or_empty(self.pin_name):
             self.pin_name = pn.name
 
-        if (pn == pi_face_pins.Input00 or pn == pi_face_pins.Input01 or
-                pn == pi_face_pins.Input02 or pn == pi_face_pins.Input03 or
-                pn == pi_face_pins.Input04 or pn == pi_face_pins.Input05 or
-                pn == pi_face_pins.Input06 or pn == pi_face_pins.Input07):
-            self.mode = pin_mode.IN
-        elif (pn == pi_face_pins.Output00 or pn == pi_face_pins.Output01 or
-              pn == pi_face_pins.Output02 or pn == pi_face_pins.Output03 or
-              pn == pi_face_pins.Output04 or pn == pi_face_pins.Output05 or
-              pn == pi_face_pins.Output06 or pn == pi_face_pins.Output07):
-            self.mode = pin_mode.OUT
-
     @property
     def inner_pin(self):
-        """Get the inner pin."""
-        return pi_face_pins.NonePin
+        """Get the inner pin.
+
+        :returns: The underlying PiFace pin.
+        :rtype: raspy.io.pi_face_pins.PiFacePin
+        """
+        return gpio.Gpio.inner_pin.fget(self)
 
     def dispose(self):
         """Dispose managed resources.
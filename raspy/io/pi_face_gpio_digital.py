@@ -6,6 +6,7 @@ from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.io import pin_state
 from raspy.io import pin_mode
 from raspy.io import pin_pull_resistance
+from raspy.io import pin_stats
 from raspy.io.io_exception import IOException
 from raspy.io.pi_face_gpio import PiFaceGPIO
 from raspy.io.pin_state_change_event import PinStateChangeEvent
@@ -265,14 +266,18 @@ class PiFaceGpioDigital(PiFaceGPIO):
             data                             # data byte
         ]
 
+        start = self._op_start()
         try:
             self.__spi.writebytes(packet)
         except(IOError, SystemError, RuntimeError) as ex:
+            self._op_error()
             err_msg = "Failed to write to SPI bus device at address "
             err_msg += str(self.__address) + " on channel /dev/spidev0.0"
             err_msg += str(ex)
             raise IOException(err_msg)
 
+        self._op_end(pin_stats.OP_WRITE, start)
+
     def __read(self, register):
         """Read a single byte from the specified register.
 
@@ -291,16 +296,19 @@ class PiFaceGpioDigital(PiFaceGPIO):
         ]
 
         result = 0
+        start = self._op_start()
         try:
             temp = self.__spi.xfer(packet, self.__speed)
             if temp is not None:
                 result = temp[2] & 0xFF
         except(IOError, SystemError, RuntimeError) as ex:
+            self._op_error()
             err_msg = "Failed to write to SPI bus device at address "
             err_msg += str(self.__address) + " on channel /dev/spidev0.0"
             err_msg += str(ex)
             raise IOException(err_msg)
 
+        self._op_end(pin_stats.OP_READ, start)
         return result
 
     def __set_state_a(self, state):
@@ -355,7 +363,7 @@ class PiFaceGpioDigital(PiFaceGPIO):
         PiFaceGPIO.write(self, state)
 
         # determine A or B port based on pin address.
-        if self.inner_pin.value == self.GPIO_B_OFFSET:
+        if self.inner_pin.value < self.GPIO_B_OFFSET:
             self.__set_state_a(state)
         else:
             self.__set_state_b(state)
@@ -1,199 +1,136 @@
-"""PiFace I/O pins."""
+"""PiFace I/O pins.
 
+Each pin is a single shared raspy.io.pi_face_pins.PiFacePin descriptor, so
+pins can be compared by identity and classified with a set membership test
+against INPUTS or OUTPUTS. A pin called like a function returns itself, so
+Input00() and Input00 are the same pin.
+"""
 
-class PiFacePin:
-    """Base type for all PiFace Pins."""
 
-    def __init__(self):
-        """ctor."""
-        pass
+class PiFacePin(object):
+    """A PiFace I/O pin."""
 
-    value = -1
-    name = ""
+    __slots__ = ("__value", "__name")
 
+    def __init__(self, value, name):
+        """Initialize a new instance of raspy.io.pi_face_pins.PiFacePin.
 
-class Output00(PiFacePin):
-    """Output pin 1 (relay 1)."""
+        :param int value: The pin value.
+        :param str name: The pin name.
+        """
+        self.__value = value
+        self.__name = name
 
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
+    def __call__(self):
+        """Get this pin.
 
-    value = 1
-    name = "Output 1 (RELAY 1)"
+        Pins used to be classes that were instantiated to get the pin.
 
+        :returns: This pin.
+        :rtype: PiFacePin
+        """
+        return self
 
-class Output01(PiFacePin):
-    """Output pin 2 (RELAY 2)."""
+    def __repr__(self):
+        """Get the string representation of this pin.
 
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
+        :returns: The pin name.
+        :rtype: str
+        """
+        return "PiFacePin(" + self.__name + ")"
 
-    value = 2
-    name = "Output 2 (RELAY 2)"
+    @property
+    def value(self):
+        """Get the pin value.
 
+        :returns: The value.
+        :rtype: int
+        """
+        return self.__value
 
-class Output02(PiFacePin):
-    """Output pin 3."""
+    @property
+    def name(self):
+        """Get the pin name.
 
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
+        :returns: The name.
+        :rtype: str
+        """
+        return self.__name
 
-    value = 4
-    name = "Output 3"
 
+Output00 = PiFacePin(1, "Output 1 (RELAY 1)")
+"""Output pin 1 (relay 1)."""
 
-class Output03(PiFacePin):
-    """Output pin 4."""
+Output01 = PiFacePin(2, "Output 2 (RELAY 2)")
+"""Output pin 2 (RELAY 2)."""
 
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
+Output02 = PiFacePin(4, "Output 3")
+"""Output pin 3."""
 
-    value = 8
-    name = "Output 4"
+Output03 = PiFacePin(8, "Output 4")
+"""Output pin 4."""
 
+Output04 = PiFacePin(16, "Output 5")
+"""Output pin 5."""
 
-class Output04(PiFacePin):
-    """Output pin 5."""
+Output05 = PiFacePin(32, "Output 6")
+"""Output pin 6."""
 
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
+Output06 = PiFacePin(64, "Output 7")
+"""Output pin 7."""
 
-    value = 16
-    name = "Output 5"
+Output07 = PiFacePin(128, "Output 8")
+"""Output pin 8."""
 
+Input00 = PiFacePin(1001, "Input 1 (SWITCH 1)")
+"""Input pin 1 (switch 1)."""
 
-class Output05(PiFacePin):
-    """Output pin 6."""
+Input01 = PiFacePin(1002, "Input 2 (SWITCH 2)")
+"""Input pin 2 (switch 2)."""
 
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
+Input02 = PiFacePin(1004, "Input 3 (SWITCH 3)")
+"""Input pin 3 (switch 3)."""
 
-    value = 32
-    name = "Output 6"
+Input03 = PiFacePin(1008, "Input 4 (SWITCH 4)")
+"""Input pin 4 (switch 4)."""
 
+Input04 = PiFacePin(1016, "Input 5")
+"""Input pin 5."""
 
-class Output06(PiFacePin):
-    """Output pin 7."""
+Input05 = PiFacePin(1032, "Input 6")
+"""Input pin 6."""
 
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
+Input06 = PiFacePin(1064, "Input 7")
+"""Input pin 7."""
 
-    value = 64
-    name = "Output 7"
+Input07 = PiFacePin(1128, "Input 8")
+"""Input pin 8."""
 
+NonePin = PiFacePin(0, "NonePin")
+"""No pin assignment."""
 
-class Output07(PiFacePin):
-    """Output pin 8."""
+OUTPUT_PINS = (Output00, Output01, Output02, Output03, Output04, Output05,
+               Output06, Output07)
+"""All PiFace outputs, in order."""
 
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
+INPUT_PINS = (Input00, Input01, Input02, Input03, Input04, Input05, Input06,
+              Input07)
+"""All PiFace inputs, in order."""
 
-    value = 128
-    name = "Output 8"
+OUTPUTS = frozenset(OUTPUT_PINS)
+"""The set of PiFace outputs."""
 
+INPUTS = frozenset(INPUT_PINS)
+"""The set of PiFace inputs."""
 
-class Input00(PiFacePin):
-    """Input pin 1 (switch 1)."""
+_byValue = dict((pin.value, pin) for pin in OUTPUT_PINS + INPUT_PINS)
 
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
 
-    value = 1001
-    name = "Input 1 (SWITCH 1)"
+def get_by_value(value):
+    """Get a pin by value.
 
-
-class Input01(PiFacePin):
-    """Input pin 2 (switch 2)."""
-
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
-
-    value = 1002
-    name = "Input 2 (SWITCH 2)"
-
-
-class Input02(PiFacePin):
-    """Input pin 3 (switch 3)."""
-
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
-
-    value = 1004
-    name = "Input 3 (SWITCH 3)"
-
-
-class Input03(PiFacePin):
-    """Input pin 4 (switch 4)."""
-
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
-
-    value = 1008
-    name = "Input 4 (SWITCH 4)"
-
-
-class Input04(PiFacePin):
-    """Input pin 5."""
-
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
-
-    value = 1016
-    name = "Input 5"
-
-
-class Input05(PiFacePin):
-    """Input pin 6."""
-
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
-
-    value = 1032
-    name = "Input 6"
-
-
-class Input06(PiFacePin):
-    """Input pin 7."""
-
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
-
-    value = 1064
-    name = "Input 7"
-
-
-class Input07(PiFacePin):
-    """Input pin 8."""
-
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
-
-    value = 1128
-    name = "Input 8"
-
-
-class NonePin(PiFacePin):
-    """No pin assignment."""
-
-    def __init__(self):
-        """ctor."""
-        PiFacePin.__init__(self)
-
-    value = 0
-    name = "NonePin"
+    :param int value: The pin value.
+    :returns: The pin, or NonePin if there is no such pin.
+    :rtype: PiFacePin
+    """
+    return _byValue.get(value, NonePin)
@@ -0,0 +1,14 @@
+"""Possible interrupt edges for a GPIO input pin."""
+
+
+NONE = 0
+"""No edge. Interrupts are disabled."""
+
+RISING = 1
+"""Interrupt on the rising edge (LOW to HIGH)."""
+
+FALLING = 2
+"""Interrupt on the falling edge (HIGH to LOW)."""
+
+BOTH = 3
+"""Interrupt on both rising and falling edges."""
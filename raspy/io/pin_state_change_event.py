@@ -1,10 +1,13 @@
 """Pin state change event."""
 
 
+from raspy.pi_system import core_utils
+
+
 class PinStateChangeEvent(object):
     """Pin state change event."""
 
-    def __init__(self, old_state, new_state, pin_address):
+    def __init__(self, old_state, new_state, pin_address, timestamp_ns=None):
         """Initialize a new instance of the PinStateChangeEvent.
 
         Initializes a new instance of the raspy.io.PinStateChangeEvent class
@@ -13,10 +16,16 @@ class PinStateChangeEvent(object):
         :param int old_state: The previous pin state.
         :param int new_state: The new (current) pin state.
         :param int pin_address: The pin address.
+        :param int timestamp_ns: When the change was observed, in
+        nanoseconds of raspy.pi_system.core_utils.monotonic_ns(). If None,
+        the current time is used.
         """
         self.__oldState = old_state
         self.__newState = new_state
         self.__pinAddress = pin_address
+        self.__timestamp = timestamp_ns
+        if self.__timestamp is None:
+            self.__timestamp = core_utils.monotonic_ns()
 
     @property
     def old_state(self):
@@ -44,3 +53,12 @@ class PinStateChangeEvent(object):
         :rtype: int
         """
         return self.__pinAddress
+
+    @property
+    def timestamp_ns(self):
+        """Get when the change was observed.
+
+        :returns: The monotonic time of the change in nanoseconds.
+        :rtype: int
+        """
+        return self.__timestamp
@@ -0,0 +1,199 @@
+"""Per-pin I/O instrumentation.
+
+When enabled on a raspy.io.gpio.Gpio instance, a PinStats object counts the
+backend reads, writes and exports the pin performs, the state change events
+it raises and the I/O errors it hits, and keeps a fixed-bucket histogram of
+how long each backend operation took. Every PinStats also feeds a
+process-wide aggregate, so the total I/O load of an application can be
+inspected alongside the pins generating it.
+
+Recording is off by default and costs a couple of method calls per
+operation while off.
+"""
+
+
+import bisect
+import threading
+import weakref
+
+
+OP_READ = 0
+"""A backend read."""
+
+OP_WRITE = 1
+"""A backend write."""
+
+OP_EXPORT = 2
+"""A backend export or provisioning operation."""
+
+OP_NAMES = ("read", "write", "export")
+"""The snapshot names of the operations, indexed by OP_*."""
+
+BUCKET_BOUNDS_NS = (1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000,
+                    500000, 1000000, 2000000, 5000000, 10000000)
+"""The inclusive upper bounds of the latency buckets in nanoseconds.
+
+A final bucket holds everything slower than the last bound.
+"""
+
+_default_enabled = False
+_live = weakref.WeakSet()
+
+
+def is_enabled_by_default():
+    """Check to see if pins created from now on record statistics.
+
+    :returns: True if recording is on by default; Otherwise, False.
+    :rtype: bool
+    """
+    return _default_enabled
+
+
+def set_enabled_by_default(flag):
+    """Set whether pins created from now on record statistics.
+
+    :param bool flag: Set True to enable recording for new pins.
+    """
+    global _default_enabled
+    _default_enabled = bool(flag)
+
+
+class PinStats(object):
+    """I/O counters and latency histograms for a pin."""
+
+    def __init__(self, name=None, parent=None):
+        """Initialize a new instance of raspy.io.pin_stats.PinStats.
+
+        :param str name: The name the statistics are reported under.
+        :param PinStats parent: Statistics that everything recorded here is
+        also added to.
+        """
+        self.__name = name
+        self.__parent = parent
+        self.__lock = threading.Lock()
+        self.__counts = None
+        self.__totals = None
+        self.__histograms = None
+        self.__events = 0
+        self.__errors = 0
+        self.reset()
+
+    @property
+    def name(self):
+        """Get the name the statistics are reported under.
+
+        :returns: The name.
+        :rtype: str
+        """
+        return self.__name
+
+    def record(self, op, elapsed_ns):
+        """Record a completed backend operation.
+
+        :param int op: The operation (OP_*).
+        :param int elapsed_ns: How long the operation took in nanoseconds.
+        """
+        bucket = bisect.bisect_left(BUCKET_BOUNDS_NS, elapsed_ns)
+        with self.__lock:
+            self.__counts[op] += 1
+            self.__totals[op] += elapsed_ns
+            self.__histograms[op][bucket] += 1
+
+        if self.__parent is not None:
+            self.__parent.record(op, elapsed_ns)
+
+    def record_event(self):
+        """Record a state change event raised."""
+        with self.__lock:
+            self.__events += 1
+
+        if self.__parent is not None:
+            self.__parent.record_event()
+
+    def record_error(self):
+        """Record a failed backend operation."""
+        with self.__lock:
+            self.__errors += 1
+
+        if self.__parent is not None:
+            self.__parent.record_error()
+
+    def reset(self):
+        """Clear all counters and histograms.
+
+        The parent statistics are left unchanged.
+        """
+        size = len(BUCKET_BOUNDS_NS) + 1
+        with self.__lock:
+            self.__counts = [0] * len(OP_NAMES)
+            self.__totals = [0] * len(OP_NAMES)
+            self.__histograms = [[0] * size for _ in OP_NAMES]
+            self.__events = 0
+            self.__errors = 0
+
+    def snapshot(self):
+        """Get a copy of the current statistics.
+
+        The snapshot has the keys "name", "reads", "writes", "exports",
+        "events" and "errors", plus "total_ns" and "histogram", which map
+        each operation name in OP_NAMES to the total time spent in it and
+        to its bucket counts (aligned with BUCKET_BOUNDS_NS) respectively.
+
+        :returns: The statistics.
+        :rtype: dict
+        """
+        with self.__lock:
+            result = {
+                "name": self.__name,
+                "reads": self.__counts[OP_READ],
+                "writes": self.__counts[OP_WRITE],
+                "exports": self.__counts[OP_EXPORT],
+                "events": self.__events,
+                "errors": self.__errors,
+                "total_ns": dict(zip(OP_NAMES, self.__totals)),
+                "histogram": dict((n, list(h)) for n, h in
+                                  zip(OP_NAMES, self.__histograms))
+            }
+
+        return result
+
+
+_total = PinStats("total")
+
+
+def create(name):
+    """Create statistics that feed the process-wide aggregate.
+
+    :param str name: The name the statistics are reported under.
+    :returns: The new statistics.
+    :rtype: PinStats
+    """
+    stats = PinStats(name, _total)
+    _live.add(stats)
+    return stats
+
+
+def get_aggregate():
+    """Get the process-wide aggregate of every pin's statistics.
+
+    The aggregate keeps counting what pins recorded after they are
+    disposed.
+
+    :returns: A snapshot of the aggregate (see PinStats.snapshot()).
+    :rtype: dict
+    """
+    return _total.snapshot()
+
+
+def get_all():
+    """Get the statistics of every pin currently recording.
+
+    :returns: A list of snapshots (see PinStats.snapshot()).
+    :rtype: list
+    """
+    return [s.snapshot() for s in list(_live)]
+
+
+def reset_aggregate():
+    """Clear the process-wide aggregate."""
+    _total.reset()
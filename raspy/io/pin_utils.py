@@ -1,11 +1,19 @@
 """This module contains utility methods for working with pins."""
 
 
+import errno
+import os
+import select
 from raspy import string_utils
+from raspy.io import pin_edge
 from raspy.io import pin_mode
 from raspy.io.io_exception import IOException
 
 
+_write_hook = None
+_edge_hook = None
+
+
 def get_pin_mode_name(mode):
     """Convert the specified mode to its name string.
 
@@ -41,6 +49,39 @@ def get_pin_mode_name(mode):
         return string_utils.EMPTY
 
 
+def get_pin_direction_name(mode):
+    """Convert the specified mode to its sysfs direction string.
+
+    :param int mode: The mode to get the direction of.
+    :returns: "in" for input pins; Otherwise, "out".
+    :rtype: string
+    """
+    if mode == pin_mode.IN:
+        return "in"
+
+    return "out"
+
+
+def get_pin_edge_name(edge):
+    """Convert the specified edge to its sysfs edge string.
+
+    :param int edge: The edge to get the name of.
+    :returns: The edge name ("none", "rising", "falling" or "both").
+    :rtype: string
+    """
+    if edge == pin_edge.RISING:
+        return "rising"
+
+    elif edge == pin_edge.FALLING:
+        return "falling"
+
+    elif edge == pin_edge.BOTH:
+        return "both"
+
+    else:
+        return "none"
+
+
 def write_fs_pin(pin_path, val_string):
     """Write the specified string to the specified pin.
 
@@ -56,6 +97,71 @@ def write_fs_pin(pin_path, val_string):
     except IOError as ex:
         raise IOException(ex.strerror)
 
+    if _write_hook is not None:
+        _write_hook(pin_path, val_string)
+
+
+def set_fs_write_hook(hook):
+    """Set a function to call after every write_fs_pin() call.
+
+    This lets a simulator react to control files such as export and
+    unexport the way the kernel would. The hook is not called for writes
+    through open descriptors (write_fs_pin_fd()).
+
+    :param function hook: A function taking the path and value string
+    written, or None to remove the hook.
+    """
+    global _write_hook
+    _write_hook = hook
+
+
+def set_fs_edge_hook(hook):
+    """Set a function that supplies edge notifications for value files.
+
+    The kernel signals an edge on a sysfs value file with POLLPRI, which a
+    regular file never raises. A simulator can instead hand out, for each
+    value file, the read end of a non-blocking pipe it writes to on every
+    edge.
+
+    :param function hook: A function taking the value file path and
+    returning a file descriptor (or None to use the value file itself), or
+    None to remove the hook.
+    """
+    global _edge_hook
+    _edge_hook = hook
+
+
+def get_fs_edge_fd(pin_path, fd):
+    """Get the descriptor and poll flags that signal edges on a pin.
+
+    :param string pin_path: The full path to the pin value file.
+    :param int fd: The file descriptor of the value file returned by
+    open_fs_pin().
+    :returns: A (file descriptor, poll flags) tuple to register with
+    select.poll().
+    :rtype: tuple
+    """
+    if _edge_hook is not None:
+        edge_fd = _edge_hook(pin_path)
+        if edge_fd is not None:
+            return (edge_fd, select.POLLIN)
+
+    return (fd, select.POLLPRI | select.POLLERR)
+
+
+def drain_fs_edge(edge_fd):
+    """Discard the pending notifications on a hooked edge descriptor.
+
+    :param int edge_fd: A file descriptor returned by get_fs_edge_fd() that
+    differs from the value file descriptor.
+    """
+    try:
+        while os.read(edge_fd, 4096):
+            pass
+    except OSError as ex:
+        if ex.errno != errno.EAGAIN:
+            raise IOException(ex.strerror)
+
 
 def read_fs_pin(pin_path):
     """Read the value from the specified pin.
@@ -75,3 +181,65 @@ def read_fs_pin(pin_path):
         raise IOException(ex.strerror)
 
     return val
+
+
+def open_fs_pin(pin_path):
+    """Open the specified pin for repeated reads and writes.
+
+    The returned file descriptor stays open until passed to close_fs_pin(),
+    which allows callers to avoid re-opening the pin on every access.
+
+    :param string pin_path: The full path to the pin to open.
+    :returns: The file descriptor of the opened pin.
+    :rtype: int
+    :raises: raspy.io.io_exception.IOException if an OSError occurred while
+    opening the pin.
+    """
+    try:
+        return os.open(pin_path, os.O_RDWR)
+    except OSError as ex:
+        raise IOException(ex.strerror)
+
+
+def close_fs_pin(fd):
+    """Close a pin file descriptor previously opened by open_fs_pin().
+
+    :param int fd: The file descriptor to close.
+    """
+    try:
+        os.close(fd)
+    except OSError:
+        pass
+
+
+def write_fs_pin_fd(fd, val_string):
+    """Write the specified string to an open pin file descriptor.
+
+    :param int fd: The file descriptor returned by open_fs_pin().
+    :param string val_string: The value string to write to the pin.
+    :raises: raspy.io.io_exception.IOException if an OSError occurred while
+    accessing the pin.
+    """
+    try:
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, val_string)
+    except OSError as ex:
+        raise IOException(ex.strerror)
+
+
+def read_fs_pin_fd(fd):
+    """Read the value from an open pin file descriptor.
+
+    :param int fd: The file descriptor returned by open_fs_pin().
+    :returns: The value read from the pin.
+    :rtype: int
+    :raises: raspy.io.io_exception.IOException if an OSError occurred while
+    accessing the pin.
+    """
+    try:
+        os.lseek(fd, 0, os.SEEK_SET)
+        read_string = os.read(fd, 1)
+    except OSError as ex:
+        raise IOException(ex.strerror)
+
+    return int(read_string[0:1])
@@ -36,3 +36,8 @@ DIVISOR1024 = 1024
 
 DIVISOR2048 = 2048
 """Divide clock by a factor of 2048."""
+
+ALL = (DIVISOR1, DIVISOR2, DIVISOR4, DIVISOR8, DIVISOR16, DIVISOR32,
+       DIVISOR64, DIVISOR128, DIVISOR256, DIVISOR512, DIVISOR1024,
+       DIVISOR2048)
+"""All divisors, in ascending order."""
@@ -0,0 +1,541 @@
+"""Hardware PWM driven directly through the PWM and clock manager registers.
+
+The sysfs PWM driver (raspy.io.pwm_sysfs) only takes a period and duty
+cycle and leaves the PWM clock at whatever it was set to. This module
+programs the BCM283x PWM peripheral itself: compute_timing() picks the
+clock divisor and range that come closest to a requested frequency at a
+required duty resolution, and MemPwm writes them to the clock manager and
+PWM registers along with the output mode (mark-space or balanced).
+
+Both register blocks are accessed through raspy.io.gpio_mem.GpioMemMap, so
+a plain file of BLOCK_SIZE bytes can stand in for each of them in tests.
+Mapping the real registers requires /dev/mem and therefore root.
+"""
+
+
+import struct
+from raspy.disposable import Disposable
+from raspy.illegal_argument_exception import IllegalArgumentException
+from raspy.object_disposed_exception import ObjectDisposedException
+from raspy.io import gpio_mem
+from raspy.io import pwm_channel
+from raspy.io import pwm_mode
+from raspy.io import pwm_sysfs
+from raspy.io.gpio_mem import GpioMemMap
+from raspy.io.io_exception import IOException
+from raspy.pi_system import core_utils
+
+
+MEM_PATH = "/dev/mem"
+"""The physical memory device the register blocks are mapped from."""
+
+DEFAULT_PERIPHERAL_BASE = 0x20000000
+"""The physical peripheral base address of the BCM2835."""
+
+RANGES_PATH = "/proc/device-tree/soc/ranges"
+"""The device tree property the peripheral base address is read from."""
+
+PWM_OFFSET = 0x20C000
+"""The offset of the PWM block from the peripheral base."""
+
+CLOCK_OFFSET = 0x101000
+"""The offset of the clock manager block from the peripheral base."""
+
+PWM_CTL = 0x00
+"""The PWM control register."""
+
+PWM_RNG1 = 0x10
+"""The range register of channel 0. Channel 1 follows at 0x20."""
+
+PWM_DAT1 = 0x14
+"""The data register of channel 0. Channel 1 follows at 0x24."""
+
+PWM_CHANNEL_STRIDE = 0x10
+"""The distance between the range and data registers of the channels."""
+
+PWM_CTL_PWEN = 0x01
+"""Channel enable bit of PWM_CTL. Channel 1 bits are shifted by 8."""
+
+PWM_CTL_MSEN = 0x80
+"""Mark-space enable bit of PWM_CTL. Channel 1 bits are shifted by 8."""
+
+CM_PWMCTL = 0xA0
+"""The PWM clock control register."""
+
+CM_PWMDIV = 0xA4
+"""The PWM clock divisor register."""
+
+CM_PASSWORD = 0x5A000000
+"""The password every clock manager write must carry."""
+
+CM_SRC_OSC = 0x01
+"""Clock source: the crystal oscillator."""
+
+CM_ENAB = 0x10
+"""Clock enable bit of CM_PWMCTL."""
+
+CM_BUSY = 0x80
+"""Clock busy bit of CM_PWMCTL."""
+
+CLOCK_STOP_TIMEOUT_NS = 10000000
+"""How long to wait for the PWM clock to stop before giving up."""
+
+MIN_DIVISOR = 1
+"""The smallest integer clock divisor."""
+
+MAX_DIVISOR = 4095
+"""The largest integer clock divisor (12 bits)."""
+
+MAX_RANGE = 0xFFFFFFFF
+"""The largest PWM range."""
+
+DEFAULT_RESOLUTION = 2
+"""The default minimum range (number of duty cycle steps)."""
+
+_ALT_FUNCTIONS = {
+    12: gpio_mem.FSEL_ALT0,
+    13: gpio_mem.FSEL_ALT0,
+    18: gpio_mem.FSEL_ALT5,
+    19: gpio_mem.FSEL_ALT5
+}
+
+
+def get_peripheral_base():
+    """Get the physical peripheral base address of this board.
+
+    :returns: The base address from the device tree, or
+    DEFAULT_PERIPHERAL_BASE if it cannot be read.
+    :rtype: int
+    """
+    try:
+        target = open(RANGES_PATH, 'rb')
+        data = target.read(12)
+        target.close()
+    except IOError:
+        return DEFAULT_PERIPHERAL_BASE
+
+    if len(data) < 8:
+        return DEFAULT_PERIPHERAL_BASE
+
+    base = struct.unpack(">I", data[4:8])[0]
+    if base == 0 and len(data) >= 12:
+        base = struct.unpack(">I", data[8:12])[0]
+
+    return base or DEFAULT_PERIPHERAL_BASE
+
+
+def route_pin(gpio_num, gpio_map):
+    """Switch a GPIO to its hardware PWM alternate function.
+
+    :param int gpio_num: The GPIO number (12, 13, 18 or 19).
+    :param raspy.io.gpio_mem.GpioMemMap gpio_map: The GPIO register map.
+    :returns: The PWM channel the GPIO is now driven by.
+    :rtype: int
+    :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+    the GPIO cannot output hardware PWM.
+    """
+    fsel = _ALT_FUNCTIONS.get(gpio_num)
+    if fsel is None:
+        msg = "GPIO " + str(gpio_num) + " cannot output hardware PWM."
+        raise IllegalArgumentException(msg)
+
+    gpio_map.set_function(gpio_num, fsel)
+    return pwm_sysfs.get_pwm_channel(gpio_num)
+
+
+class PwmTiming(object):
+    """A clock divisor and range pair for the PWM peripheral."""
+
+    def __init__(self, divisor, rng, clock_hz=pwm_sysfs.BASE_CLOCK_HZ):
+        """Initialize a new instance of raspy.io.pwm_mem.PwmTiming.
+
+        :param int divisor: The clock divisor.
+        :param int rng: The PWM range.
+        :param int clock_hz: The oscillator the PWM clock is derived from.
+        """
+        self.__divisor = divisor
+        self.__range = rng
+        self.__clockHz = clock_hz
+
+    @property
+    def divisor(self):
+        """Get the clock divisor.
+
+        :returns: The divisor.
+        :rtype: int
+        """
+        return self.__divisor
+
+    @property
+    def range(self):
+        """Get the PWM range, which is the number of duty cycle steps.
+
+        :returns: The range.
+        :rtype: int
+        """
+        return self.__range
+
+    @property
+    def frequency(self):
+        """Get the output frequency this timing produces in mark-space mode.
+
+        :returns: The frequency in Hz.
+        :rtype: float
+        """
+        return self.__clockHz / (float(self.__divisor) * self.__range)
+
+    @property
+    def period_ns(self):
+        """Get the output period this timing produces in mark-space mode.
+
+        :returns: The period in nanoseconds.
+        :rtype: int
+        """
+        return int(round(self.__divisor * self.__range * 1000000000.0 /
+                         self.__clockHz))
+
+
+def compute_timing(frequency, resolution=DEFAULT_RESOLUTION,
+                   clock_hz=pwm_sysfs.BASE_CLOCK_HZ, divisors=None):
+    """Find the divisor and range closest to a frequency.
+
+    The pair with the smallest frequency error wins. Ties go to the smaller
+    divisor, which leaves the larger range and so the finer duty cycle.
+
+    :param float frequency: The requested output frequency in Hz.
+    :param int resolution: The minimum range (number of duty cycle steps).
+    :param int clock_hz: The oscillator the PWM clock is derived from.
+    :param list divisors: The divisors to choose from, such as the
+    raspy.io.pwm_clock_divider values. If None, any divisor from MIN_DIVISOR
+    to MAX_DIVISOR is considered.
+    :returns: The best timing.
+    :rtype: PwmTiming
+    :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+    the frequency is not positive or cannot be produced at the requested
+    resolution.
+    """
+    if frequency is None or frequency <= 0:
+        raise IllegalArgumentException("frequency must be greater than zero.")
+
+    if resolution is None or resolution < 1:
+        resolution = 1
+
+    if divisors is None:
+        divisors = xrange(MIN_DIVISOR, MAX_DIVISOR + 1)
+    else:
+        divisors = sorted(d for d in divisors
+                          if MIN_DIVISOR <= d <= MAX_DIVISOR)
+
+    best = None
+    best_error = None
+    for divisor in divisors:
+        ticks = clock_hz / (float(divisor) * frequency)
+        rng = int(round(ticks))
+        if rng < resolution:
+            # The range only shrinks as the divisor grows.
+            break
+
+        if rng > MAX_RANGE:
+            continue
+
+        error = abs(clock_hz / (float(divisor) * rng) - frequency)
+        if best is None or error < best_error:
+            best = (divisor, rng)
+            best_error = error
+
+    if best is None:
+        msg = "A frequency of " + str(frequency) + " Hz cannot be produced "
+        msg += "with a resolution of " + str(resolution) + "."
+        raise IllegalArgumentException(msg)
+
+    return PwmTiming(best[0], best[1], clock_hz)
+
+
+class MemPwm(Disposable):
+    """A hardware PWM channel driven through the peripheral registers.
+
+    Both channels share the PWM clock, so changing the frequency of one
+    channel also changes the clock the other channel runs from.
+    """
+
+    def __init__(self, channel=pwm_channel.CHANNEL0, pwm_map=None,
+                 clock_map=None, clock_hz=pwm_sysfs.BASE_CLOCK_HZ):
+        """Initialize a new instance of raspy.io.pwm_mem.MemPwm.
+
+        :param int channel: The PWM channel (raspy.io.pwm_channel).
+        :param raspy.io.gpio_mem.GpioMemMap pwm_map: The PWM register block.
+        If None, it is mapped from MEM_PATH.
+        :param raspy.io.gpio_mem.GpioMemMap clock_map: The clock manager
+        register block. If None, it is mapped from MEM_PATH.
+        :param int clock_hz: The oscillator the PWM clock is derived from.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        the channel is invalid.
+        :raises: raspy.io.io_exception.IOException if a register block could
+        not be mapped.
+        """
+        Disposable.__init__(self)
+        if channel not in (pwm_channel.CHANNEL0, pwm_channel.CHANNEL1):
+            raise IllegalArgumentException("Invalid PWM channel.")
+
+        self.__ownedMaps = []
+        if pwm_map is None or clock_map is None:
+            base = get_peripheral_base()
+            if pwm_map is None:
+                pwm_map = GpioMemMap(MEM_PATH, base + PWM_OFFSET)
+                self.__ownedMaps.append(pwm_map)
+
+            if clock_map is None:
+                clock_map = GpioMemMap(MEM_PATH, base + CLOCK_OFFSET)
+                self.__ownedMaps.append(clock_map)
+
+        self.__channel = channel
+        self.__pwm = pwm_map
+        self.__clock = clock_map
+        self.__clockHz = clock_hz
+        self.__shift = 8 * channel
+        self.__rngReg = PWM_RNG1 + PWM_CHANNEL_STRIDE * channel
+        self.__datReg = PWM_DAT1 + PWM_CHANNEL_STRIDE * channel
+        self.__timing = None
+
+    @property
+    def channel(self):
+        """Get the PWM channel.
+
+        :returns: The PWM channel.
+        :rtype: int
+        """
+        return self.__channel
+
+    @property
+    def timing(self):
+        """Get the timing last set by set_frequency().
+
+        :returns: The timing, or None if no frequency has been set.
+        :rtype: PwmTiming
+        """
+        return self.__timing
+
+    @property
+    def range(self):
+        """Get the PWM range.
+
+        :returns: The range.
+        :rtype: int
+        """
+        return self.__pwm.read_register(self.__rngReg)
+
+    @range.setter
+    def range(self, rng):
+        """Set the PWM range.
+
+        :param int rng: The range (1 to MAX_RANGE).
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        the range is out of bounds.
+        """
+        if rng is None or rng < 1 or rng > MAX_RANGE:
+            raise IllegalArgumentException("Invalid PWM range.")
+
+        self.__pwm.write_register(self.__rngReg, rng)
+
+    @property
+    def value(self):
+        """Get the PWM value (the high time in range steps).
+
+        :returns: The value.
+        :rtype: int
+        """
+        return self.__pwm.read_register(self.__datReg)
+
+    @value.setter
+    def value(self, val):
+        """Set the PWM value (the high time in range steps).
+
+        :param int val: The value. Clamped to 0 through the range.
+        """
+        val = max(0, min(int(val), self.range))
+        self.__pwm.write_register(self.__datReg, val)
+
+    @property
+    def duty_cycle(self):
+        """Get the fraction of each period the output is high.
+
+        :returns: The duty cycle from 0.0 to 1.0.
+        :rtype: float
+        """
+        rng = self.range
+        if rng == 0:
+            return 0.0
+
+        return self.value / float(rng)
+
+    @duty_cycle.setter
+    def duty_cycle(self, duty):
+        """Set the fraction of each period the output is high.
+
+        :param float duty: The duty cycle from 0.0 to 1.0.
+        """
+        self.value = int(round(max(0.0, min(duty, 1.0)) * self.range))
+
+    @property
+    def mode(self):
+        """Get the output mode.
+
+        :returns: The mode (raspy.io.pwm_mode).
+        :rtype: int
+        """
+        ctl = self.__pwm.read_register(PWM_CTL)
+        if ctl & (PWM_CTL_MSEN << self.__shift):
+            return pwm_mode.MARKSPACE
+
+        return pwm_mode.BALANCED
+
+    @mode.setter
+    def mode(self, mode):
+        """Set the output mode.
+
+        Mark-space mode outputs one high pulse per period, which is what
+        servos and buzzers expect. Balanced mode spreads the high time
+        evenly over the period, which suits filtered analog output.
+
+        :param int mode: The mode (raspy.io.pwm_mode).
+        """
+        bit = PWM_CTL_MSEN << self.__shift
+        ctl = self.__pwm.read_register(PWM_CTL)
+        if mode == pwm_mode.MARKSPACE:
+            ctl |= bit
+        else:
+            ctl &= ~bit
+
+        self.__pwm.write_register(PWM_CTL, ctl)
+
+    @property
+    def is_enabled(self):
+        """Get whether or not the channel output is enabled.
+
+        :returns: True if enabled; Otherwise, False.
+        :rtype: bool
+        """
+        ctl = self.__pwm.read_register(PWM_CTL)
+        return (ctl & (PWM_CTL_PWEN << self.__shift)) != 0
+
+    def enable(self, flag):
+        """Enable or disable the channel output.
+
+        :param bool flag: Set True to enable the output.
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("MemPwm")
+
+        bit = PWM_CTL_PWEN << self.__shift
+        ctl = self.__pwm.read_register(PWM_CTL)
+        if flag:
+            ctl |= bit
+        else:
+            ctl &= ~bit
+
+        self.__pwm.write_register(PWM_CTL, ctl)
+
+    def set_clock_divisor(self, divisor):
+        """Program the PWM clock to run from the oscillator divided by divisor.
+
+        PWM output is paused while the clock is stopped and reprogrammed.
+
+        :param int divisor: The integer divisor (MIN_DIVISOR to MAX_DIVISOR).
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        the divisor is out of bounds.
+        :raises: raspy.io.io_exception.IOException if the clock did not stop.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("MemPwm")
+
+        if divisor is None or divisor < MIN_DIVISOR or divisor > MAX_DIVISOR:
+            raise IllegalArgumentException("Invalid PWM clock divisor.")
+
+        ctl = self.__pwm.read_register(PWM_CTL)
+        self.__pwm.write_register(PWM_CTL, 0)
+
+        clock_ctl = self.__clock.read_register(CM_PWMCTL) & 0x00FFFFFF
+        self.__clock.write_register(CM_PWMCTL,
+                                    CM_PASSWORD | (clock_ctl & ~CM_ENAB))
+        deadline = core_utils.monotonic_ns() + CLOCK_STOP_TIMEOUT_NS
+        while self.__clock.read_register(CM_PWMCTL) & CM_BUSY:
+            if core_utils.monotonic_ns() > deadline:
+                self.__pwm.write_register(PWM_CTL, ctl)
+                raise IOException("The PWM clock did not stop.")
+
+        self.__clock.write_register(CM_PWMDIV, CM_PASSWORD | (divisor << 12))
+        self.__clock.write_register(CM_PWMCTL,
+                                    CM_PASSWORD | CM_SRC_OSC | CM_ENAB)
+        self.__pwm.write_register(PWM_CTL, ctl)
+
+    def set_frequency(self, frequency, resolution=DEFAULT_RESOLUTION,
+                      divisors=None):
+        """Program the clock and range for the specified frequency.
+
+        The duty cycle is kept.
+
+        :param float frequency: The output frequency in Hz.
+        :param int resolution: The minimum range (number of duty cycle
+        steps).
+        :param list divisors: The divisors to choose from. See
+        compute_timing().
+        :returns: The timing programmed.
+        :rtype: PwmTiming
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        the frequency cannot be produced.
+        :raises: raspy.io.io_exception.IOException if the clock did not stop.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("MemPwm")
+
+        timing = compute_timing(frequency, resolution, self.__clockHz,
+                                divisors)
+        duty = self.duty_cycle
+        self.set_clock_divisor(timing.divisor)
+        self.range = timing.range
+        self.duty_cycle = duty
+        self.__timing = timing
+        return timing
+
+    def configure(self, frequency, duty_cycle, resolution=DEFAULT_RESOLUTION,
+                  mode=pwm_mode.MARKSPACE):
+        """Set the frequency, duty cycle and mode and enable the output.
+
+        :param float frequency: The output frequency in Hz.
+        :param float duty_cycle: The duty cycle from 0.0 to 1.0.
+        :param int resolution: The minimum range (number of duty cycle
+        steps).
+        :param int mode: The output mode (raspy.io.pwm_mode).
+        :returns: The timing programmed.
+        :rtype: PwmTiming
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        the frequency cannot be produced.
+        :raises: raspy.io.io_exception.IOException if the clock did not stop.
+        """
+        timing = self.set_frequency(frequency, resolution)
+        self.duty_cycle = duty_cycle
+        self.mode = mode
+        self.enable(True)
+        return timing
+
+    def dispose(self):
+        """Disable the channel output and unmap owned register blocks."""
+        if self.is_disposed:
+            return
+
+        self.enable(False)
+        for mem_map in self.__ownedMaps:
+            mem_map.dispose()
+
+        self.__ownedMaps = []
+        self.__pwm = None
+        self.__clock = None
+        Disposable.dispose(self)
@@ -0,0 +1,280 @@
+"""Hardware PWM through the kernel sysfs PWM interface.
+
+The BCM283x PWM peripheral is exposed as /sys/class/pwm/pwmchipN once the
+pwm (or pwm-2chan) overlay is loaded. Each channel is exported once and then
+driven by writing nanosecond period and duty cycle values to descriptors that
+are kept open, so a duty-cycle change costs a single write() rather than a
+forked process.
+
+The kernel driver only implements mark-space output, so the balanced mode of
+raspy.io.pwm_mode is not available through this interface.
+"""
+
+
+import os
+import threading
+from raspy.disposable import Disposable
+from raspy.illegal_argument_exception import IllegalArgumentException
+from raspy.object_disposed_exception import ObjectDisposedException
+from raspy.io import pin_utils
+from raspy.io import pwm_channel
+
+
+PWM_PATH = "/sys/class/pwm/"
+"""The filesystem base path for PWM chips."""
+
+DEFAULT_PWM_CHIP = 0
+"""The PWM chip the BCM283x PWM peripheral is registered as."""
+
+BASE_CLOCK_HZ = 19200000
+"""The oscillator the PWM clock is derived from."""
+
+DEFAULT_CLOCK_DIVISOR = 32
+"""The PWM clock divisor used by the gpio utility and wiringPi."""
+
+PWM_CLOCK_HZ = BASE_CLOCK_HZ // DEFAULT_CLOCK_DIVISOR
+"""The rate one unit of PWM range corresponds to (600 kHz)."""
+
+_CHANNELS = {
+    12: pwm_channel.CHANNEL0,
+    18: pwm_channel.CHANNEL0,
+    13: pwm_channel.CHANNEL1,
+    19: pwm_channel.CHANNEL1
+}
+
+
+def get_pwm_path():
+    """Get the filesystem base path for PWM chips.
+
+    :returns: The sysfs PWM root, including the trailing separator.
+    :rtype: str
+    """
+    return PWM_PATH
+
+
+def set_pwm_path(path):
+    """Set the filesystem base path for PWM chips.
+
+    It only affects channels created afterward.
+
+    :param str path: The sysfs PWM root. If None, the default
+    /sys/class/pwm/ is restored.
+    """
+    global PWM_PATH
+    if path is None:
+        path = "/sys/class/pwm/"
+
+    if not path.endswith("/"):
+        path += "/"
+
+    PWM_PATH = path
+
+
+def get_pwm_channel(gpio_num):
+    """Get the hardware PWM channel the specified GPIO is routed to.
+
+    :param int gpio_num: The GPIO number.
+    :returns: The PWM channel (raspy.io.pwm_channel.CHANNEL0 or CHANNEL1) if
+    the GPIO can output hardware PWM; Otherwise, None.
+    :rtype: int
+    """
+    return _CHANNELS.get(gpio_num)
+
+
+def get_period_ns(rng, clock_hz=PWM_CLOCK_HZ):
+    """Get the PWM period for the specified range.
+
+    One unit of range is one tick of the PWM clock, which matches how
+    wiringPi and the gpio utility interpret the range.
+
+    :param int rng: The PWM range.
+    :param int clock_hz: The PWM clock rate.
+    :returns: The period in nanoseconds.
+    :rtype: int
+    """
+    return int(round(rng * 1000000000.0 / clock_hz))
+
+
+def get_duty_cycle_ns(val, rng, period_ns):
+    """Get the PWM duty cycle for the specified value.
+
+    :param int val: The PWM value (0 to rng).
+    :param int rng: The PWM range.
+    :param int period_ns: The period in nanoseconds.
+    :returns: The duty cycle in nanoseconds.
+    :rtype: int
+    """
+    if rng <= 0:
+        return 0
+
+    return int(round(period_ns * float(val) / rng))
+
+
+class SysfsPwm(Disposable):
+    """A hardware PWM channel driven through sysfs."""
+
+    def __init__(self, channel, chip=DEFAULT_PWM_CHIP):
+        """Initialize a new instance of raspy.io.pwm_sysfs.SysfsPwm.
+
+        :param int channel: The PWM channel (raspy.io.pwm_channel).
+        :param int chip: The PWM chip number.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        the channel is negative.
+        """
+        Disposable.__init__(self)
+        if channel is None or channel < 0:
+            raise IllegalArgumentException("Invalid PWM channel.")
+
+        self.__channel = channel
+        self.__chipPath = PWM_PATH + "pwmchip" + str(chip) + "/"
+        self.__path = self.__chipPath + "pwm" + str(channel) + "/"
+        self.__lock = threading.Lock()
+        self.__fds = dict()
+        self.__exported = False
+        self.__period = None
+        self.__dutyCycle = None
+        self.__enabled = None
+
+    @property
+    def channel(self):
+        """Get the PWM channel.
+
+        :returns: The PWM channel.
+        :rtype: int
+        """
+        return self.__channel
+
+    @property
+    def path(self):
+        """Get the sysfs directory of the channel.
+
+        :returns: The channel directory.
+        :rtype: str
+        """
+        return self.__path
+
+    @property
+    def period(self):
+        """Get the last period written.
+
+        :returns: The period in nanoseconds, or None if not yet configured.
+        :rtype: int
+        """
+        return self.__period
+
+    @property
+    def duty_cycle(self):
+        """Get the last duty cycle written.
+
+        :returns: The duty cycle in nanoseconds, or None if not yet
+        configured.
+        :rtype: int
+        """
+        return self.__dutyCycle
+
+    @property
+    def is_enabled(self):
+        """Get whether or not the channel output is enabled.
+
+        :returns: True if enabled; Otherwise, False.
+        :rtype: bool
+        """
+        return self.__enabled is True
+
+    def export(self):
+        """Export the channel and open its attribute files.
+
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.io.io_exception.IOException if the channel could not
+        be exported.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("SysfsPwm")
+
+        with self.__lock:
+            if self.__exported:
+                return
+
+            if not os.path.exists(self.__path):
+                pin_utils.write_fs_pin(self.__chipPath + "export",
+                                       str(self.__channel))
+
+            for name in ("period", "duty_cycle", "enable"):
+                self.__fds[name] = pin_utils.open_fs_pin(self.__path + name)
+
+            self.__exported = True
+
+    def __write(self, name, val):
+        """Write an attribute through its cached descriptor.
+
+        :param str name: The attribute name.
+        :param int val: The value to write.
+        """
+        pin_utils.write_fs_pin_fd(self.__fds[name], str(val))
+
+    def configure(self, period_ns, duty_ns):
+        """Set the period and duty cycle of the channel.
+
+        Only values that differ from the last ones written are sent to the
+        kernel. The kernel rejects a duty cycle longer than the period, so
+        the two are written in whichever order keeps that true.
+
+        :param int period_ns: The period in nanoseconds.
+        :param int duty_ns: The duty cycle in nanoseconds.
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.io.io_exception.IOException if the channel could not
+        be written.
+        """
+        self.export()
+        period_ns = max(int(period_ns), 1)
+        duty_ns = min(max(int(duty_ns), 0), period_ns)
+        with self.__lock:
+            if self.__dutyCycle is not None and duty_ns < self.__dutyCycle:
+                self.__write("duty_cycle", duty_ns)
+                self.__dutyCycle = duty_ns
+
+            if period_ns != self.__period:
+                self.__write("period", period_ns)
+                self.__period = period_ns
+
+            if duty_ns != self.__dutyCycle:
+                self.__write("duty_cycle", duty_ns)
+                self.__dutyCycle = duty_ns
+
+    def enable(self, flag):
+        """Enable or disable the channel output.
+
+        :param bool flag: Set True to enable the output.
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.io.io_exception.IOException if the channel could not
+        be written.
+        """
+        self.export()
+        flag = bool(flag)
+        with self.__lock:
+            if self.__enabled != flag:
+                self.__write("enable", int(flag))
+                self.__enabled = flag
+
+    def dispose(self):
+        """Disable and unexport the channel and close its descriptors."""
+        if self.is_disposed:
+            return
+
+        with self.__lock:
+            if self.__exported:
+                if self.__enabled:
+                    self.__write("enable", 0)
+
+                for fd in self.__fds.values():
+                    pin_utils.close_fs_pin(fd)
+
+                self.__fds.clear()
+                pin_utils.write_fs_pin(self.__chipPath + "unexport",
+                                       str(self.__channel))
+                self.__exported = False
+
+        Disposable.dispose(self)
@@ -0,0 +1,459 @@
+"""Software PWM for pins without a hardware PWM channel.
+
+A single SoftPwmEngine thread drives any number of channels. Every channel
+keeps the deadline of its next edge in one heap ordered by time; the engine
+sleeps until the earliest deadline, writes that pin through its own backend
+and schedules the channel's following edge. Adding a channel therefore costs
+a heap entry, not a thread. The final stretch before each edge is timed
+with raspy.pi_system.core_utils.sleep_until_ns(), and pins are written
+without holding the engine lock.
+
+Each channel records how late its edges were written (jitter) and the
+frequency it actually achieved, so callers can tell when a backend or a
+loaded system can't keep up with the requested rate.
+"""
+
+
+import heapq
+import itertools
+import threading
+from raspy.disposable import Disposable
+from raspy.illegal_argument_exception import IllegalArgumentException
+from raspy.invalid_operation_exception import InvalidOperationException
+from raspy.object_disposed_exception import ObjectDisposedException
+from raspy.io import pin_state
+from raspy.pi_system import core_utils
+
+
+DEFAULT_FREQUENCY = 100.0
+"""The default channel frequency in Hz."""
+
+MAX_FREQUENCY = 10000.0
+"""The highest channel frequency accepted."""
+
+REALTIME_PRIORITY = 50
+"""The SCHED_FIFO priority requested for the engine thread."""
+
+WAKE_AHEAD_NS = 2000000
+"""How long before an edge the engine stops waiting for channel changes and
+sleeps precisely until the edge."""
+
+
+class SoftPwmChannel(object):
+    """A pin driven by a raspy.io.soft_pwm.SoftPwmEngine."""
+
+    def __init__(self, pin, frequency=DEFAULT_FREQUENCY, duty_cycle=0.0):
+        """Initialize a new instance of raspy.io.soft_pwm.SoftPwmChannel.
+
+        :param raspy.io.gpio.Gpio pin: The output pin to drive.
+        :param float frequency: The PWM frequency in Hz.
+        :param float duty_cycle: The fraction of each period the pin is
+        high (0.0 to 1.0).
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        the frequency or duty cycle is out of range.
+        """
+        self.__pin = pin
+        self.__periodNs = 0
+        self.__highNs = 0
+        self.__frequency = 0.0
+        self.__dutyCycle = 0.0
+        self.__state = None
+        self.frequency = frequency
+        self.duty_cycle = duty_cycle
+        self.reset_stats()
+
+    @property
+    def pin(self):
+        """Get the pin this channel drives.
+
+        :returns: The output pin.
+        :rtype: raspy.io.gpio.Gpio
+        """
+        return self.__pin
+
+    @property
+    def frequency(self):
+        """Get the requested frequency.
+
+        :returns: The frequency in Hz.
+        :rtype: float
+        """
+        return self.__frequency
+
+    @frequency.setter
+    def frequency(self, freq):
+        """Set the requested frequency.
+
+        The change takes effect from the next edge.
+
+        :param float freq: The frequency in Hz.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        the frequency is not greater than zero or exceeds MAX_FREQUENCY.
+        """
+        if freq <= 0 or freq > MAX_FREQUENCY:
+            msg = "Frequency must be greater than 0 and at most "
+            msg += str(MAX_FREQUENCY) + " Hz."
+            raise IllegalArgumentException(msg)
+
+        self.__frequency = float(freq)
+        self.__periodNs = int(1000000000 / self.__frequency)
+        self.__highNs = int(self.__periodNs * self.__dutyCycle)
+
+    @property
+    def duty_cycle(self):
+        """Get the duty cycle.
+
+        :returns: The fraction of each period the pin is high.
+        :rtype: float
+        """
+        return self.__dutyCycle
+
+    @duty_cycle.setter
+    def duty_cycle(self, duty):
+        """Set the duty cycle.
+
+        The change takes effect from the next edge.
+
+        :param float duty: The fraction of each period the pin is high
+        (0.0 to 1.0).
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        the duty cycle is outside 0.0 to 1.0.
+        """
+        if duty < 0 or duty > 1:
+            raise IllegalArgumentException("Duty cycle must be 0.0 to 1.0.")
+
+        self.__dutyCycle = float(duty)
+        self.__highNs = int(self.__periodNs * self.__dutyCycle)
+
+    @property
+    def period_ns(self):
+        """Get the period.
+
+        :returns: The period in nanoseconds.
+        :rtype: int
+        """
+        return self.__periodNs
+
+    @property
+    def cycles(self):
+        """Get the number of periods started since the stats were reset.
+
+        :returns: The cycle count.
+        :rtype: int
+        """
+        return self.__cycles
+
+    @property
+    def achieved_frequency(self):
+        """Get the frequency actually achieved.
+
+        :returns: The measured frequency in Hz, or 0.0 until two cycles have
+        been started.
+        :rtype: float
+        """
+        if self.__cycles < 2 or self.__lastCycleNs == self.__firstCycleNs:
+            return 0.0
+
+        elapsed = self.__lastCycleNs - self.__firstCycleNs
+        return (self.__cycles - 1) * 1000000000.0 / elapsed
+
+    @property
+    def mean_jitter_ns(self):
+        """Get the mean lateness of edges.
+
+        :returns: The mean time between an edge's deadline and its write in
+        nanoseconds.
+        :rtype: float
+        """
+        if self.__edges == 0:
+            return 0.0
+
+        return float(self.__jitterTotal) / self.__edges
+
+    @property
+    def max_jitter_ns(self):
+        """Get the worst lateness of an edge.
+
+        :returns: The largest time between an edge's deadline and its write
+        in nanoseconds.
+        :rtype: int
+        """
+        return self.__jitterMax
+
+    def reset_stats(self):
+        """Reset the frequency and jitter statistics."""
+        self.__edges = 0
+        self.__cycles = 0
+        self.__firstCycleNs = 0
+        self.__lastCycleNs = 0
+        self.__jitterTotal = 0
+        self.__jitterMax = 0
+
+    def _set_state(self, ps):
+        """Write the pin only if the state changes.
+
+        :param int ps: The pin state to write.
+        """
+        if self.__state != ps:
+            self.__pin.write(ps)
+            self.__state = ps
+
+    def __claim_state(self, ps):
+        """Record a new state for the engine to write.
+
+        :param int ps: The pin state.
+        :returns: The state to write, or None if it is unchanged.
+        :rtype: int
+        """
+        if self.__state == ps:
+            return None
+
+        self.__state = ps
+        return ps
+
+    def _edge(self, deadline, now):
+        """Advance to the edge due at deadline.
+
+        The pin is not written here, so the engine can write it without
+        holding its lock.
+
+        :param int deadline: The time the edge was due (ns).
+        :param int now: The current time (ns).
+        :returns: The deadline of the following edge (ns) and the pin state
+        to write, or None if the pin keeps its level.
+        :rtype: tuple
+        """
+        late = max(now - deadline, 0)
+        self.__edges += 1
+        self.__jitterTotal += late
+        if late > self.__jitterMax:
+            self.__jitterMax = late
+
+        # Don't try to catch up with edges that were missed entirely.
+        if late > self.__periodNs:
+            deadline = now
+
+        high = self.__highNs
+        if self.__state == pin_state.HIGH and 0 < high < self.__periodNs:
+            return (deadline + self.__periodNs - high,
+                    self.__claim_state(pin_state.LOW))
+
+        if self.__cycles == 0:
+            self.__firstCycleNs = now
+
+        self.__cycles += 1
+        self.__lastCycleNs = now
+        if high <= 0:
+            return (deadline + self.__periodNs,
+                    self.__claim_state(pin_state.LOW))
+
+        state = self.__claim_state(pin_state.HIGH)
+        if high >= self.__periodNs:
+            return (deadline + self.__periodNs, state)
+
+        return (deadline + high, state)
+
+
+class SoftPwmEngine(Disposable):
+    """Drives many software PWM channels from one timing thread."""
+
+    def __init__(self, realtime=True):
+        """Initialize a new instance of raspy.io.soft_pwm.SoftPwmEngine.
+
+        :param bool realtime: Set True to request SCHED_FIFO scheduling for
+        the engine thread. This needs CAP_SYS_NICE; is_realtime tells
+        whether it took effect.
+        """
+        Disposable.__init__(self)
+        self.__realtime = realtime
+        self.__isRealtime = False
+        self.__cond = threading.Condition()
+        self.__writeLock = threading.Lock()
+        self.__startedEvent = threading.Event()
+        self.__queue = []
+        self.__seq = itertools.count()
+        self.__channels = []
+        self.__attached = set()
+        self.__thread = None
+        self.__running = False
+
+    @property
+    def channels(self):
+        """Get the registered channels.
+
+        :returns: A copy of the channel list.
+        :rtype: list
+        """
+        with self.__cond:
+            return list(self.__channels)
+
+    @property
+    def is_running(self):
+        """Get whether or not the engine thread is running.
+
+        :returns: True if running; Otherwise, False.
+        :rtype: bool
+        """
+        return self.__running
+
+    @property
+    def is_realtime(self):
+        """Get whether or not the engine thread runs under SCHED_FIFO.
+
+        :returns: True if realtime scheduling was requested and took effect
+        for the running engine thread; Otherwise, False.
+        :rtype: bool
+        """
+        return self.__isRealtime
+
+    def __schedule(self, deadline, channel):
+        """Queue the next edge of a channel. The lock must be held.
+
+        :param int deadline: The time the edge is due (ns).
+        :param SoftPwmChannel channel: The channel.
+        """
+        heapq.heappush(self.__queue, (deadline, next(self.__seq), channel))
+
+    def add_channel(self, pin, frequency=DEFAULT_FREQUENCY, duty_cycle=0.0):
+        """Register a pin with the engine.
+
+        :param raspy.io.gpio.Gpio pin: The output pin to drive.
+        :param float frequency: The PWM frequency in Hz.
+        :param float duty_cycle: The fraction of each period the pin is
+        high (0.0 to 1.0).
+        :returns: The new channel.
+        :rtype: SoftPwmChannel
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.illegal_argument_exception.IllegalArgumentException if
+        the frequency or duty cycle is out of range.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("SoftPwmEngine")
+
+        channel = SoftPwmChannel(pin, frequency, duty_cycle)
+        with self.__cond:
+            self.__channels.append(channel)
+            self.__attached.add(channel)
+            self.__schedule(core_utils.monotonic_ns(), channel)
+            self.__cond.notify()
+
+        return channel
+
+    def remove_channel(self, channel):
+        """Unregister a channel and drive its pin low.
+
+        :param SoftPwmChannel channel: The channel to remove.
+        """
+        with self.__cond:
+            if channel not in self.__channels:
+                return
+
+            self.__channels.remove(channel)
+            self.__attached.discard(channel)
+            self.__queue = [e for e in self.__queue if e[2] is not channel]
+            heapq.heapify(self.__queue)
+            self.__cond.notify()
+
+        # The engine may be writing this channel's last edge; the write lock
+        # orders that write before this one.
+        with self.__writeLock:
+            channel._set_state(pin_state.LOW)
+
+    def start(self):
+        """Start the engine thread.
+
+        :raises: raspy.object_disposed_exception.ObjectDisposedException if
+        this instance has been disposed.
+        :raises: raspy.invalid_operation_exception.InvalidOperationException
+        if the engine is already running.
+        """
+        if self.is_disposed:
+            raise ObjectDisposedException("SoftPwmEngine")
+
+        if self.__running:
+            raise InvalidOperationException("Engine is already running.")
+
+        self.__running = True
+        self.__startedEvent.clear()
+        self.__thread = threading.Thread(target=self.__run)
+        self.__thread.name = "SoftPwmEngine"
+        self.__thread.daemon = True
+        self.__thread.start()
+        self.__startedEvent.wait(1.0)
+
+    def stop(self):
+        """Stop the engine thread and drive every channel low."""
+        if self.__thread is None:
+            return
+
+        with self.__cond:
+            self.__running = False
+            self.__cond.notify()
+
+        if self.__thread is not threading.current_thread():
+            self.__thread.join()
+
+        self.__thread = None
+        self.__isRealtime = False
+        with self.__cond:
+            now = core_utils.monotonic_ns()
+            self.__queue = []
+            for channel in self.__channels:
+                channel._set_state(pin_state.LOW)
+                self.__schedule(now, channel)
+
+    def __run(self):
+        """Write edges as they come due until stopped."""
+        if self.__realtime:
+            self.__isRealtime = core_utils.set_realtime_priority(
+                REALTIME_PRIORITY)
+
+        self.__startedEvent.set()
+        while True:
+            with self.__cond:
+                if not self.__running:
+                    break
+
+                if len(self.__queue) == 0:
+                    self.__cond.wait()
+                    continue
+
+                deadline = self.__queue[0][0]
+                remaining = deadline - core_utils.monotonic_ns()
+                if remaining > WAKE_AHEAD_NS:
+                    # A timed wait polls coarsely on Python 2, so it only
+                    # covers the time until the edge is near.
+                    self.__cond.wait((remaining - WAKE_AHEAD_NS) / 1e9)
+                    continue
+
+            if remaining > 0:
+                core_utils.sleep_until_ns(deadline)
+
+            with self.__cond:
+                if not self.__running:
+                    break
+
+                now = core_utils.monotonic_ns()
+                if len(self.__queue) == 0 or self.__queue[0][0] > now:
+                    continue
+
+                deadline, _, channel = heapq.heappop(self.__queue)
+                next_deadline, state = channel._edge(deadline, now)
+                self.__schedule(next_deadline, channel)
+
+            if state is not None:
+                with self.__writeLock:
+                    if channel in self.__attached:
+                        channel.pin.write(state)
+
+    def dispose(self):
+        """Stop the engine and release all channels."""
+        if self.is_disposed:
+            return
+
+        self.stop()
+        self.__channels = []
+        self.__attached = set()
+        self.__queue = []
+        Disposable.dispose(self)
@@ -0,0 +1,254 @@
+"""Timed waveform playback on output pins.
+
+A waveform is a sequence of (level, duration) segments played on one output
+pin by a dedicated timing thread. Each segment ends at an absolute deadline
+computed from the start of playback, so timing errors don't accumulate over
+long or repeating sequences such as IR codes, buzzer patterns and strobes.
+play() returns at once with a WaveformHandle that can be waited on or
+cancelled.
+"""
+
+
+import threading
+from raspy.argument_null_exception import ArgumentNullException
+from raspy.illegal_argument_exception import IllegalArgumentException
+from raspy.io import pin_state
+from raspy.pi_system import core_utils
+
+
+REPEAT_FOREVER = 0
+"""Repeat the waveform until it is cancelled."""
+
+CANCEL_CHECK_NS = 2000000
+"""Segments longer than this wait on the cancel flag before their tail."""
+
+
+def _normalize(segments):
+    """Validate segments and convert their durations to nanoseconds.
+
+    :param list segments: A list of (level, duration_us) tuples.
+    :returns: A list of (level, duration_ns) tuples.
+    :rtype: list
+    :raises: raspy.argument_null_exception.ArgumentNullException if there
+    are no segments.
+    :raises: raspy.illegal_argument_exception.IllegalArgumentException if a
+    duration is negative or the waveform has no duration at all.
+    """
+    if segments is None or len(segments) == 0:
+        raise ArgumentNullException("'segments' param cannot be empty.")
+
+    result = []
+    for level, duration in segments:
+        if duration < 0:
+            raise IllegalArgumentException("Segment durations cannot be "
+                                           "negative.")
+
+        result.append((level, int(round(duration * 1000))))
+
+    if sum(d for _, d in result) <= 0:
+        raise IllegalArgumentException("The waveform has no duration.")
+
+    return result
+
+
+class WaveformHandle(object):
+    """A waveform being played on a pin."""
+
+    def __init__(self, pin, segments, repeat, idle_state):
+        """Initialize a new instance of raspy.io.waveform.WaveformHandle.
+
+        Use raspy.io.waveform.play() rather than creating handles directly.
+
+        :param raspy.io.gpio.Gpio pin: The output pin.
+        :param list segments: A list of (level, duration_ns) tuples.
+        :param int repeat: The number of times to play the segments, or
+        REPEAT_FOREVER.
+        :param int idle_state: The pin state to leave the pin in.
+        """
+        self.__pin = pin
+        self.__segments = segments
+        self.__repeat = repeat
+        self.__idleState = idle_state
+        self.__cancelEvent = threading.Event()
+        self.__doneEvent = threading.Event()
+        self.__cycles = 0
+        self.__maxLateNs = 0
+        self.__error = None
+        self.__thread = threading.Thread(target=self.__run, name="waveform")
+        self.__thread.daemon = True
+
+    @property
+    def pin(self):
+        """Get the pin the waveform is played on.
+
+        :returns: The output pin.
+        :rtype: raspy.io.gpio.Gpio
+        """
+        return self.__pin
+
+    @property
+    def is_done(self):
+        """Get whether or not playback has ended.
+
+        :returns: True if the waveform completed or was cancelled;
+        Otherwise, False.
+        :rtype: bool
+        """
+        return self.__doneEvent.is_set()
+
+    @property
+    def is_cancelled(self):
+        """Get whether or not playback was cancelled.
+
+        :returns: True if cancel() was called; Otherwise, False.
+        :rtype: bool
+        """
+        return self.__cancelEvent.is_set()
+
+    @property
+    def cycles(self):
+        """Get the number of times the whole waveform has been played.
+
+        :returns: The completed repetitions.
+        :rtype: int
+        """
+        return self.__cycles
+
+    @property
+    def max_late_ns(self):
+        """Get the worst lateness of a segment boundary.
+
+        :returns: The largest time by which a segment ended after its
+        deadline, in nanoseconds.
+        :rtype: int
+        """
+        return self.__maxLateNs
+
+    @property
+    def error(self):
+        """Get the error that ended playback, if any.
+
+        :returns: The exception raised while writing to the pin, or None.
+        :rtype: Exception
+        """
+        return self.__error
+
+    def start(self):
+        """Start playback on the timing thread."""
+        self.__thread.start()
+
+    def __wait_until(self, deadline):
+        """Wait for a segment deadline unless cancelled first.
+
+        :param int deadline: The deadline in nanoseconds of
+        core_utils.monotonic_ns().
+        :returns: True if the deadline was reached; False if cancelled.
+        :rtype: bool
+        """
+        remaining = deadline - core_utils.monotonic_ns()
+        if remaining > CANCEL_CHECK_NS:
+            timeout = (remaining - CANCEL_CHECK_NS) / 1000000000.0
+            if self.__cancelEvent.wait(timeout):
+                return False
+
+        late = core_utils.sleep_until_ns(deadline)
+        if late > self.__maxLateNs:
+            self.__maxLateNs = late
+
+        return not self.__cancelEvent.is_set()
+
+    def __run(self):
+        """Play the segments until done or cancelled."""
+        deadline = core_utils.monotonic_ns()
+        try:
+            while not self.__cancelEvent.is_set():
+                for level, duration in self.__segments:
+                    self.__pin.write(level)
+                    deadline += duration
+                    if not self.__wait_until(deadline):
+                        break
+
+                if self.__cancelEvent.is_set():
+                    break
+
+                self.__cycles += 1
+                if self.__cycles == self.__repeat:
+                    break
+
+            if self.__idleState is not None:
+                self.__pin.write(self.__idleState)
+        except Exception as ex:
+            self.__error = ex
+        finally:
+            self.__doneEvent.set()
+
+    def wait(self, timeout=None):
+        """Block until playback ends.
+
+        :param float timeout: The maximum number of seconds to wait. If
+        None, waits indefinitely.
+        :returns: True if playback has ended; False if the timeout expired.
+        :rtype: bool
+        """
+        return self.__doneEvent.wait(timeout)
+
+    def cancel(self):
+        """Stop playback at the current segment.
+
+        The pin is still set to the idle state. Returns without waiting;
+        use wait() to block until the timing thread is finished.
+        """
+        self.__cancelEvent.set()
+
+
+def play(pin, segments, repeat=1, idle_state=pin_state.LOW):
+    """Play a waveform on an output pin.
+
+    :param raspy.io.gpio.Gpio pin: The output pin. It should be provisioned
+    and must not be written by anything else during playback.
+    :param list segments: A list of (level, duration) tuples, where level is
+    a pin state and duration is in microseconds.
+    :param int repeat: The number of times to play the segments, or
+    REPEAT_FOREVER to play until cancelled.
+    :param int idle_state: The pin state to set when playback ends, or None
+    to leave the last level.
+    :returns: The handle of the running waveform.
+    :rtype: WaveformHandle
+    :raises: raspy.argument_null_exception.ArgumentNullException if the pin
+    is None or there are no segments.
+    :raises: raspy.illegal_argument_exception.IllegalArgumentException if a
+    duration or the repeat count is negative, or the waveform has no
+    duration.
+    """
+    if pin is None:
+        raise ArgumentNullException("'pin' param cannot be None.")
+
+    if repeat is None or repeat < 0:
+        raise IllegalArgumentException("'repeat' cannot be negative.")
+
+    handle = WaveformHandle(pin, _normalize(segments), repeat, idle_state)
+    handle.start()
+    return handle
+
+
+def play_pulses(pin, marks_us, repeat=1):
+    """Play alternating HIGH/LOW segments, as in IR remote codes.
+
+    :param raspy.io.gpio.Gpio pin: The output pin.
+    :param list marks_us: The segment durations in microseconds, starting
+    with a HIGH segment.
+    :param int repeat: The number of times to play the sequence, or
+    REPEAT_FOREVER.
+    :returns: The handle of the running waveform.
+    :rtype: WaveformHandle
+    """
+    segments = []
+    level = pin_state.HIGH
+    for duration in marks_us:
+        segments.append((level, duration))
+        if level == pin_state.HIGH:
+            level = pin_state.LOW
+        else:
+            level = pin_state.HIGH
+
+    return play(pin, segments, repeat)
@@ -4,6 +4,7 @@
 from raspy.illegal_argument_exception import IllegalArgumentException
 from raspy.object_disposed_exception import ObjectDisposedException
 from raspy.io import gpio_pins
+from raspy.io.gpio_bank import GpioBank
 from raspy.io import pin_mode
 from raspy.io import pin_state
 from raspy.io.gpio_standard import GpioStandard
@@ -48,13 +49,15 @@ class GpioLcdTransferProviderStandard(LcdTransferProvider):
             raise IllegalArgumentException(msg)
 
         self.__registerSelectPort = GpioStandard(rs, pin_mode.OUT, pin_state.LOW)
+        self.__registerSelectPort.elide_writes = True
         self.__registerSelectPort.provision()
 
         # We can save 1 pin by not using RW. Indicate this by passing
         # gpio_pins.GpioNone() instead of pin num.
-        self.__readWritePort = gpio_pins.GpioNone()
+        self.__readWritePort = None
         if rw != gpio_pins.GpioNone():
             self.__readWritePort = GpioStandard(rw, pin_mode.OUT, pin_state.LOW)
+            self.__readWritePort.elide_writes = True
             self.__readWritePort.provision()
 
         if enable is None or enable == gpio_pins.GpioNone():
@@ -62,6 +65,7 @@ class GpioLcdTransferProviderStandard(LcdTransferProvider):
             raise IllegalArgumentException(msg)
 
         self.__enablePort = GpioStandard(enable, pin_mode.OUT, pin_state.LOW)
+        self.__enablePort.elide_writes = True
         self.__enablePort.provision()
 
         data_pins = [
@@ -75,16 +79,21 @@ class GpioLcdTransferProviderStandard(LcdTransferProvider):
             d7
         ]
 
+        # Data line N is bit N of the data bank; unused lines stay None.
         self.__dataPorts = list()
-        for i in range(0, len(data_pins) - 1):
+        for i in range(0, len(data_pins)):
             if (data_pins[i] is None or
                     not isinstance(data_pins[i], gpio_pins.GpioPin)):
                 data_pins[i] = gpio_pins.GpioNone()
 
+            pin = None
             if data_pins[i] != gpio_pins.GpioNone():
                 pin = GpioStandard(data_pins[i], pin_mode.OUT, pin_state.LOW)
-                pin.provision()
-                self.__dataPorts.append(pin)
+
+            self.__dataPorts.append(pin)
+
+        self.__dataBank = GpioBank(self.__dataPorts)
+        self.__dataBank.provision()
 
     @property
     def is_four_bit_mode(self):
@@ -107,11 +116,7 @@ class GpioLcdTransferProviderStandard(LcdTransferProvider):
 
         :param byte, int value: The command or data to write.
         """
-        for i in range(0, 3):
-            val = pin_state.LOW
-            if ((value >> i) & 0x01) == 0x01:
-                val = pin_state.HIGH
-            self.__dataPorts[i + 4].write(val)
+        self.__dataBank.write((value & 0x0F) << 4, 0xF0)
         self._pulse_enable()
 
     def write_8_bits(self, value):
@@ -119,11 +124,7 @@ class GpioLcdTransferProviderStandard(LcdTransferProvider):
 
         :param byte, int value: The command or data to write.
         """
-        for i in range(0, 7):
-            val = pin_state.LOW
-            if ((value >> i) & 0x01) == 0x01:
-                val = pin_state.HIGH
-            self.__dataPorts[i].write(val)
+        self.__dataBank.write(value & 0xFF)
         self._pulse_enable()
 
     def send(self, data, mode, back_light):
@@ -168,6 +169,10 @@ class GpioLcdTransferProviderStandard(LcdTransferProvider):
             self.__enablePort.dispose()
             self.__enablePort = None
 
+        if self.__dataBank is not None:
+            self.__dataBank.dispose()
+            self.__dataBank = None
+
         if self.__dataPorts is not None and len(self.__dataPorts) > 0:
             for i, port in enumerate(self.__dataPorts):
                 if port is not None:
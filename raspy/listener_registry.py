@@ -0,0 +1,118 @@
+"""A lightweight registry of event listeners.
+
+Every pin, component and device keeps one of these to hold the callbacks
+registered with its on() method. It allocates nothing until the first
+listener is added, and stores the callbacks for each event as a tuple that
+is replaced rather than modified when listeners are added or removed. An
+emit therefore only looks up the tuple and loops over it, without copying
+or locking, even while another thread changes the listeners.
+"""
+
+
+import threading
+
+
+_lock = threading.Lock()
+
+
+class ListenerRegistry(object):
+    """Holds the callbacks registered for each event of an object."""
+
+    __slots__ = ("__listeners",)
+
+    def __init__(self):
+        """Initialize a new instance of ListenerRegistry."""
+        self.__listeners = None
+
+    def on(self, evt, callback):
+        """Register a callback for an event.
+
+        :param str evt: The name of the event.
+        :param function callback: The callback to execute when the event
+        fires.
+        """
+        with _lock:
+            listeners = self.__listeners
+            if listeners is None:
+                listeners = {}
+                self.__listeners = listeners
+
+            listeners[evt] = listeners.get(evt, ()) + (callback,)
+
+    def emit(self, evt, *args, **kwargs):
+        """Call every callback registered for an event, in registration order.
+
+        :param str evt: The name of the event.
+        :param args: The arguments to pass to the callbacks.
+        :param kwargs: The keyword arguments to pass to the callbacks.
+        :returns: True if any callback was called; Otherwise, False.
+        :rtype: bool
+        """
+        listeners = self.__listeners
+        if listeners is None:
+            return False
+
+        callbacks = listeners.get(evt)
+        if not callbacks:
+            return False
+
+        for callback in callbacks:
+            callback(*args, **kwargs)
+
+        return True
+
+    def listeners(self, evt):
+        """Get the callbacks registered for an event.
+
+        :param str evt: The name of the event.
+        :returns: The callbacks, in registration order.
+        :rtype: tuple
+        """
+        listeners = self.__listeners
+        if listeners is None:
+            return ()
+
+        return listeners.get(evt, ())
+
+    def remove_listener(self, evt, callback):
+        """Remove the first registration of a callback for an event.
+
+        :param str evt: The name of the event.
+        :param function callback: The callback to remove.
+        """
+        with _lock:
+            listeners = self.__listeners
+            if listeners is None:
+                return
+
+            callbacks = listeners.get(evt, ())
+            if callback not in callbacks:
+                return
+
+            index = callbacks.index(callback)
+            callbacks = callbacks[:index] + callbacks[index + 1:]
+            if callbacks:
+                listeners[evt] = callbacks
+            else:
+                del listeners[evt]
+                if not listeners:
+                    self.__listeners = None
+
+    def remove_all_listeners(self, evt=None):
+        """Remove the callbacks for one event, or for all events.
+
+        :param str evt: The name of the event, or None to remove the
+        callbacks of every event.
+        """
+        with _lock:
+            listeners = self.__listeners
+            if listeners is None:
+                return
+
+            if evt is None:
+                self.__listeners = None
+                return
+
+            listeners.pop(evt, None)
+            if not listeners:
+                self.__listeners = None
@@ -1,9 +1,18 @@
 """This module provides core utilities."""
 
 
+import os
+import threading
 import time
 
 
+CALIBRATION_SAMPLES = 20
+"""The number of sleeps measured by calibrate()."""
+
+MAX_SPIN_NS = 2000000
+"""The longest tail of a delay that is ever spent spinning."""
+
+
 def sleep(ms):
     """Sleep for the specified milliseconds.
 
@@ -15,12 +24,245 @@ def sleep(ms):
     time.sleep(ms / 1000.0)
 
 
+def _get_monotonic_source():
+    """Get the best available monotonic nanosecond clock.
+
+    :returns: A function that returns a monotonic time in nanoseconds.
+    :rtype: function
+    """
+    if hasattr(time, "monotonic_ns"):
+        return time.monotonic_ns
+
+    if hasattr(time, "monotonic"):
+        return lambda: int(time.monotonic() * 1000000000)
+
+    try:
+        import ctypes
+        import ctypes.util
+
+        class _Timespec(ctypes.Structure):
+            _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+        lib_name = ctypes.util.find_library("rt")
+        if lib_name is None:
+            lib_name = ctypes.util.find_library("c")
+
+        clock_gettime = ctypes.CDLL(lib_name, use_errno=True).clock_gettime
+        clock_gettime.argtypes = [ctypes.c_int, ctypes.POINTER(_Timespec)]
+        clock_monotonic = 1
+        if clock_gettime(clock_monotonic, ctypes.byref(_Timespec())) != 0:
+            raise OSError(ctypes.get_errno(), "clock_gettime failed")
+
+        def _clock_gettime_ns():
+            ts = _Timespec()
+            clock_gettime(clock_monotonic, ctypes.byref(ts))
+            return ts.tv_sec * 1000000000 + ts.tv_nsec
+
+        return _clock_gettime_ns
+    except (AttributeError, ImportError, OSError, TypeError):
+        return lambda: int(time.time() * 1000000000)
+
+
+monotonic_ns = _get_monotonic_source()
+"""Get a monotonic time in nanoseconds.
+
+Uses time.monotonic_ns() where available and clock_gettime(CLOCK_MONOTONIC)
+otherwise, falling back to the wall clock only if neither can be used.
+"""
+
+
+_delay_lock = threading.Lock()
+_spin_ns = None
+_delay_count = 0
+_overshoot_total = 0
+_overshoot_max = 0
+
+
+def calibrate(samples=CALIBRATION_SAMPLES):
+    """Measure how far time.sleep() overshoots on this system.
+
+    Precise delays sleep until this much time before their deadline and
+    spin on the monotonic clock for the rest. Calibration runs on the first
+    precise delay if it has not been run before, and takes a few
+    milliseconds.
+
+    :param int samples: The number of short sleeps to measure.
+    :returns: The spin margin in nanoseconds.
+    :rtype: int
+    """
+    global _spin_ns
+    overshoots = []
+    for _ in range(max(int(samples), 1)):
+        start = monotonic_ns()
+        time.sleep(0.0001)
+        overshoots.append(monotonic_ns() - start - 100000)
+
+    overshoots.sort()
+    margin = overshoots[int(len(overshoots) * 0.9)]
+    _spin_ns = min(max(int(margin * 1.25), 0), MAX_SPIN_NS)
+    return _spin_ns
+
+
+def get_spin_margin_ns():
+    """Get the calibrated spin margin.
+
+    :returns: The time before a deadline at which a precise delay stops
+    sleeping and starts spinning, in nanoseconds, or None if not yet
+    calibrated.
+    :rtype: int
+    """
+    return _spin_ns
+
+
+def sleep_until_ns(deadline_ns):
+    """Block the current thread until the specified monotonic time.
+
+    Sleeps for most of the interval and spins for the final stretch, so
+    the deadline is met to within a few microseconds. Since the deadline is
+    absolute, a loop that adds its period to the previous deadline does not
+    accumulate drift. Spinning holds the interpreter lock, so the spin
+    stretch is kept as short as calibration allows.
+
+    :param int, long deadline_ns: The deadline, in nanoseconds of
+    monotonic_ns().
+    :returns: How far past the deadline the call returned, in nanoseconds.
+    :rtype: int
+    """
+    global _delay_count, _overshoot_total, _overshoot_max
+    spin = _spin_ns
+    if spin is None:
+        spin = calibrate()
+
+    remaining = deadline_ns - monotonic_ns()
+    if remaining > spin:
+        time.sleep((remaining - spin) / 1000000000.0)
+
+    now = monotonic_ns()
+    while now < deadline_ns:
+        now = monotonic_ns()
+
+    overshoot = now - deadline_ns
+    with _delay_lock:
+        _delay_count += 1
+        _overshoot_total += overshoot
+        if overshoot > _overshoot_max:
+            _overshoot_max = overshoot
+
+    return overshoot
+
+
+def sleep_nanoseconds(nanos):
+    """Block the current thread for the specified nanoseconds.
+
+    :param int, long nanos: The amount of time in nanoseconds.
+    :returns: How far past the requested time the call returned, in
+    nanoseconds.
+    :rtype: int
+    """
+    return sleep_until_ns(monotonic_ns() + nanos)
+
+
 def sleep_microseconds(micros):
-    """Block the current thread for the specified milliseconds.
+    """Block the current thread for the specified microseconds.
 
     :param int, long micros: The amount of time in microseconds.
     """
     if micros <= 0:
         micros = 1
 
-    time.sleep(micros / 1000000.0)
+    sleep_nanoseconds(micros * 1000)
+
+
+def get_delay_stats():
+    """Get the measured overshoot of precise delays.
+
+    :returns: A dict with the keys "count", "mean_ns" and "max_ns" for the
+    delays made since the last reset, and "spin_ns", the calibrated spin
+    margin.
+    :rtype: dict
+    """
+    with _delay_lock:
+        mean = 0
+        if _delay_count > 0:
+            mean = _overshoot_total // _delay_count
+
+        return {
+            "count": _delay_count,
+            "mean_ns": mean,
+            "max_ns": _overshoot_max,
+            "spin_ns": _spin_ns
+        }
+
+
+def reset_delay_stats():
+    """Clear the measured overshoot of precise delays."""
+    global _delay_count, _overshoot_total, _overshoot_max
+    with _delay_lock:
+        _delay_count = 0
+        _overshoot_total = 0
+        _overshoot_max = 0
+
+
+SCHED_FIFO = 1
+"""The Linux first-in, first-out realtime scheduling policy."""
+
+
+def _get_sched_setscheduler():
+    """Get a function that sets the scheduling policy of the calling thread.
+
+    :returns: A function taking a policy and priority and returning True on
+    success, or None if the policy can't be set on this platform.
+    :rtype: function
+    """
+    if hasattr(os, "sched_setscheduler"):
+        def _os_setscheduler(policy, priority):
+            try:
+                os.sched_setscheduler(0, policy, os.sched_param(priority))
+                return True
+            except OSError:
+                return False
+
+        return _os_setscheduler
+
+    try:
+        import ctypes
+        import ctypes.util
+
+        class _SchedParam(ctypes.Structure):
+            _fields_ = [("sched_priority", ctypes.c_int)]
+
+        lib_name = ctypes.util.find_library("c")
+        if lib_name is None:
+            return None
+
+        setscheduler = ctypes.CDLL(lib_name, use_errno=True).sched_setscheduler
+        setscheduler.argtypes = [ctypes.c_int, ctypes.c_int,
+                                 ctypes.POINTER(_SchedParam)]
+
+        def _libc_setscheduler(policy, priority):
+            param = _SchedParam(priority)
+            return setscheduler(0, policy, ctypes.byref(param)) == 0
+
+        return _libc_setscheduler
+    except (AttributeError, ImportError, OSError, TypeError):
+        return None
+
+
+_sched_setscheduler = _get_sched_setscheduler()
+
+
+def set_realtime_priority(priority):
+    """Run the calling thread under SCHED_FIFO at the specified priority.
+
+    Uses os.sched_setscheduler() where available and the C library's
+    sched_setscheduler() otherwise. On Linux the change applies to the
+    calling thread only and needs CAP_SYS_NICE.
+
+    :param int priority: The SCHED_FIFO priority (1 to 99).
+    :returns: True if the thread now runs under SCHED_FIFO; Otherwise, False.
+    :rtype: bool
+    """
+    if _sched_setscheduler is None:
+        return False
+
+    return _sched_setscheduler(SCHED_FIFO, priority)
@@ -0,0 +1,4 @@
+"""GPIO benchmarks.
+
+Run with ``python -m raspy.tests.benchmarks [--quick] [--output FILE]``.
+"""
@@ -0,0 +1,8 @@
+"""Entry point for python -m raspy.tests.benchmarks."""
+
+
+import sys
+from raspy.tests.benchmarks.gpio_benchmark import main
+
+
+sys.exit(main())
@@ -0,0 +1,503 @@
+"""GPIO throughput and latency benchmarks across backends.
+
+Each backend is run against a simulation so the suite works headless:
+
+* standard - GpioStandard on a SysfsSimulator tree (real file syscalls).
+* mem - GpioMem on a file standing in for /dev/gpiomem.
+* chardev - GpioCharDev on a fake GPIO chip ioctl layer.
+* simulated - the in-memory SimulatedGpio.
+* piface - PiFaceGpioDigital on a simulated MCP23S17.
+
+For each one the suite measures output toggles per second, read latency
+percentiles, pulse() accuracy and the latency from an input change to the
+EVENT_GPIO_STATE_CHANGED handler. The event latency goes through
+enable_interrupts() on the backends that support it (standard and chardev,
+whose edges come from the simulator and FakeGpioChipDevice.fire_edge()); the
+latency of noticing a change by reading the pin is reported separately as
+the polled event latency. Results are returned as a dictionary and written
+as JSON by main().
+"""
+
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from raspy.io import gpio
+from raspy.io import gpio_mem
+from raspy.io import gpio_pins
+from raspy.io import pi_face_pin_factory
+from raspy.io import pi_face_pins
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.io.gpio_chardev import GpioCharDev
+from raspy.io.gpio_chip import GpioChip
+from raspy.io.gpio_mem import GpioMem
+from raspy.io.gpio_mem import GpioMemMap
+from raspy.io.gpio_simulator import SimulatedGpio
+from raspy.io.gpio_simulator import SysfsSimulator
+from raspy.io.gpio_standard import GpioStandard
+from raspy.pi_system import core_utils
+from raspy.tests.benchmarks.simulated_chip import FakeGpioChipDevice
+from raspy.tests.benchmarks.simulated_spi import SimulatedSpiDev
+from raspy.tests.benchmarks.simulated_spi import use_simulated_spi
+
+
+PERCENTILES = (50, 90, 99)
+"""The read and event latency percentiles reported."""
+
+EVENT_TIMEOUT = 1.0
+"""Seconds to wait for a state change event before counting it lost."""
+
+
+class BenchmarkSettings(object):
+    """How long and how often each measurement runs."""
+
+    def __init__(self, toggle_seconds=0.5, reads=2000, pulse_millis=5,
+                 pulses=10, events=20):
+        """ctor."""
+        self.toggle_seconds = toggle_seconds
+        self.reads = reads
+        self.pulse_millis = pulse_millis
+        self.pulses = pulses
+        self.events = events
+
+
+QUICK = BenchmarkSettings(0.05, 50, 2, 2, 3)
+"""Settings for a smoke run."""
+
+
+def percentiles(samples, points=PERCENTILES):
+    """Summarize samples by nearest-rank percentiles.
+
+    :param list samples: The samples.
+    :param tuple points: The percentiles to report.
+    :returns: The percentiles keyed "pN", plus "mean", "max" and "count".
+    :rtype: dict
+    """
+    result = {"count": len(samples)}
+    if len(samples) == 0:
+        return result
+
+    ordered = sorted(samples)
+    for point in points:
+        rank = int(math.ceil(point / 100.0 * len(ordered))) - 1
+        rank = min(max(rank, 0), len(ordered) - 1)
+        result["p" + str(point)] = ordered[rank]
+
+    result["mean"] = float(sum(ordered)) / len(ordered)
+    result["max"] = ordered[-1]
+    return result
+
+
+def _to_micros(summary):
+    """Convert a nanosecond summary to microseconds.
+
+    :param dict summary: The summary from percentiles().
+    :returns: The converted summary.
+    :rtype: dict
+    """
+    result = dict()
+    for key, val in summary.items():
+        if key == "count":
+            result[key] = val
+        else:
+            result[key] = val / 1000.0
+
+    return result
+
+
+def measure_toggles(pin, seconds):
+    """Measure how fast an output can be toggled.
+
+    :param raspy.io.gpio.Gpio pin: The output pin.
+    :param float seconds: How long to toggle for.
+    :returns: Writes per second.
+    :rtype: float
+    """
+    clock = core_utils.monotonic_ns
+    deadline = clock() + int(seconds * 1000000000)
+    writes = 0
+    start = clock()
+    while True:
+        pin.write(pin_state.HIGH)
+        pin.write(pin_state.LOW)
+        writes += 2
+        if (writes & 0x3F) == 0 and clock() >= deadline:
+            break
+
+    elapsed = clock() - start
+    return writes * 1000000000.0 / elapsed
+
+
+def measure_reads(pin, count):
+    """Measure the latency of single reads.
+
+    :param raspy.io.gpio.Gpio pin: The input pin.
+    :param int count: The number of reads.
+    :returns: The latency summary in microseconds.
+    :rtype: dict
+    """
+    clock = core_utils.monotonic_ns
+    samples = []
+    for _ in range(count):
+        start = clock()
+        pin.read()
+        samples.append(clock() - start)
+
+    return _to_micros(percentiles(samples))
+
+
+def measure_pulses(pin, millis, count):
+    """Measure how closely pulse() holds the requested width.
+
+    :param raspy.io.gpio.Gpio pin: The output pin.
+    :param int millis: The requested pulse width.
+    :param int count: The number of pulses.
+    :returns: The requested width and the achieved width summary, in
+    milliseconds.
+    :rtype: dict
+    """
+    clock = core_utils.monotonic_ns
+    samples = []
+    for _ in range(count):
+        start = clock()
+        pin.pulse(millis)
+        samples.append(clock() - start)
+
+    summary = percentiles(samples)
+    result = {"requested_ms": millis, "count": summary["count"]}
+    for key in ("p50", "p90", "p99", "mean", "max"):
+        if key in summary:
+            result[key + "_ms"] = summary[key] / 1000000.0
+
+    if "mean" in summary:
+        result["mean_error_ms"] = summary["mean"] / 1000000.0 - millis
+
+    return result
+
+
+def measure_events(pin, drive, poll, count, timeout=EVENT_TIMEOUT):
+    """Measure the latency from an input change to its event handler.
+
+    :param raspy.io.gpio.Gpio pin: The input pin.
+    :param function drive: Changes the input level; takes a pin state.
+    :param bool poll: Set True if the pin must be read to notice a change.
+    :param int count: The number of changes.
+    :param float timeout: How long to wait for each event, in seconds.
+    :returns: The latency summary in microseconds, plus the number of
+    changes that never produced an event. The input is left low.
+    :rtype: dict
+    """
+    clock = core_utils.monotonic_ns
+    received = threading.Event()
+    stamp = [0]
+
+    def on_change(evt):
+        stamp[0] = clock()
+        received.set()
+
+    pin.on(gpio.EVENT_GPIO_STATE_CHANGED, on_change)
+    samples = []
+    lost = 0
+    level = pin_state.LOW
+    for _ in range(count):
+        level = pin_state.HIGH if level == pin_state.LOW else pin_state.LOW
+        received.clear()
+        start = clock()
+        drive(level)
+        if poll:
+            pin.read()
+
+        if received.wait(timeout):
+            samples.append(stamp[0] - start)
+        else:
+            lost += 1
+
+    if level == pin_state.HIGH:
+        # Leave the pin low, as found, so the next measurement starts with
+        # a change.
+        received.clear()
+        drive(pin_state.LOW)
+        if poll:
+            pin.read()
+
+        received.wait(timeout)
+
+    pin.remove_all_listeners()
+    result = _to_micros(percentiles(samples))
+    result["lost"] = lost
+    return result
+
+
+class StandardBackend(object):
+    """GpioStandard on a simulated sysfs tree."""
+
+    name = "standard"
+    poll = True
+    interrupts = True
+    event_timeout = EVENT_TIMEOUT
+
+    def __init__(self):
+        """ctor."""
+        self.sim = SysfsSimulator()
+        self.output = GpioStandard(gpio_pins.Gpio04(), pin_mode.OUT,
+                                   pin_state.LOW)
+        self.input = GpioStandard(gpio_pins.Gpio17(), pin_mode.IN,
+                                  pin_state.LOW)
+        self.output.provision()
+        self.input.provision()
+
+    def drive(self, level):
+        """Change the input level."""
+        self.sim.set_input(17, level)
+
+    def fire(self, level):
+        """Change the input level and signal an edge."""
+        self.sim.set_input(17, level)
+
+    def dispose(self):
+        """Tear down."""
+        self.output.dispose()
+        self.input.dispose()
+        self.sim.dispose()
+
+
+class MemBackend(object):
+    """GpioMem on a file standing in for /dev/gpiomem."""
+
+    name = "mem"
+    poll = True
+    interrupts = False
+    event_timeout = EVENT_TIMEOUT
+
+    def __init__(self):
+        """ctor."""
+        fd, self.path = tempfile.mkstemp()
+        os.write(fd, b"\x00" * gpio_mem.BLOCK_SIZE)
+        os.close(fd)
+        self.mem_map = GpioMemMap(self.path)
+        self.output = GpioMem(gpio_pins.Gpio04(), pin_mode.OUT,
+                              pin_state.LOW, self.mem_map)
+        self.input = GpioMem(gpio_pins.Gpio17(), pin_mode.IN, pin_state.LOW,
+                             self.mem_map)
+        self.output.provision()
+        self.input.provision()
+
+    def drive(self, level):
+        """Change the input level."""
+        val = (1 << 17) if level == pin_state.HIGH else 0
+        self.mem_map.write_register(gpio_mem.GPLEV0, val)
+
+    def dispose(self):
+        """Tear down."""
+        self.output.dispose()
+        self.input.dispose()
+        self.mem_map.dispose()
+        os.remove(self.path)
+
+
+class CharDevBackend(object):
+    """GpioCharDev on a fake chip."""
+
+    name = "chardev"
+    poll = True
+    interrupts = True
+    event_timeout = EVENT_TIMEOUT
+
+    def __init__(self):
+        """ctor."""
+        self.dev = FakeGpioChipDevice()
+        self.chip = GpioChip("/dev/gpiochip0", self.dev.ioctl, self.dev.open)
+        self.output = GpioCharDev(gpio_pins.Gpio04(), pin_mode.OUT,
+                                  pin_state.LOW, self.chip)
+        self.input = GpioCharDev(gpio_pins.Gpio17(), pin_mode.IN,
+                                 pin_state.LOW, self.chip)
+        self.output.provision()
+        self.input.provision()
+
+    def drive(self, level):
+        """Change the input level without an edge event."""
+        self.dev.values[17] = level
+
+    def fire(self, level):
+        """Change the input level and queue its edge event."""
+        self.dev.fire_edge(17, level, core_utils.monotonic_ns())
+
+    def dispose(self):
+        """Tear down."""
+        self.output.dispose()
+        self.input.dispose()
+        self.chip.dispose()
+
+
+class SimulatedBackend(object):
+    """The in-memory SimulatedGpio."""
+
+    name = "simulated"
+    poll = True
+    interrupts = False
+    event_timeout = EVENT_TIMEOUT
+
+    def __init__(self):
+        """ctor."""
+        self.output = SimulatedGpio(gpio_pins.Gpio04(), pin_mode.OUT,
+                                    pin_state.LOW)
+        self.input = SimulatedGpio(gpio_pins.Gpio17(), pin_mode.IN,
+                                   pin_state.LOW)
+        self.output.provision()
+        self.input.provision()
+
+    def drive(self, level):
+        """Change the input level."""
+        self.input.set_input(level)
+
+    def dispose(self):
+        """Tear down."""
+        self.output.dispose()
+        self.input.dispose()
+
+
+class PiFaceBackend(object):
+    """PiFaceGpioDigital on a simulated MCP23S17."""
+
+    name = "piface"
+    poll = False
+    interrupts = False
+    event_timeout = 0.1
+
+    def __init__(self):
+        """ctor."""
+        self.spi = SimulatedSpiDev()
+        with use_simulated_spi(self.spi):
+            self.output = pi_face_pin_factory.create_output_pin(
+                pi_face_pins.Output00(), None)
+            self.input = pi_face_pin_factory.create_input_pin(
+                pi_face_pins.Input00(), None)
+
+        # Every pin instance polls port B, and reading GPIO_B clears INTF_B
+        # as on the MCP23S17, so a second poller would take the input's
+        # interrupts. Only the input pin needs to watch for changes.
+        self.output.cancel_poll()
+        self.__mask = pi_face_pins.Input00.value - 1000
+
+    def drive(self, level):
+        """Change the input level."""
+        self.spi.set_input_b(self.__mask, level == pin_state.HIGH)
+
+    def dispose(self):
+        """Tear down."""
+        self.output.cancel_poll()
+        self.input.cancel_poll()
+        time.sleep(0.01)
+        self.output.dispose()
+        self.input.dispose()
+
+
+BACKENDS = (StandardBackend, MemBackend, CharDevBackend, SimulatedBackend,
+            PiFaceBackend)
+"""Every backend the suite can run."""
+
+
+def run_backend(backend_type, settings):
+    """Run every measurement on one backend.
+
+    :param type backend_type: The backend class.
+    :param BenchmarkSettings settings: The run settings.
+    :returns: The results for the backend.
+    :rtype: dict
+    """
+    backend = backend_type()
+    try:
+        result = dict()
+        result["toggles_per_second"] = measure_toggles(
+            backend.output, settings.toggle_seconds)
+        result["read_latency_us"] = measure_reads(backend.input,
+                                                  settings.reads)
+        result["pulse"] = measure_pulses(backend.output,
+                                         settings.pulse_millis,
+                                         settings.pulses)
+        if backend.poll:
+            result["polled_event_latency_us"] = measure_events(
+                backend.input, backend.drive, True, settings.events,
+                backend.event_timeout)
+            result["event_latency_us"] = result["polled_event_latency_us"]
+
+        if backend.interrupts:
+            backend.input.enable_interrupts()
+            try:
+                result["event_latency_us"] = measure_events(
+                    backend.input, backend.fire, False, settings.events,
+                    backend.event_timeout)
+            finally:
+                backend.input.disable_interrupts()
+        elif not backend.poll:
+            # The pin notices changes itself, as the PiFace poller does.
+            result["event_latency_us"] = measure_events(
+                backend.input, backend.drive, False, settings.events,
+                backend.event_timeout)
+
+        return result
+    finally:
+        backend.dispose()
+
+
+def run_benchmarks(names=None, settings=None):
+    """Run the suite.
+
+    :param list names: The backend names to run. If None, all are run.
+    :param BenchmarkSettings settings: The run settings. If None, the
+    defaults are used.
+    :returns: The environment and per-backend results.
+    :rtype: dict
+    """
+    if settings is None:
+        settings = BenchmarkSettings()
+
+    results = dict()
+    for backend_type in BACKENDS:
+        if names is None or backend_type.name in names:
+            results[backend_type.name] = run_backend(backend_type, settings)
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "timestamp": time.time(),
+        "results": results
+    }
+
+
+def main(argv=None):
+    """Run the suite from the command line and write JSON results.
+
+    :param list argv: The command line arguments. If None, sys.argv is used.
+    :returns: The process exit code.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the RasPy GPIO backends.")
+    parser.add_argument("-b", "--backend", action="append",
+                        choices=[b.name for b in BACKENDS],
+                        help="Run only this backend (repeatable).")
+    parser.add_argument("-o", "--output",
+                        help="Write the results to this file.")
+    parser.add_argument("-q", "--quick", action="store_true",
+                        help="Run a short smoke pass.")
+    args = parser.parse_args(argv)
+    settings = QUICK if args.quick else BenchmarkSettings()
+    report = run_benchmarks(args.backend, settings)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        target = open(args.output, 'w')
+        target.write(text + "\n")
+        target.close()
+    else:
+        sys.stdout.write(text + "\n")
+
+    return 0
@@ -0,0 +1,74 @@
+"""A simulated GPIO character device chip for chardev tests and benchmarks."""
+
+
+import os
+import struct
+from raspy.io import gpio_chip
+
+
+class FakeGpioChipDevice(object):
+    """Emulates the GPIO character device line handle/event ioctls."""
+
+    def __init__(self, lines=54):
+        """ctor."""
+        self.lines = lines
+        self.values = dict()
+        self.handles = dict()
+        self.events = dict()
+        self.ioctl_count = 0
+
+    def open(self, path):
+        """Open the fake chip."""
+        return os.open(os.devnull, os.O_RDWR)
+
+    def __new_fd(self):
+        rd, wr = os.pipe()
+        return rd, wr
+
+    def ioctl(self, fd, request, buf):
+        """Handle an ioctl on the chip or on a line fd."""
+        self.ioctl_count += 1
+        if request == gpio_chip.GET_CHIPINFO_IOCTL:
+            data = struct.pack(gpio_chip.CHIP_INFO_FORMAT, b"gpiochip0",
+                               b"pinctrl-fake", self.lines)
+            buf[:] = data
+        elif request == gpio_chip.GET_LINEHANDLE_IOCTL:
+            fields = list(struct.unpack(gpio_chip.HANDLE_REQUEST_FORMAT,
+                                        bytes(buf)))
+            count = fields[-2]
+            offsets = fields[0:count]
+            flags = fields[64]
+            defaults = fields[65:65 + count]
+            rd, wr = self.__new_fd()
+            os.close(wr)
+            self.handles[rd] = offsets
+            if flags & gpio_chip.HANDLE_REQUEST_OUTPUT:
+                for off, val in zip(offsets, defaults):
+                    self.values[off] = val
+            fields[-1] = rd
+            buf[:] = struct.pack(gpio_chip.HANDLE_REQUEST_FORMAT, *fields)
+        elif request == gpio_chip.GET_LINEEVENT_IOCTL:
+            fields = list(struct.unpack(gpio_chip.EVENT_REQUEST_FORMAT,
+                                        bytes(buf)))
+            rd, wr = self.__new_fd()
+            self.handles[rd] = [fields[0]]
+            self.events[fields[0]] = wr
+            fields[-1] = rd
+            buf[:] = struct.pack(gpio_chip.EVENT_REQUEST_FORMAT, *fields)
+        elif request == gpio_chip.GET_LINE_VALUES_IOCTL:
+            for i, off in enumerate(self.handles[fd]):
+                buf[i] = self.values.get(off, 0)
+        elif request == gpio_chip.SET_LINE_VALUES_IOCTL:
+            for i, off in enumerate(self.handles[fd]):
+                self.values[off] = buf[i]
+        else:
+            raise IOError(22, "Invalid argument")
+
+    def fire_edge(self, offset, value, timestamp):
+        """Change an input line and queue an edge event for it."""
+        self.values[offset] = value
+        event_id = gpio_chip.EVENT_FALLING_EDGE
+        if value:
+            event_id = gpio_chip.EVENT_RISING_EDGE
+        data = struct.pack(gpio_chip.EVENT_DATA_FORMAT, timestamp, event_id)
+        os.write(self.events[offset], data)
@@ -0,0 +1,115 @@
+"""A simulated MCP23S17 SPI port expander for PiFace benchmarks."""
+
+
+import contextlib
+import threading
+from raspy.io import pi_face_gpio_digital
+from raspy.io.pi_face_gpio_digital import PiFaceGpioDigital
+
+
+REGISTER_OLAT_A = 0x14
+"""The port A output latch."""
+
+REGISTER_OLAT_B = 0x15
+"""The port B output latch."""
+
+_PORTS = {
+    PiFaceGpioDigital.REGISTER_GPIO_A: (0, PiFaceGpioDigital.REGISTER_IODIR_A,
+                                        REGISTER_OLAT_A),
+    PiFaceGpioDigital.REGISTER_GPIO_B: (1, PiFaceGpioDigital.REGISTER_IODIR_B,
+                                        REGISTER_OLAT_B)
+}
+
+
+class SimulatedSpiDev(object):
+    """Emulates the spidev API backed by an MCP23S17 register file.
+
+    As on the real chip, all pins start as inputs, a write to GPIO lands in
+    the output latch (OLAT), and a read of GPIO returns the latch for output
+    pins and the externally driven level for input pins. Setting an input on
+    port B raises the matching INTF flag when its interrupt is enabled, and
+    reading GPIO or INTCAP clears the flags.
+    """
+
+    def __init__(self):
+        """ctor."""
+        self.registers = [0] * 0x16
+        self.registers[PiFaceGpioDigital.REGISTER_IODIR_A] = 0xFF
+        self.registers[PiFaceGpioDigital.REGISTER_IODIR_B] = 0xFF
+        self.inputs = [0, 0]
+        self.transfers = 0
+        self.max_speed_hz = 0
+        self.__lock = threading.Lock()
+
+    def __level(self, reg):
+        """Get what a GPIO register reads as. Called with the lock held."""
+        port, iodir_reg, olat_reg = _PORTS[reg]
+        iodir = self.registers[iodir_reg]
+        return ((self.registers[olat_reg] & ~iodir) |
+                (self.inputs[port] & iodir)) & 0xFF
+
+    def open(self, dev, bus):
+        """Open the SPI bus connection."""
+        pass
+
+    def writebytes(self, buf):
+        """Write [address, register, data] to the register file."""
+        with self.__lock:
+            self.transfers += 1
+            reg = buf[1]
+            if reg in _PORTS:
+                reg = _PORTS[reg][2]
+
+            self.registers[reg] = buf[2] & 0xFF
+
+    def xfer(self, buf, speed=0):
+        """Read [address, register, 0] from the register file."""
+        with self.__lock:
+            self.transfers += 1
+            reg = buf[1]
+            if reg in _PORTS:
+                val = self.__level(reg)
+            else:
+                val = self.registers[reg]
+
+            if reg in (PiFaceGpioDigital.REGISTER_GPIO_A,
+                       PiFaceGpioDigital.REGISTER_INTCAP_A):
+                self.registers[PiFaceGpioDigital.REGISTER_INTF_A] = 0
+            elif reg in (PiFaceGpioDigital.REGISTER_GPIO_B,
+                         PiFaceGpioDigital.REGISTER_INTCAP_B):
+                self.registers[PiFaceGpioDigital.REGISTER_INTF_B] = 0
+
+            return (buf[0], reg, val)
+
+    def set_input_b(self, mask, high):
+        """Drive port B input bits from outside the chip.
+
+        :param int mask: The port B bits to change.
+        :param bool high: Set True to drive them high.
+        """
+        with self.__lock:
+            reg = PiFaceGpioDigital.REGISTER_GPIO_B
+            old = self.__level(reg)
+            if high:
+                self.inputs[1] |= mask
+            else:
+                self.inputs[1] &= ~mask
+
+            new = self.__level(reg)
+            enabled = self.registers[PiFaceGpioDigital.REGISTER_GPINTEN_B]
+            if (old ^ new) & enabled & mask:
+                self.registers[PiFaceGpioDigital.REGISTER_INTF_B] |= mask
+
+
+@contextlib.contextmanager
+def use_simulated_spi(device):
+    """Make PiFaceGpioDigital instances created in the block use device.
+
+    :param SimulatedSpiDev device: The simulated expander to share.
+    """
+    original = pi_face_gpio_digital.SpiDev
+    pi_face_gpio_digital.SpiDev = lambda: device
+    try:
+        yield device
+    finally:
+        pi_face_gpio_digital.SpiDev = original
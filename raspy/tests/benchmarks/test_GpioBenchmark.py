@@ -0,0 +1,36 @@
+"""Smoke test for raspy.tests.benchmarks.gpio_benchmark."""
+
+
+import json
+from raspy.tests.benchmarks import gpio_benchmark
+
+
+class TestGpioBenchmark(object):
+    """Run the benchmark suite briefly on every backend."""
+
+    def test_percentiles(self):
+        """Test nearest-rank percentiles."""
+        summary = gpio_benchmark.percentiles(list(range(1, 101)))
+        assert summary["p50"] == 50
+        assert summary["p99"] == 99
+        assert summary["max"] == 100
+        assert summary["count"] == 100
+
+    def test_quick_run(self):
+        """Test a quick run produces results for every backend."""
+        report = gpio_benchmark.run_benchmarks(None, gpio_benchmark.QUICK)
+        json.dumps(report)
+        for backend in gpio_benchmark.BACKENDS:
+            result = report["results"][backend.name]
+            assert result["toggles_per_second"] > 0
+            assert result["read_latency_us"]["count"] == 50
+            assert result["pulse"]["count"] == 2
+            assert result["event_latency_us"]["count"] > 0
+            assert result["event_latency_us"]["lost"] == 0
+            if backend.poll:
+                polled = result["polled_event_latency_us"]
+                assert polled["count"] > 0
+                assert polled["lost"] == 0
+
+            if backend.interrupts:
+                assert result["event_latency_us"] is not polled
@@ -0,0 +1,36 @@
+"""Test the precise delay functions in core_utils."""
+
+import threading
+from raspy.pi_system import core_utils
+
+
+def test_sleep_until_ns():
+    """Test sleep_until_ns never returns before the deadline."""
+    core_utils.reset_delay_stats()
+    deadline = core_utils.monotonic_ns()
+    for _ in range(20):
+        deadline += 200000
+        assert core_utils.sleep_until_ns(deadline) >= 0
+        assert core_utils.monotonic_ns() >= deadline
+
+    stats = core_utils.get_delay_stats()
+    assert stats["count"] == 20
+    assert stats["max_ns"] >= stats["mean_ns"] >= 0
+    assert core_utils.get_spin_margin_ns() is not None
+
+
+def test_sleep_microseconds():
+    """Test sleep_microseconds waits at least the requested time."""
+    start = core_utils.monotonic_ns()
+    core_utils.sleep_microseconds(500)
+    assert core_utils.monotonic_ns() - start >= 500000
+
+
+def test_set_realtime_priority():
+    """Test set_realtime_priority reports whether it took effect."""
+    results = []
+    worker = threading.Thread(
+        target=lambda: results.append(core_utils.set_realtime_priority(1)))
+    worker.start()
+    worker.join()
+    assert results[0] in (True, False)
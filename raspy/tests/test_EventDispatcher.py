@@ -0,0 +1,67 @@
+"""Test the shared event dispatcher."""
+
+import threading
+import time
+from raspy.event_dispatcher import EventDispatcher
+
+
+def test_source_order():
+    """Test calls from one source run in order, one at a time."""
+    dispatcher = EventDispatcher(4)
+    seen = {"a": [], "b": []}
+    running = {"a": 0, "b": 0}
+    overlap = []
+
+    def handler(name, n):
+        running[name] += 1
+        if running[name] > 1:
+            overlap.append(name)
+
+        time.sleep(0.0005)
+        seen[name].append(n)
+        running[name] -= 1
+
+    src_a = object()
+    src_b = object()
+    for n in range(50):
+        dispatcher.submit(src_a, handler, "a", n)
+        dispatcher.submit(src_b, handler, "b", n)
+
+    assert dispatcher.wait_idle(5)
+    assert seen["a"] == list(range(50))
+    assert seen["b"] == list(range(50))
+    assert not overlap
+
+    stats = dispatcher.get_stats()
+    assert stats["submitted"] == 100
+    assert stats["dispatched"] == 100
+    assert stats["queue_depth"] == 0
+    assert stats["max_queue_depth"] >= 1
+    assert 1 <= stats["workers"] <= 4
+    assert stats["max_handler_ns"] >= stats["mean_handler_ns"] > 0
+    dispatcher.dispose()
+
+
+def test_errors_and_pool_bound():
+    """Test failing handlers are counted and the pool stays bounded."""
+    dispatcher = EventDispatcher(2)
+    release = threading.Event()
+
+    def block():
+        release.wait(5)
+
+    def fail():
+        raise ValueError("boom")
+
+    for _ in range(10):
+        dispatcher.submit(object(), block)
+
+    dispatcher.submit(object(), fail)
+    assert dispatcher.get_stats()["workers"] == 2
+    assert dispatcher.queue_depth >= 9
+    assert not dispatcher.wait_idle(0.05)
+
+    release.set()
+    assert dispatcher.wait_idle(5)
+    assert dispatcher.get_stats()["errors"] == 1
+    dispatcher.dispose()
@@ -0,0 +1,33 @@
+"""Test the FrequencyCounterComponent class."""
+
+from raspy.components.counters.frequency_counter_component import FrequencyCounterComponent
+from raspy.io import gpio_pins
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.io.gpio_simulator import SimulatedGpio
+from raspy.pi_system import core_utils
+
+
+def test_measure():
+    """Test frequency, duty cycle and pulse widths from edge timestamps."""
+    pin = SimulatedGpio(gpio_pins.Gpio17(), pin_mode.IN, pin_state.LOW)
+    counter = FrequencyCounterComponent(pin, timeout=60000)
+    counter.start()
+    assert counter.is_running
+
+    base = core_utils.monotonic_ns() - 10000000
+    for offset, level in ((0, 1), (250000, 0), (1000000, 1),
+                          (1250000, 0), (2000000, 1)):
+        pin.capture.record(base + offset, level)
+
+    counter.update()
+    assert counter.edge_count == 5
+    assert counter.period_ns == 1000000
+    assert round(counter.frequency) == 1000
+    assert counter.high_ns == 250000
+    assert counter.low_ns == 750000
+    assert counter.duty_cycle == 0.25
+
+    counter.stop()
+    assert pin.capture is None
+    counter.dispose()
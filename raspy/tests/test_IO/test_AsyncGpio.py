@@ -0,0 +1,39 @@
+"""Tests for raspy.io.async_gpio."""
+
+
+from tornado import gen
+from tornado.ioloop import IOLoop
+from raspy.io import gpio_pins
+from raspy.io import pin_edge
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.io.async_gpio import AsyncGpio
+from raspy.io.gpio_simulator import SimulatedGpio
+
+
+class TestAsyncGpio(object):
+    """Test the asynchronous pin facade."""
+
+    def test_write_and_wait(self):
+        """Test an awaited write resolves the edge waiter and queue."""
+        pin = SimulatedGpio(gpio_pins.Gpio17(), pin_mode.OUT, pin_state.LOW)
+
+        @gen.coroutine
+        def run():
+            apin = AsyncGpio(pin)
+            queue = apin.events()
+            rising = apin.wait_for_edge(pin_edge.RISING, 1000)
+            falling = apin.wait_for_edge(pin_edge.FALLING, 50)
+            yield apin.write(pin_state.HIGH)
+            evt = yield rising
+            assert evt.new_state == pin_state.HIGH
+            level = yield apin.read()
+            assert level == pin_state.HIGH
+            queued = yield queue.get()
+            assert queued is evt
+            timed_out = yield falling
+            assert timed_out is None
+            apin.dispose()
+
+        IOLoop.current().run_sync(run, timeout=5)
+        pin.dispose()
@@ -0,0 +1,56 @@
+"""Tests for raspy.io.debounce."""
+
+
+import threading
+from raspy.io import gpio_pins
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.io.debounce import DebounceFilter
+from raspy.io.gpio_simulator import SimulatedGpio
+from raspy.io.pin_state_change_event import PinStateChangeEvent
+from raspy.pi_system import core_utils
+
+
+class TestDebounceFilter(object):
+    """Test the debounce filter."""
+
+    def test_glitch(self):
+        """Test a bounce is suppressed and a stable change accepted."""
+        accepted = []
+        done = threading.Event()
+
+        def callback(psce):
+            accepted.append(psce)
+            done.set()
+
+        flt = DebounceFilter(callback, stable_ms=5)
+        assert flt.hold_ns == 5000000
+
+        base = core_utils.monotonic_ns()
+        for offset, old, new in ((0, 0, 1), (100000, 1, 0), (200000, 0, 1)):
+            flt.process(PinStateChangeEvent(old, new, 17, base + offset))
+
+        assert flt.suppressed == 1
+        assert flt.is_pending
+        assert done.wait(1)
+        assert not flt.is_pending
+        assert flt.accepted == 1
+        assert accepted[0].old_state == pin_state.LOW
+        assert accepted[0].new_state == pin_state.HIGH
+        assert accepted[0].timestamp_ns == base + 200000
+
+    def test_gpio(self):
+        """Test a debounced pin only raises the settled change."""
+        pin = SimulatedGpio(gpio_pins.Gpio17(), pin_mode.IN, pin_state.LOW)
+        flt = pin.set_debounce(glitch_us=1000)
+        assert pin.debounce is flt
+        # Deadlines in the future keep the scheduler out of the way.
+        base = core_utils.monotonic_ns() + 1000000000
+        pin.on_pin_state_change(PinStateChangeEvent(0, 1, 17, base))
+        pin.on_pin_state_change(PinStateChangeEvent(1, 0, 17, base + 500000))
+        pin.on_pin_state_change(PinStateChangeEvent(0, 1, 17, base + 600000))
+        pin.on_pin_state_change(PinStateChangeEvent(1, 0, 17, base + 5000000))
+        assert flt.suppressed == 1
+        assert flt.accepted == 1
+        assert pin.set_debounce() is None
+        pin.dispose()
@@ -0,0 +1,57 @@
+"""Tests for raspy.io.edge_capture."""
+
+
+from raspy.io import gpio_pins
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.io.edge_capture import EdgeCapture
+from raspy.io.gpio_simulator import SimulatedGpio
+
+
+class TestEdgeCapture(object):
+    """Test the edge capture ring buffer."""
+
+    def test_wrap(self):
+        """Test views across the wrap point and lost entries."""
+        capture = EdgeCapture(4)
+        for i in range(6):
+            capture.record(100 + i, i % 2)
+
+        view = capture.view(0)
+        assert view.lost == 2
+        assert len(view) == 4
+        assert view.ranges() == [(2, 2), (0, 2)]
+        assert list(view) == [(102, 0), (103, 1), (104, 0), (105, 1)]
+        assert view[-1] == (105, 1)
+        assert view.is_valid
+
+        capture.record(106, 0)
+        assert not view.is_valid
+
+    def test_consume(self):
+        """Test consume() returns each entry once."""
+        capture = EdgeCapture(8)
+        capture.record(1, 1)
+        capture.record(2, 0)
+        assert len(capture.consume()) == 2
+        assert len(capture.consume()) == 0
+        capture.record(3, 1)
+        view = capture.consume()
+        assert list(view) == [(3, 1)]
+        assert view.lost == 0
+
+    def test_pin_capture(self):
+        """Test a pin records the transitions it observes."""
+        pin = SimulatedGpio(gpio_pins.Gpio17(), pin_mode.IN, pin_state.LOW)
+        pin.provision()
+        capture = pin.enable_capture(16)
+        for level in (pin_state.HIGH, pin_state.HIGH, pin_state.LOW):
+            pin.set_input(level)
+            pin.read()
+
+        entries = list(capture.consume())
+        assert [lvl for _, lvl in entries] == [pin_state.HIGH, pin_state.LOW]
+        assert entries[0][0] <= entries[1][0]
+        pin.disable_capture()
+        assert pin.capture is None
+        pin.dispose()
@@ -0,0 +1,137 @@
+"""Tests for raspy.io.gpio_bank.GpioBank."""
+
+
+import os
+import struct
+import tempfile
+from raspy.illegal_argument_exception import IllegalArgumentException
+from raspy.io import gpio_bank
+from raspy.io import gpio_mem
+from raspy.io import gpio_pins
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.io.gpio_bank import GpioBank
+from raspy.io.gpio_chardev import GpioCharDev
+from raspy.io.gpio_chip import GpioChip
+from raspy.io.gpio_mem import GpioMem
+from raspy.io.gpio_mem import GpioMemMap
+from raspy.tests.benchmarks.simulated_chip import FakeGpioChipDevice
+
+
+class RecordingPin(object):
+    """Records the states written to it."""
+
+    def __init__(self):
+        """ctor."""
+        self.writes = []
+
+    def provision(self):
+        """Nothing to provision."""
+        pass
+
+    def write(self, ps):
+        """Record a write."""
+        self.writes.append(ps)
+
+    def read(self):
+        """Read back the last write."""
+        if len(self.writes) == 0:
+            return pin_state.LOW
+
+        return self.writes[-1]
+
+
+class TestGpioBank(object):
+    """Test GpioBank on each backend."""
+
+    def test_pins(self):
+        """Test each selected pin is written individually."""
+        pins = [RecordingPin(), None, RecordingPin(), RecordingPin()]
+        bank = GpioBank(pins)
+        assert bank.backend == gpio_bank.BACKEND_PINS
+        assert bank.mask == 0x0D
+        bank.provision()
+
+        bank.write(0x05)
+        assert bank.write_count == 3
+        assert bank.value == 0x05
+
+        bank.write(0x0C)
+        assert bank.write_count == 6
+        assert pins[0].writes == [pin_state.HIGH, pin_state.LOW]
+        assert pins[2].writes == [pin_state.HIGH, pin_state.HIGH]
+        assert pins[3].writes == [pin_state.LOW, pin_state.HIGH]
+
+        # Bits outside the mask are left alone.
+        bank.write(0x00, 0x08)
+        assert bank.value == 0x04
+        assert bank.read() == 0x04
+
+        raised = False
+        try:
+            bank.write(0x02, 0x02)
+        except IllegalArgumentException:
+            raised = True
+
+        assert raised
+        bank.dispose()
+
+    def test_pins_driven_directly(self):
+        """Test a bank write resets a pin that was driven on its own."""
+        pins = [RecordingPin(), RecordingPin()]
+        bank = GpioBank(pins)
+        bank.provision()
+        bank.write(0x00)
+        pins[1].write(pin_state.HIGH)
+        bank.write(0x00)
+        assert pins[1].read() == pin_state.LOW
+        bank.dispose()
+
+    def test_mem(self):
+        """Test a bank of register-mapped pins is one set and clear store."""
+        fd, path = tempfile.mkstemp()
+        os.write(fd, b"\x00" * gpio_mem.BLOCK_SIZE)
+        os.close(fd)
+        mem_map = GpioMemMap(path)
+        pins = [GpioMem(pn, pin_mode.OUT, pin_state.LOW, mem_map)
+                for pn in (gpio_pins.Gpio04(), gpio_pins.Gpio17(),
+                           gpio_pins.Gpio18())]
+        bank = GpioBank(pins)
+        assert bank.backend == gpio_bank.BACKEND_MEM
+        bank.provision()
+
+        bank.write(0x05)
+        assert bank.write_count == 1
+        gpset = struct.unpack_from("<I", mem_map.buffer, gpio_mem.GPSET0)[0]
+        gpclr = struct.unpack_from("<I", mem_map.buffer, gpio_mem.GPCLR0)[0]
+        assert gpset == (1 << 4) | (1 << 18)
+        assert gpclr == 1 << 17
+
+        mem_map.write_register(gpio_mem.GPLEV0, (1 << 17) | (1 << 5))
+        assert bank.read() == 0x02
+
+        bank.dispose()
+        mem_map.dispose()
+        os.remove(path)
+
+    def test_chardev(self):
+        """Test a bank of character device pins is one ioctl."""
+        dev = FakeGpioChipDevice()
+        chip = GpioChip("/dev/gpiochip0", dev.ioctl, dev.open)
+        pins = [GpioCharDev(pn, pin_mode.OUT, pin_state.LOW, chip)
+                for pn in (gpio_pins.Gpio04(), gpio_pins.Gpio17(),
+                           gpio_pins.Gpio18(), gpio_pins.Gpio22())]
+        bank = GpioBank(pins)
+        assert bank.backend == gpio_bank.BACKEND_CHARDEV
+        bank.provision()
+        assert pins[0].line_handle is pins[3].line_handle
+
+        before = dev.ioctl_count
+        bank.write(0x0A)
+        assert dev.ioctl_count == before + 1
+        assert [dev.values[n] for n in (4, 17, 18, 22)] == [0, 1, 0, 1]
+        assert bank.read() == 0x0A
+
+        bank.dispose()
+        assert pins[0].line_handle is None
+        chip.dispose()
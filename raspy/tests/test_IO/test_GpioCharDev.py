@@ -0,0 +1,137 @@
+"""Tests for raspy.io.gpio_chardev.GpioCharDev against a fake ioctl layer."""
+
+
+from raspy.io import gpio
+from raspy.io import gpio_chip
+from raspy.io import gpio_pins
+from raspy.io import pin_edge
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.io.gpio_chardev import GpioCharDev
+from raspy.io.gpio_chip import GpioChip
+from raspy.pi_system import core_utils
+from raspy.tests.benchmarks.simulated_chip import FakeGpioChipDevice
+
+
+class TestGpioCharDev(object):
+    """Test the character device backend."""
+
+    def setup_method(self, method):
+        """Create a fake chip."""
+        self.dev = FakeGpioChipDevice()
+        self.chip = GpioChip("/dev/gpiochip0", self.dev.ioctl, self.dev.open)
+
+    def teardown_method(self, method):
+        """Close the fake chip."""
+        self.chip.dispose()
+
+    def test_chip_info(self):
+        """Test chip info is read on open."""
+        assert self.chip.name == "gpiochip0"
+        assert self.chip.label == "pinctrl-fake"
+        assert self.chip.lines == 54
+
+    def test_write_read(self):
+        """Test writing and reading a single line."""
+        pin = GpioCharDev(gpio_pins.Gpio18(), pin_mode.OUT, pin_state.HIGH,
+                          self.chip)
+        pin.provision()
+        assert self.dev.values[18] == 1
+
+        pin.write(pin_state.LOW)
+        assert self.dev.values[18] == 0
+        assert pin.read() == pin_state.LOW
+        pin.dispose()
+
+    def test_multi_line_handle(self):
+        """Test that a shared handle writes all lines with one ioctl."""
+        offsets = [4, 17, 18, 22]
+        handle = self.chip.request_lines(offsets,
+                                         gpio_chip.HANDLE_REQUEST_OUTPUT)
+        before = self.dev.ioctl_count
+        handle.set_values([1, 0, 1, 1])
+        assert self.dev.ioctl_count == before + 1
+        assert [self.dev.values[o] for o in offsets] == [1, 0, 1, 1]
+        assert handle.get_values() == [1, 0, 1, 1]
+
+        pin = GpioCharDev(gpio_pins.Gpio17(), pin_mode.OUT, pin_state.LOW,
+                          self.chip)
+        pin.attach_handle(handle)
+        pin.write(pin_state.HIGH)
+        assert [self.dev.values[o] for o in offsets] == [1, 1, 1, 1]
+
+        pin.dispose()
+        assert not handle.is_disposed
+        handle.dispose()
+
+    def test_provision_pins(self):
+        """Test provision_pins() requests a chip's lines with one ioctl."""
+        def make_pins():
+            return [GpioCharDev(pn, pin_mode.OUT, pin_state.HIGH, self.chip)
+                    for pn in (gpio_pins.Gpio04(), gpio_pins.Gpio17(),
+                               gpio_pins.Gpio18(), gpio_pins.Gpio22())]
+
+        single = make_pins()
+        before = self.dev.ioctl_count
+        for pin in single:
+            pin.provision()
+
+        assert self.dev.ioctl_count == before + 4
+        for pin in single:
+            pin.dispose()
+
+        pins = make_pins()
+        inp = GpioCharDev(gpio_pins.Gpio23(), pin_mode.IN, pin_state.LOW,
+                          self.chip)
+        before = self.dev.ioctl_count
+        gpio.provision_pins(pins + [inp])
+        assert self.dev.ioctl_count == before + 2
+        assert pins[0].line_handle is pins[3].line_handle
+        assert inp.line_handle is not pins[0].line_handle
+        assert [self.dev.values[o] for o in (4, 17, 18, 22)] == [1, 1, 1, 1]
+
+        pins[1].write(pin_state.LOW)
+        assert self.dev.values[17] == 0
+        assert self.dev.values[4] == 1
+
+        # The shared handle is released with the last pin using it.
+        handle = pins[0].line_handle
+        for pin in pins[:3]:
+            pin.dispose()
+
+        assert not handle.is_disposed
+        pins[3].dispose()
+        assert handle.is_disposed
+        inp.dispose()
+
+    def test_edge_events(self):
+        """Test kernel-timestamped edge events."""
+        pin = GpioCharDev(gpio_pins.Gpio23(), pin_mode.IN, pin_state.LOW,
+                          self.chip)
+        pin.provision()
+        pin.edge = pin_edge.BOTH
+        assert pin.wait_for_edge(10) is None
+
+        self.dev.fire_edge(23, 1, 123456789)
+        evt = pin.wait_for_edge(1000)
+        assert evt is not None
+        assert evt.is_rising
+        assert evt.timestamp == 123456789
+        assert pin.read() == pin_state.HIGH
+        pin.dispose()
+
+    def test_edge_timestamps(self):
+        """Test captured edges keep the kernel timestamp."""
+        pin = GpioCharDev(gpio_pins.Gpio23(), pin_mode.IN, pin_state.LOW,
+                          self.chip)
+        pin.provision()
+        pin.edge = pin_edge.BOTH
+        capture = pin.enable_capture()
+        stamp = core_utils.monotonic_ns() - 5000000
+        self.dev.fire_edge(23, 1, stamp)
+        self.dev.fire_edge(23, 0, stamp + 250000)
+        assert pin.wait_for_edge(1000) is not None
+        assert pin.wait_for_edge(1000) is not None
+        assert list(capture.consume()) == [(stamp, pin_state.HIGH),
+                                           (stamp + 250000, pin_state.LOW)]
+        pin.dispose()
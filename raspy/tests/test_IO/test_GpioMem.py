@@ -0,0 +1,75 @@
+"""Tests for raspy.io.gpio_mem.GpioMem against a file-backed register map."""
+
+
+import os
+import struct
+import tempfile
+from raspy.io import gpio_mem
+from raspy.io import gpio_pins
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.io.gpio_mem import GpioMem
+from raspy.io.gpio_mem import GpioMemMap
+
+
+class TestGpioMem(object):
+    """Test GpioMem against a temporary file standing in for /dev/gpiomem."""
+
+    def setup_method(self, method):
+        """Create the stand-in register file."""
+        fd, self.__path = tempfile.mkstemp()
+        os.write(fd, b"\x00" * gpio_mem.BLOCK_SIZE)
+        os.close(fd)
+        self.__map = GpioMemMap(self.__path)
+
+    def teardown_method(self, method):
+        """Unmap and remove the stand-in register file."""
+        self.__map.dispose()
+        os.remove(self.__path)
+
+    def __register(self, offset):
+        return struct.unpack_from("<I", self.__map.buffer, offset)[0]
+
+    def test_function_select(self):
+        """Test provisioning sets the GPFSEL bits for the pin."""
+        self.__map.write_register(gpio_mem.GPFSEL0 + 4, 0x3F)
+        pin = GpioMem(gpio_pins.Gpio17(), pin_mode.OUT, pin_state.LOW,
+                      self.__map)
+        pin.provision()
+        assert self.__map.get_function(17) == gpio_mem.FSEL_OUTPUT
+        # Neighbouring pins in the same register must be left alone.
+        assert self.__register(gpio_mem.GPFSEL0 + 4) == 0x3F | (1 << 21)
+
+        pin.dispose()
+        assert self.__map.get_function(17) == gpio_mem.FSEL_INPUT
+
+    def test_write(self):
+        """Test writes store the pin bit to GPSET0/GPCLR0."""
+        pin = GpioMem(gpio_pins.Gpio04(), pin_mode.OUT, pin_state.LOW,
+                      self.__map)
+        pin.provision()
+        assert self.__register(gpio_mem.GPCLR0) == 1 << 4
+
+        pin.write(pin_state.HIGH)
+        assert self.__register(gpio_mem.GPSET0) == 1 << 4
+        pin.dispose()
+
+    def test_read(self):
+        """Test reads sample the pin bit in GPLEV0."""
+        pin = GpioMem(gpio_pins.V2Gpio27(), pin_mode.IN, pin_state.LOW,
+                      self.__map)
+        pin.provision()
+        assert pin.read() == pin_state.LOW
+
+        self.__map.write_register(gpio_mem.GPLEV0, 1 << 27)
+        assert pin.read() == pin_state.HIGH
+        assert self.__map.levels() == 1 << 27
+        pin.dispose()
+
+    def test_write_masked(self):
+        """Test a masked write needs one set and one clear store."""
+        self.__map.write_masked((1 << 4) | (1 << 17) | (1 << 40),
+                                (1 << 4) | (1 << 40))
+        assert self.__register(gpio_mem.GPSET0) == 1 << 4
+        assert self.__register(gpio_mem.GPCLR0) == 1 << 17
+        assert self.__register(gpio_mem.GPSET1) == 1 << 8
@@ -0,0 +1,31 @@
+"""Tests for raspy.io.gpio_pins and raspy.io.pi_face_pins."""
+
+
+from raspy import board_revision
+from raspy.io import gpio_pins
+from raspy.io import pi_face_pins
+
+
+class TestGpioPins(object):
+    """Test the pin catalogues."""
+
+    def test_lookup(self):
+        """Test lookups by number, header and name."""
+        assert gpio_pins.Gpio17() is gpio_pins.Gpio17
+        assert gpio_pins.get_by_name("V2Pin13") is gpio_pins.V2Pin13
+        assert gpio_pins.get_by_name("bogus") is gpio_pins.GpioNone
+        assert gpio_pins.get_by_value(27) is gpio_pins.V2Gpio27
+        assert gpio_pins.get_by_value(27, board_revision.REV1) is gpio_pins.GpioNone
+        assert gpio_pins.get_by_header("P1-13") is gpio_pins.V2Gpio27
+        assert gpio_pins.get_by_header("P1-13", board_revision.REV1) is gpio_pins.Gpio21
+        assert gpio_pins.V2P5Pin04.header == "P5-04"
+        assert gpio_pins.Led in gpio_pins.get_pins(board_revision.REV1)
+        assert len(gpio_pins.get_pins()) == 22
+
+    def test_pi_face_sets(self):
+        """Test PiFace pins are classified by set membership."""
+        assert pi_face_pins.Input03() in pi_face_pins.INPUTS
+        assert pi_face_pins.Input03 not in pi_face_pins.OUTPUTS
+        assert pi_face_pins.Output07 in pi_face_pins.OUTPUTS
+        assert pi_face_pins.get_by_value(1004) is pi_face_pins.Input02
+        assert pi_face_pins.get_by_value(3) is pi_face_pins.NonePin
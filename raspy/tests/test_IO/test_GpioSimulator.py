@@ -0,0 +1,182 @@
+"""Tests for raspy.io.gpio_simulator."""
+
+
+import os
+import threading
+import time
+from raspy.io import gpio
+from raspy.io import gpio_export_registry
+from raspy.io import gpio_pins
+from raspy.io import gpio_standard
+from raspy.io import pin_edge
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.io.gpio_simulator import SimulatedGpio
+from raspy.io.gpio_simulator import SysfsSimulator
+from raspy.io.gpio_standard import GpioStandard
+
+
+class TestGpioSimulator(object):
+    """Test the sysfs simulator and the in-memory pin."""
+
+    def test_sysfs_simulator(self):
+        """Test GpioStandard runs against the simulated tree."""
+        sim = SysfsSimulator()
+        assert gpio_standard.get_io_path() == sim.gpio_path
+        assert GpioStandard.GPIO_PATH == sim.gpio_path
+        pin = GpioStandard(gpio_pins.Gpio04(), pin_mode.OUT, pin_state.HIGH)
+        assert pin.GPIO_PATH == sim.gpio_path
+        pin.provision()
+        assert sim.is_exported(4)
+        assert sim.get_direction(4) == "out"
+        assert sim.get_value(4) == pin_state.HIGH
+
+        pin.write(pin_state.LOW)
+        assert sim.get_value(4) == pin_state.LOW
+
+        inp = GpioStandard(gpio_pins.Gpio17(), pin_mode.IN, pin_state.LOW)
+        inp.provision()
+        sim.set_input(17, pin_state.HIGH)
+        assert inp.read() == pin_state.HIGH
+
+        pin.dispose()
+        inp.dispose()
+        assert not sim.is_exported(4)
+        assert not sim.is_exported(17)
+
+        root = sim.root
+        sim.dispose()
+        assert gpio_standard.get_io_path() == "/sys/class/gpio/"
+        assert GpioStandard.GPIO_PATH == "/sys/class/gpio/"
+        assert not os.path.exists(root)
+
+    def test_interrupts(self):
+        """Test set_input() wakes edge waiters and interrupt mode."""
+        sim = SysfsSimulator()
+        inp = GpioStandard(gpio_pins.Gpio17(), pin_mode.IN, pin_state.LOW)
+        inp.provision()
+        inp.edge = pin_edge.RISING
+        threading.Timer(0.05, sim.set_input, (17, pin_state.HIGH)).start()
+        assert inp.wait_for_edge(1000)
+        threading.Timer(0.05, sim.set_input, (17, pin_state.LOW)).start()
+        assert not inp.wait_for_edge(200)
+        assert inp.read() == pin_state.LOW
+
+        states = []
+        changed = threading.Event()
+
+        def on_change(evt):
+            states.append(evt.new_state)
+            changed.set()
+
+        inp.on(gpio.EVENT_GPIO_STATE_CHANGED, on_change)
+        inp.enable_interrupts(pin_edge.BOTH)
+        for ps in (pin_state.HIGH, pin_state.LOW):
+            changed.clear()
+            sim.set_input(17, ps)
+            assert changed.wait(1.0)
+
+        assert states == [pin_state.HIGH, pin_state.LOW]
+        inp.dispose()
+        sim.dispose()
+
+    def test_simulated_pwm(self):
+        """Test hardware PWM runs against the simulated PWM chip."""
+        sim = SysfsSimulator()
+        pin = GpioStandard(gpio_pins.Gpio18(), pin_mode.PWM, pin_state.LOW)
+        pin.provision()
+        pin.pwm_range = 600
+        pin.pwm = 300
+        target = open(sim.pwm_path + "pwmchip0/pwm0/duty_cycle", 'r')
+        assert target.read() == "500000"
+        target.close()
+
+        pin.dispose()
+        assert not os.path.exists(sim.pwm_path + "pwmchip0/pwm0")
+        sim.dispose()
+
+    def test_waveform(self):
+        """Test an injected waveform drives the in-memory pin."""
+        pin = SimulatedGpio(gpio_pins.Gpio17(), pin_mode.IN, pin_state.LOW)
+        pin.provision()
+        pin.set_waveform([(0, pin_state.HIGH), (100000000, pin_state.LOW),
+                          (200000000, pin_state.LOW)], repeat=True)
+        assert pin.read() == pin_state.HIGH
+        time.sleep(0.12)
+        assert pin.read() == pin_state.LOW
+        time.sleep(0.1)
+        assert pin.read() == pin_state.HIGH
+        assert pin.read_count == 3
+
+        pin.set_input(pin_state.LOW)
+        assert pin.read() == pin_state.LOW
+        pin.dispose()
+
+    def test_lazy_provision(self):
+        """Test lazy pins are exported on first use or in bulk."""
+        sim = SysfsSimulator()
+        pin = GpioStandard(gpio_pins.Gpio04(), pin_mode.OUT, pin_state.LOW)
+        pin.lazy = True
+        pin.provision()
+        assert pin.is_provision_pending
+        assert not sim.is_exported(4)
+
+        pin.write(pin_state.HIGH)
+        assert not pin.is_provision_pending
+        assert sim.get_direction(4) == "out"
+        assert sim.get_value(4) == pin_state.HIGH
+
+        gpio.set_lazy_by_default(True)
+        try:
+            pins = [GpioStandard(gpio_pins.Gpio17(), pin_mode.IN,
+                                 pin_state.LOW),
+                    GpioStandard(gpio_pins.Gpio18(), pin_mode.OUT,
+                                 pin_state.HIGH)]
+        finally:
+            gpio.set_lazy_by_default(False)
+
+        for p in pins:
+            p.provision()
+
+        assert not sim.is_exported(17)
+        gpio.provision_pins(pins)
+        assert sim.get_direction(17) == "in"
+        assert sim.get_value(18) == pin_state.HIGH
+        for p in pins + [pin]:
+            p.dispose()
+
+        sim.dispose()
+
+    def test_warm_restart(self):
+        """Test pins left exported are adopted without a glitch."""
+        sim = SysfsSimulator()
+        snapshot = sim.root + "/pins.json"
+        pin = GpioStandard(gpio_pins.Gpio04(), pin_mode.OUT, pin_state.LOW)
+        pin.provision()
+        pin.write(pin_state.HIGH)
+        inp = GpioStandard(gpio_pins.Gpio17(), pin_mode.IN, pin_state.LOW)
+        inp.provision()
+        assert gpio_standard.save_snapshot(snapshot) == 2
+
+        gpio_export_registry.set_keep_exported(True)
+        try:
+            pin.dispose()
+            inp.dispose()
+        finally:
+            gpio_export_registry.set_keep_exported(False)
+
+        assert sim.get_value(4) == pin_state.HIGH
+
+        # A restarted process starts with an empty registry.
+        gpio_export_registry.clear()
+        sim.set_input(17, pin_state.HIGH)
+        assert gpio_standard.adopt_snapshot(snapshot) == [4, 17]
+        assert gpio_standard.adopt_snapshot(snapshot + ".missing") == []
+
+        pin = GpioStandard(gpio_pins.Gpio04(), pin_mode.OUT, pin_state.LOW)
+        pin.provision()
+        assert sim.get_value(4) == pin_state.HIGH
+        pin.dispose()
+        assert not sim.is_exported(4)
+        gpio_export_registry.clear()
+        sim.dispose()
@@ -0,0 +1,239 @@
+"""Tests for raspy.io.gpio_standard.GpioStandard class."""
+
+
+import os
+import shutil
+import tempfile
+from raspy.invalid_operation_exception import InvalidOperationException
+from raspy.io import gpio_export_registry
+from raspy.io import gpio_pins
+from raspy.io import gpio_standard
+from raspy.io import pin_edge
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.io import pwm_sysfs
+from raspy.io.gpio_standard import GpioStandard
+
+
+class TestGpioStandard(object):
+    """Test GpioStandard against a fake sysfs tree."""
+
+    def setup_method(self, method):
+        """Create a fake sysfs GPIO tree."""
+        self.__origPath = gpio_standard.IO_PATH
+        self.__root = tempfile.mkdtemp() + "/"
+        for num in (4, 17):
+            pin_dir = self.__root + "gpio" + str(num)
+            os.mkdir(pin_dir)
+            for name, content in (("direction", "in"), ("value", "0"),
+                                  ("edge", "none")):
+                target = open(pin_dir + "/" + name, 'w')
+                target.write(content)
+                target.close()
+
+        pwm_dir = self.__root + "pwmchip0/pwm0"
+        os.makedirs(pwm_dir)
+        for name in ("period", "duty_cycle", "enable"):
+            target = open(pwm_dir + "/" + name, 'w')
+            target.write("0")
+            target.close()
+
+        self.__origPwmPath = pwm_sysfs.PWM_PATH
+        gpio_standard.IO_PATH = self.__root
+        pwm_sysfs.PWM_PATH = self.__root
+        gpio_export_registry.clear()
+
+    def teardown_method(self, method):
+        """Remove the fake sysfs GPIO tree."""
+        gpio_standard.IO_PATH = self.__origPath
+        pwm_sysfs.PWM_PATH = self.__origPwmPath
+        gpio_export_registry.clear()
+        shutil.rmtree(self.__root)
+
+    def __read_file(self, num, name):
+        target = open(self.__root + "gpio" + str(num) + "/" + name, 'r')
+        val = target.read()
+        target.close()
+        return val
+
+    def __read_value(self, num):
+        return self.__read_file(num, "value")[0:1]
+
+    def test_write_reuses_value_file(self):
+        """Test that writes go through the value file opened on provision."""
+        pin = GpioStandard(gpio_pins.Gpio04(), pin_mode.OUT, pin_state.LOW)
+        pin.provision()
+
+        # Removing the directory entry does not affect the open descriptor.
+        value_path = self.__root + "gpio4/value"
+        os.rename(value_path, value_path + ".old")
+        pin.write(pin_state.HIGH)
+        os.rename(value_path + ".old", value_path)
+        assert self.__read_value(4) == "1"
+
+        pin.write(pin_state.LOW)
+        assert self.__read_value(4) == "0"
+
+    def test_export_registry(self):
+        """Test that the direction is only written when it changes."""
+        pin = GpioStandard(gpio_pins.Gpio04(), pin_mode.OUT, pin_state.LOW)
+        pin.provision()
+        assert self.__read_file(4, "direction") == "out"
+        assert gpio_export_registry.get_direction(4) == "out"
+
+        # Hot-path writes and reads must not touch the direction again.
+        target = open(self.__root + "gpio4/direction", 'w')
+        target.write("untouched")
+        target.close()
+        pin.write(pin_state.HIGH)
+        assert pin.read() == pin_state.HIGH
+        assert self.__read_file(4, "direction") == "untouched"
+
+        # A real mode change does.
+        pin.mode = pin_mode.IN
+        assert self.__read_file(4, "direction") == "in"
+        assert gpio_export_registry.get_direction(4) == "in"
+
+        pin.dispose()
+        assert not gpio_export_registry.is_exported(4)
+
+    def test_read(self):
+        """Test reading the value file."""
+        pin = GpioStandard(gpio_pins.Gpio17(), pin_mode.IN, pin_state.LOW)
+        pin.provision()
+        assert pin.read() == pin_state.LOW
+
+        target = open(self.__root + "gpio17/value", 'w')
+        target.write("1")
+        target.close()
+        assert pin.read() == pin_state.HIGH
+
+    def test_dispose(self):
+        """Test dispose drives the pin low and unexports it."""
+        pin = GpioStandard(gpio_pins.Gpio04(), pin_mode.OUT, pin_state.HIGH)
+        pin.provision()
+        assert self.__read_value(4) == "1"
+
+        pin.dispose()
+        assert pin.is_disposed
+        assert self.__read_value(4) == "0"
+
+        target = open(self.__root + "unexport", 'r')
+        assert target.read() == "4"
+        target.close()
+
+    def test_edge(self):
+        """Test configuring the interrupt edge."""
+        pin = GpioStandard(gpio_pins.Gpio17(), pin_mode.IN, pin_state.LOW)
+        pin.provision()
+        assert pin.edge == pin_edge.NONE
+
+        pin.edge = pin_edge.FALLING
+        assert pin.edge == pin_edge.FALLING
+        assert self.__read_file(17, "edge") == "falling"
+
+    def test_wait_for_edge(self):
+        """Test waiting for an edge times out when nothing happens."""
+        pin = GpioStandard(gpio_pins.Gpio17(), pin_mode.IN, pin_state.LOW)
+        pin.provision()
+
+        raised = False
+        try:
+            pin.wait_for_edge(10)
+        except InvalidOperationException:
+            raised = True
+
+        assert raised
+
+        # Regular files never signal POLLPRI, so this must time out.
+        pin.edge = pin_edge.RISING
+        assert not pin.wait_for_edge(10)
+
+    def test_interrupts(self):
+        """Test enabling and disabling interrupt mode."""
+        pin = GpioStandard(gpio_pins.Gpio17(), pin_mode.IN, pin_state.LOW)
+        pin.provision()
+        pin.enable_interrupts(pin_edge.BOTH)
+        assert pin.interrupts_enabled
+        assert self.__read_file(17, "edge") == "both"
+
+        pin.disable_interrupts()
+        assert not pin.interrupts_enabled
+
+        pin.enable_interrupts()
+        pin.dispose()
+        assert not pin.interrupts_enabled
+
+    def test_pwm(self):
+        """Test PWM is driven through the sysfs PWM channel."""
+        pin = GpioStandard(gpio_pins.Gpio04(), pin_mode.OUT, pin_state.LOW)
+        raised = False
+        try:
+            pin.pwm = 512
+        except InvalidOperationException:
+            raised = True
+
+        assert raised
+
+        pin = GpioStandard(gpio_pins.Gpio18(), pin_mode.PWM, pin_state.LOW)
+        assert pin.pwm_channel == 0
+        pin.provision()
+        pwm_dir = self.__root + "pwmchip0/pwm0/"
+        assert open(pwm_dir + "enable").read() == "1"
+
+        pin.pwm = 512
+        assert open(pwm_dir + "period").read() == "1706667"
+        assert open(pwm_dir + "duty_cycle").read() == "853334"
+
+        # A range of 600 ticks of the 600 kHz clock is a 1 ms period.
+        pin.pwm_range = 600
+        assert pin.pwm == 512
+        assert open(pwm_dir + "period").read() == "1000000"
+        assert open(pwm_dir + "duty_cycle").read() == "853333"
+
+        pin.dispose()
+        assert open(pwm_dir + "enable").read() == "0"
+        assert open(self.__root + "pwmchip0/unexport").read() == "0"
+        assert not os.path.exists(self.__root + "unexport")
+
+    def test_elide_writes(self):
+        """Test redundant writes are skipped only when enabled."""
+        pin = GpioStandard(gpio_pins.Gpio04(), pin_mode.OUT, pin_state.LOW)
+        pin.provision()
+        pin.write(pin_state.HIGH)
+
+        # Clobber the value behind the pin's back to see if sysfs is hit.
+        target = open(self.__root + "gpio4/value", 'w')
+        target.write("0")
+        target.close()
+        pin.write(pin_state.HIGH)
+        assert self.__read_value(4) == "1"
+        assert pin.elided_writes == 0
+
+        pin.elide_writes = True
+        target = open(self.__root + "gpio4/value", 'w')
+        target.write("0")
+        target.close()
+        pin.write(pin_state.HIGH)
+        assert self.__read_value(4) == "0"
+        assert pin.elided_writes == 1
+
+        pin.write(pin_state.LOW)
+        pin.write(pin_state.HIGH)
+        assert self.__read_value(4) == "1"
+        assert pin.elided_writes == 1
+
+    def test_batch(self):
+        """Test writes inside a batch are coalesced into one."""
+        pin = GpioStandard(gpio_pins.Gpio04(), pin_mode.OUT, pin_state.LOW)
+        pin.provision()
+        with pin.batch():
+            pin.write(pin_state.HIGH)
+            pin.write(pin_state.LOW)
+            with pin.batch():
+                pin.write(pin_state.HIGH)
+
+            assert self.__read_value(4) == "0"
+
+        assert self.__read_value(4) == "1"
+        assert pin.elided_writes == 2
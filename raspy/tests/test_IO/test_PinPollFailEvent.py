@@ -2,9 +2,9 @@
 
 
 import threading
-from pyee import EventEmitter
 from raspy.io.pin_poll_fail_event import PinPollFailEvent
 from raspy.io.io_exception import IOException
+from raspy.listener_registry import ListenerRegistry
 
 
 class DummyEmitter(object):
@@ -16,7 +16,7 @@ class DummyEmitter(object):
 
     def __init__(self):
         """ctor."""
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
 
     def on(self, evt, callback):
         """Register event handler."""
@@ -1,10 +1,10 @@
 """Test the PinStateChangeEvent class."""
 
 
-from pyee import EventEmitter
 from raspy.io import gpio_pins
 from raspy.io import pin_state
 from raspy.io.pin_state_change_event import PinStateChangeEvent
+from raspy.listener_registry import ListenerRegistry
 
 
 class DummyEmitter(object):
@@ -14,7 +14,7 @@ class DummyEmitter(object):
 
     def __init__(self):
         """ctor."""
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
 
     def on(self, evt, callback):
         """Register event handler."""
@@ -0,0 +1,72 @@
+"""Tests for raspy.io.pin_stats."""
+
+
+from raspy.io import gpio_pins
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.io import pin_stats
+from raspy.io.gpio_simulator import SimulatedGpio
+from raspy.io.gpio_simulator import SysfsSimulator
+from raspy.io.gpio_standard import GpioStandard
+
+
+class TestPinStats(object):
+    """Test per-pin I/O instrumentation."""
+
+    def test_histogram(self):
+        """Test latencies land in the right buckets."""
+        stats = pin_stats.PinStats("test")
+        stats.record(pin_stats.OP_READ, 1000)
+        stats.record(pin_stats.OP_READ, 1001)
+        stats.record(pin_stats.OP_WRITE, 50000000)
+        stats.record_error()
+        snap = stats.snapshot()
+        assert snap["reads"] == 2
+        assert snap["writes"] == 1
+        assert snap["errors"] == 1
+        assert snap["total_ns"]["read"] == 2001
+        assert snap["histogram"]["read"][0] == 1
+        assert snap["histogram"]["read"][1] == 1
+        assert snap["histogram"]["write"][-1] == 1
+
+    def test_pin_stats(self):
+        """Test a pin records its I/O and feeds the aggregate."""
+        pin = SimulatedGpio(gpio_pins.Gpio04(), pin_mode.OUT, pin_state.LOW)
+        assert not pin.stats_enabled
+        assert pin.stats() is None
+
+        before = pin_stats.get_aggregate()
+        pin.stats_enabled = True
+        pin.provision()
+        pin.write(pin_state.HIGH)
+        pin.read()
+        snap = pin.stats()
+        assert snap["name"] == "Gpio04"
+        assert snap["exports"] == 1
+        assert snap["writes"] == 1
+        assert snap["reads"] == 1
+        assert snap["events"] == 1
+        assert sum(snap["histogram"]["write"]) == 1
+        assert snap in pin_stats.get_all()
+
+        after = pin_stats.get_aggregate()
+        assert after["writes"] == before["writes"] + 1
+        pin.dispose()
+
+    def test_enabled_by_default(self):
+        """Test pins created while enabled by default record sysfs I/O."""
+        sim = SysfsSimulator()
+        pin_stats.set_enabled_by_default(True)
+        try:
+            pin = GpioStandard(gpio_pins.Gpio04(), pin_mode.OUT,
+                               pin_state.LOW)
+        finally:
+            pin_stats.set_enabled_by_default(False)
+
+        pin.provision()
+        pin.write(pin_state.HIGH)
+        snap = pin.stats()
+        assert snap["exports"] == 1
+        assert snap["writes"] == 2
+        pin.dispose()
+        sim.dispose()
@@ -0,0 +1,95 @@
+"""Tests for raspy.io.pwm_mem against file-backed register maps."""
+
+
+import os
+import tempfile
+from raspy.illegal_argument_exception import IllegalArgumentException
+from raspy.io import gpio_mem
+from raspy.io import pwm_channel
+from raspy.io import pwm_clock_divider
+from raspy.io import pwm_mem
+from raspy.io import pwm_mode
+from raspy.io.gpio_mem import GpioMemMap
+from raspy.io.pwm_mem import MemPwm
+
+
+class TestPwmMem(object):
+    """Test MemPwm against temporary files standing in for the registers."""
+
+    def setup_method(self, method):
+        """Create the stand-in register files."""
+        self.__paths = []
+        self.__maps = []
+        for _ in range(3):
+            fd, path = tempfile.mkstemp()
+            os.write(fd, b"\x00" * gpio_mem.BLOCK_SIZE)
+            os.close(fd)
+            self.__paths.append(path)
+            self.__maps.append(GpioMemMap(path))
+
+        self.__pwm, self.__clock, self.__gpio = self.__maps
+
+    def teardown_method(self, method):
+        """Unmap and remove the stand-in register files."""
+        for mem_map in self.__maps:
+            mem_map.dispose()
+
+        for path in self.__paths:
+            os.remove(path)
+
+    def test_compute_timing(self):
+        """Test the divisor and range chosen for common frequencies."""
+        timing = pwm_mem.compute_timing(50, 1000)
+        assert timing.frequency == 50.0
+        assert timing.divisor * timing.range == 384000
+        assert timing.divisor == 1
+        assert timing.period_ns == 20000000
+
+        timing = pwm_mem.compute_timing(440, 100)
+        assert abs(timing.frequency - 440) < 0.01
+        assert timing.range >= 100
+
+        timing = pwm_mem.compute_timing(
+            1000, 2, divisors=pwm_clock_divider.ALL)
+        assert timing.divisor == pwm_clock_divider.DIVISOR1
+        assert timing.range == 19200
+
+        try:
+            pwm_mem.compute_timing(10000000, 1000)
+            assert False
+        except IllegalArgumentException:
+            pass
+
+    def test_configure(self):
+        """Test configure programs the clock, range, data and mode."""
+        pwm = MemPwm(pwm_channel.CHANNEL1, self.__pwm, self.__clock)
+        timing = pwm.configure(50, 0.075, 1000)
+        assert self.__clock.read_register(pwm_mem.CM_PWMDIV) == (
+            pwm_mem.CM_PASSWORD | (timing.divisor << 12))
+        assert self.__clock.read_register(pwm_mem.CM_PWMCTL) == (
+            pwm_mem.CM_PASSWORD | pwm_mem.CM_SRC_OSC | pwm_mem.CM_ENAB)
+        assert self.__pwm.read_register(0x20) == timing.range
+        assert self.__pwm.read_register(0x24) == int(0.075 * timing.range)
+        assert self.__pwm.read_register(pwm_mem.PWM_CTL) == 0x8100
+        assert pwm.mode == pwm_mode.MARKSPACE
+        assert pwm.is_enabled
+
+        pwm.mode = pwm_mode.BALANCED
+        assert self.__pwm.read_register(pwm_mem.PWM_CTL) == 0x0100
+
+        pwm.set_frequency(100, 10)
+        assert abs(pwm.duty_cycle - 0.075) < 0.01
+        pwm.dispose()
+        assert self.__pwm.read_register(pwm_mem.PWM_CTL) == 0
+
+    def test_route_pin(self):
+        """Test routing a GPIO to its PWM alternate function."""
+        assert pwm_mem.route_pin(18, self.__gpio) == pwm_channel.CHANNEL0
+        assert self.__gpio.get_function(18) == gpio_mem.FSEL_ALT5
+        assert pwm_mem.route_pin(13, self.__gpio) == pwm_channel.CHANNEL1
+        assert self.__gpio.get_function(13) == gpio_mem.FSEL_ALT0
+        try:
+            pwm_mem.route_pin(17, self.__gpio)
+            assert False
+        except IllegalArgumentException:
+            pass
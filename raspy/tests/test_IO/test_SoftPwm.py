@@ -0,0 +1,81 @@
+"""Tests for raspy.io.soft_pwm.SoftPwmEngine."""
+
+
+import time
+from raspy.illegal_argument_exception import IllegalArgumentException
+from raspy.io import pin_state
+from raspy.io.soft_pwm import SoftPwmEngine
+
+
+class RecordingPin(object):
+    """Records the states written to it."""
+
+    def __init__(self):
+        """ctor."""
+        self.writes = []
+
+    def write(self, ps):
+        """Record a write."""
+        self.writes.append(ps)
+
+
+class TestSoftPwm(object):
+    """Test the software PWM engine."""
+
+    def test_channel_validation(self):
+        """Test out of range frequency and duty cycle are rejected."""
+        engine = SoftPwmEngine(realtime=False)
+        for freq, duty in ((0, 0.5), (100, 1.5), (100, -0.1)):
+            raised = False
+            try:
+                engine.add_channel(RecordingPin(), freq, duty)
+            except IllegalArgumentException:
+                raised = True
+
+            assert raised
+
+        assert len(engine.channels) == 0
+        engine.dispose()
+
+    def test_multiple_channels(self):
+        """Test one engine thread drives several channels."""
+        engine = SoftPwmEngine(realtime=False)
+        pins = [RecordingPin() for _ in range(8)]
+        channels = [engine.add_channel(p, 200, 0.5) for p in pins]
+        off = RecordingPin()
+        engine.add_channel(off, 200, 0.0)
+        engine.start()
+        assert engine.is_running
+        time.sleep(0.3)
+        engine.stop()
+        assert not engine.is_running
+
+        for pin, channel in zip(pins, channels):
+            assert pin.writes[0] == pin_state.HIGH
+            assert pin.writes[-1] == pin_state.LOW
+            assert len(pin.writes) > 10
+            assert channel.cycles > 5
+            assert 0 < channel.achieved_frequency < 400
+            assert channel.max_jitter_ns >= channel.mean_jitter_ns >= 0
+
+        # A zero duty cycle never drives the pin high.
+        assert off.writes == [pin_state.LOW]
+
+        engine.remove_channel(channels[0])
+        assert len(engine.channels) == 8
+        engine.dispose()
+
+    def test_remove_while_running(self):
+        """Test a channel removed from a running engine is left low."""
+        engine = SoftPwmEngine(realtime=False)
+        pin = RecordingPin()
+        channel = engine.add_channel(pin, 500, 0.5)
+        engine.start()
+        assert not engine.is_realtime
+        time.sleep(0.05)
+        engine.remove_channel(channel)
+        count = len(pin.writes)
+        time.sleep(0.02)
+        assert len(pin.writes) == count
+        assert pin.writes[-1] == pin_state.LOW
+        engine.dispose()
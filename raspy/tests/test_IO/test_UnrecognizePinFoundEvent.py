@@ -1,9 +1,9 @@
 """Tests the UnrecognizedPinFoundEvent class."""
 
 
-from pyee import EventEmitter
 from raspy.io import gpio_pins
 from raspy.io.unrecognized_pin_found_event import UnrecognizedPinFoundEvent
+from raspy.listener_registry import ListenerRegistry
 
 
 class DummyEmitter(object):
@@ -15,7 +15,7 @@ class DummyEmitter(object):
 
     def __init__(self, pin):
         """ctor."""
-        self.__emitter = EventEmitter()
+        self.__emitter = ListenerRegistry()
         self.__scanPin = pin
         if self.__scanPin is None:
             self.__scanPin = gpio_pins.Gpio01
@@ -0,0 +1,57 @@
+"""Tests for raspy.io.waveform."""
+
+
+import pytest
+from raspy.illegal_argument_exception import IllegalArgumentException
+from raspy.io import gpio_pins
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.io import waveform
+from raspy.io.gpio_simulator import SimulatedGpio
+from raspy.pi_system import core_utils
+
+
+class TestWaveform(object):
+    """Test waveform playback."""
+
+    def test_play(self):
+        """Test a repeating waveform plays every segment on time."""
+        pin = SimulatedGpio(gpio_pins.Gpio04(), pin_mode.OUT, pin_state.LOW)
+        pin.provision()
+        start = core_utils.monotonic_ns()
+        handle = waveform.play(pin, [(pin_state.HIGH, 1000),
+                                     (pin_state.LOW, 2000)], 3)
+        assert handle.wait(5)
+        elapsed = core_utils.monotonic_ns() - start
+        assert elapsed >= 9000000
+        assert handle.cycles == 3
+        assert handle.error is None
+        assert not handle.is_cancelled
+        assert pin.write_count == 7
+        assert pin.read() == pin_state.LOW
+        pin.dispose()
+
+    def test_cancel(self):
+        """Test cancelling a waveform that repeats forever."""
+        pin = SimulatedGpio(gpio_pins.Gpio04(), pin_mode.OUT, pin_state.LOW)
+        pin.provision()
+        handle = waveform.play_pulses(pin, [100000, 100000],
+                                      waveform.REPEAT_FOREVER)
+        assert not handle.wait(0.05)
+        handle.cancel()
+        assert handle.wait(1)
+        assert handle.is_done
+        assert handle.is_cancelled
+        assert pin.read() == pin_state.LOW
+        pin.dispose()
+
+    def test_invalid(self):
+        """Test invalid waveforms are rejected."""
+        pin = SimulatedGpio(gpio_pins.Gpio04(), pin_mode.OUT, pin_state.LOW)
+        with pytest.raises(IllegalArgumentException):
+            waveform.play(pin, [(pin_state.HIGH, 0)])
+
+        with pytest.raises(IllegalArgumentException):
+            waveform.play(pin, [(pin_state.HIGH, -1)])
+
+        pin.dispose()
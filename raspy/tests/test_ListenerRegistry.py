@@ -0,0 +1,46 @@
+"""Test the listener registry."""
+
+from raspy.listener_registry import ListenerRegistry
+
+
+def test_on_and_emit():
+    """Test callbacks run in registration order with the emitted args."""
+    registry = ListenerRegistry()
+    calls = []
+    assert not registry.emit("changed", 1)
+    assert registry.listeners("changed") == ()
+
+    def first(value):
+        calls.append(("first", value))
+
+    def second(value):
+        calls.append(("second", value))
+
+    registry.on("changed", first)
+    registry.on("changed", second)
+    assert registry.emit("changed", 7)
+    assert calls == [("first", 7), ("second", 7)]
+    assert registry.listeners("changed") == (first, second)
+    assert not registry.emit("other", 7)
+
+
+def test_remove():
+    """Test removing one callback, one event, and every event."""
+    registry = ListenerRegistry()
+    calls = []
+    registry.on("a", calls.append)
+    registry.on("a", calls.append)
+    registry.on("b", calls.append)
+
+    registry.remove_listener("a", calls.append)
+    registry.emit("a", 1)
+    assert calls == [1]
+
+    registry.remove_all_listeners("a")
+    assert not registry.emit("a", 2)
+    assert registry.emit("b", 3)
+
+    registry.remove_all_listeners()
+    assert not registry.emit("b", 4)
+    assert calls == [1, 3]
+    registry.remove_listener("b", calls.append)
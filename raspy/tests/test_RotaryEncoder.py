@@ -0,0 +1,60 @@
+"""Test the RotaryEncoderComponent class."""
+
+from raspy.components.encoders import encoder_direction
+from raspy.components.encoders.rotary_encoder_component import RotaryEncoderComponent
+from raspy.io import gpio_pins
+from raspy.io import pin_mode
+from raspy.io import pin_state
+from raspy.io.gpio_simulator import SimulatedGpio
+from raspy.pi_system import core_utils
+
+
+def _make_encoder():
+    """Create an encoder on two simulated input pins."""
+    pin_a = SimulatedGpio(gpio_pins.Gpio17(), pin_mode.IN, pin_state.LOW)
+    pin_b = SimulatedGpio(gpio_pins.Gpio18(), pin_mode.IN, pin_state.LOW)
+    return RotaryEncoderComponent(pin_a, pin_b)
+
+
+def _feed(encoder, sequence):
+    """Record (channel, level) transitions into the pin capture buffers."""
+    pins = (encoder.pin_a, encoder.pin_b)
+    now = core_utils.monotonic_ns()
+    for i, (channel, level) in enumerate(sequence):
+        pins[channel].capture.record(now + i * 1000, level)
+
+
+def test_decode():
+    """Test a full clockwise and a half counterclockwise cycle."""
+    encoder = _make_encoder()
+    encoder.start()
+    _feed(encoder, [(0, 1), (1, 1), (0, 0), (1, 0)])
+    encoder.update()
+    assert encoder.position == 4
+    assert encoder.detents == 1
+    assert encoder.direction == encoder_direction.CLOCKWISE
+
+    _feed(encoder, [(1, 1), (0, 1)])
+    encoder.update()
+    assert encoder.position == 2
+    assert encoder.direction == encoder_direction.COUNTERCLOCKWISE
+    assert encoder.invalid_transitions == 0
+    encoder.dispose()
+
+
+def test_invalid():
+    """Test undecodable transitions are counted rather than raising."""
+    encoder = _make_encoder()
+    assert encoder.decode(0x02) == 1
+    assert encoder.decode(0x00) == -1
+    assert encoder.decode(0x03) is None
+    assert encoder.position == 0
+    assert encoder.invalid_transitions == 1
+
+    encoder.reset()
+    encoder.start()
+    _feed(encoder, [(0, 1), (0, 1)])
+    encoder.update()
+    assert encoder.position == 1
+    assert encoder.invalid_transitions == 2
+    encoder.dispose()
@@ -19,7 +19,6 @@ if platform.system() != "Linux":
     time.sleep(3)
 
 install_requires = [
-    'pyee',
     'tornado',
     'psutil',
     'spidev',